@@ -196,6 +196,11 @@ MAX_BUY_PRICE: Final[float] = 0.85
 # Orders below 5 shares are rejected by the exchange
 MIN_ORDER_SHARES: Final[int] = 5
 
+# Polymarket minimum notional for market (FOK) BUY orders, in USDC
+# Smaller market buys are rejected by the exchange, so reject them locally
+# before spending a book fetch and a signing round-trip on them
+MIN_MARKET_BUY_USD: Final[float] = 1.0
+
 # ============================================================================
 # OPERATIONAL PARAMETERS
 # ============================================================================
@@ -208,6 +213,43 @@ LOOP_INTERVAL_SEC: Final[int] = 2
 # Request timeout for API calls (seconds)
 API_TIMEOUT_SEC: Final[int] = 30
 
+# HTTP connection pooling (keep-alive reuse across orders/cancels)
+# Each new connection costs a TCP + TLS handshake (~2-3 RTT) - pooled
+# connections amortize that across the tens of calls per quote cycle
+HTTP_POOL_MAX_CONNECTIONS: Final[int] = 100  # Total pooled connections
+HTTP_POOL_MAX_PER_HOST: Final[int] = 50  # Per host (CLOB, Gamma, Data API)
+HTTP_KEEPALIVE_TIMEOUT_SEC: Final[int] = 75  # Idle keep-alive before close
+
+# Own-positions cache (Data API /positions is slow and polled by several loops)
+# Concurrent callers share one in-flight fetch; FOK orders and redemptions
+# invalidate it immediately, resting limit-order fills age out within the TTL
+POSITIONS_CACHE_TTL_SEC: Final[int] = 5
+
+# Fee-rate prefetch: fee_rate_bps is required to sign an order and stable per
+# token, so strategies warm the client cache for their market universe instead
+# of paying the fee-rate round-trip on the first order's critical path
+FEE_RATE_PREFETCH_CONCURRENCY: Final[int] = 10
+
+# Market metadata cache (question, tokens, outcome count for NegRisk detection)
+# These fields do not change while a market is live, but order placement and
+# categorisation looked them up on every order. Resolution checks must keep
+# calling get_market() directly - 'closed' is not safe to serve from here.
+MARKET_METADATA_CACHE_TTL_SEC: Final[int] = 300
+
+# Order book micro-cache (REST /book)
+# Validation, depth checks and best-price lookups often fetch the same token's
+# book back-to-back within one cycle; reuse it briefly instead of paying one
+# CLOB round-trip each. Dropped for a token as soon as we trade it.
+ORDER_BOOK_CACHE_TTL_SEC: Final[float] = 0.5
+
+# Eager asyncio tasks (Python 3.12+, ignored on older interpreters)
+# A task's first step runs inline at create_task/gather time, so coroutines
+# that return without blocking (cache hits, early rejects) skip a loop round-trip.
+# Off by default: it changes create_task semantics bot-wide (a task can run,
+# and even finish, before create_task returns) and the bot is run and tested
+# on 3.11, where this path never executes.
+ENABLE_EAGER_TASK_FACTORY: Final[bool] = False
+
 # Maximum retries for failed API calls
 MAX_RETRIES: Final[int] = 3
 
@@ -300,9 +342,19 @@ STRUCTURED_LOGGING: Final[bool] = True
 # Health check interval (seconds)
 HEALTH_CHECK_INTERVAL_SEC: Final[int] = 60
 
+# Random ±fraction applied to background polling intervals so restarted or
+# co-located bots don't hit the Polymarket APIs in lockstep
+POLL_JITTER_FRACTION: Final[float] = 0.15
+
 # Maximum consecutive errors before alerting
 MAX_CONSECUTIVE_ERRORS: Final[int] = 5
 
+# Strategy loops back off exponentially on consecutive cycle errors (their
+# own base delay, doubled per failure) up to this cap, so a sustained API
+# outage or 429 storm isn't met with a fixed-rate retry flood. The MM loop
+# caps at MM_POSITION_CHECK_INTERVAL instead - its risk checks share the loop
+LOOP_ERROR_BACKOFF_MAX_SEC: Final[int] = 60
+
 
 # ============================================================================
 # SAFETY LIMITS
@@ -409,6 +461,21 @@ ARB_DATA_STALENESS_THRESHOLD: Final[float] = 1.0  # seconds (Polymarket rec: 0.5
 # Legacy constant for backward compatibility (defaults to MM threshold)
 DATA_STALENESS_THRESHOLD: Final[float] = MM_DATA_STALENESS_THRESHOLD
 
+# Background staleness sweep interval (event-driven stale flags)
+# A sweeper marks stale assets every 500ms so quote paths read a flag instead
+# of comparing timestamps per token. Adds at most 0.5s detection lag; if the
+# sweeper falls behind (>2 intervals) readers fall back to timestamp checks.
+STALE_SWEEP_INTERVAL_SEC: Final[float] = 0.5
+
+# Bounded window of recently dispatched user-channel fills (dedup)
+# The user channel can redeliver an order event (reconnects, replays); each
+# (order_id, size_matched) pair is remembered as a 64-bit hash, oldest evicted
+FILL_DEDUP_WINDOW: Final[int] = 10_000
+
+# Concurrent REST /book fetches when rehydrating the cache after a reconnect
+# Resync takes ~1 RTT per batch instead of one RTT per subscribed asset
+REHYDRATE_MAX_CONCURRENT_BOOKS: Final[int] = 10
+
 # Maximum allowed drawdown before emergency kill switch (PERCENTAGE-BASED)
 # INSTITUTIONAL HFT STANDARD: 5% of peak equity for small accounts
 # Rationale:
@@ -646,6 +713,11 @@ ENABLE_REBATE_TRACKING: Final[bool] = True
 # Rebate log file location
 REBATE_LOG_FILE: Final[str] = "logs/maker_rebates.jsonl"
 
+# Pending rebate log entries buffered for the background writer
+# Order placement only enqueues; entries beyond this are dropped (audit log,
+# not trading state) rather than blocking the order path on file I/O
+REBATE_LOG_QUEUE_SIZE: Final[int] = 1024
+
 # ============================================================================
 # MARKET MAKING STRATEGY PARAMETERS
 # ============================================================================
@@ -1104,6 +1176,14 @@ MM_OBI_THRESHOLD: Final[float] = 0.6
 #   - Resume after 30s when initial momentum wave subsides
 MM_MOMENTUM_PROTECTION_TIME: Final[int] = 30
 
+# Micro-price book depth (levels per side)
+# INSTITUTIONAL STANDARD: 3 levels (top-of-book alone is too noisy)
+# Rationale:
+#   - Multi-level VWMP: Σ(bid_size_i × ask_i + ask_size_i × bid_i) / Σ(bid_size_i + ask_size_i)
+#   - A single 1-share order at the touch no longer swings the fair value
+#   - Deeper levels add little signal on thin Polymarket books
+MM_MICRO_PRICE_DEPTH_LEVELS: Final[int] = 3
+
 # Inventory risk gamma (Avellaneda-Stoikov)
 # INSTITUTIONAL STANDARD: 0.5 (calibrated for $100 principal)
 # Rationale:
@@ -1198,8 +1278,18 @@ MM_ORDER_TTL: Final[int] = 15 if IS_SCALPING_MODE else 25  # Scalping: 15s, Broa
 # Configuration (see utils/rate_limiter.py):
 #   ORDER_PLACEMENT_RATE_LIMITER(rate=10.0, capacity=20.0)
 #
-# Note: This constant kept for backward compatibility only
-MM_MIN_ORDER_SPACING: Final[float] = 2.0  # DEPRECATED: Use TokenBucketRateLimiter
+# Note: No longer a per-request sleep. Now the drain cadence of each market's
+# debounced quote loop - bursts of triggers within this window coalesce into
+# a single quote update (rate limiting itself stays with the token bucket)
+MM_MIN_ORDER_SPACING: Final[float] = 2.0  # Per-market quote-loop cadence
+
+# Concurrent cancels during an emergency cancel-all (LAG CIRCUIT BREAKER)
+# Overlaps cancel RTTs while staying inside the 20-request burst capacity
+MM_MAX_CONCURRENT_CANCELS: Final[int] = 10
+
+# Concurrent order-status lookups per fill sync
+# Fill detection latency becomes ~1 RTT instead of one RTT per resting order
+MM_MAX_CONCURRENT_FILL_QUERIES: Final[int] = 10
 
 
 # Performance Tracking
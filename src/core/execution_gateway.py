@@ -479,46 +479,50 @@ class ExecutionGateway:
             await asyncio.sleep(0.5)  # Back off
             return
         
-        # Submit orders
+        # Submit orders - one signed batch POST for the whole batch
         start_time = time.time()
         submitted_count = 0
         
-        for order in batch:
-            try:
-                # Place order via client
-                order_response = await self.client.place_order(
+        try:
+            responses = await self.client.create_limit_orders_batch([
+                {
+                    "token_id": order.token_id,
+                    "side": order.side,
+                    "size": order.size,
+                    "price": order.price,
+                    "order_type": order.order_type,
+                }
+                for order in batch
+            ])
+        except Exception as e:
+            logger.error(f"[GATEWAY] Batch submission failed: {e}")
+            responses = [{"success": False, "errorMsg": str(e)}] * len(batch)
+        
+        for order, order_response in zip(batch, responses):
+            order_id = order_response.get("orderID") or order_response.get("order_id")
+            if order_id and order_response.get("success", True):
+                order.order_id = order_id
+                order.status = "submitted"
+                
+                # Register for STP
+                self.register_order(
+                    order_id=order_id,
                     token_id=order.token_id,
                     side=order.side,
-                    size=order.size,
                     price=order.price,
-                    order_type=order.order_type
+                    strategy_name=order.strategy_name
                 )
                 
-                if order_response and order_response.get("order_id"):
-                    order_id = order_response["order_id"]
-                    order.order_id = order_id
-                    order.status = "submitted"
-                    
-                    # Register for STP
-                    self.register_order(
-                        order_id=order_id,
-                        token_id=order.token_id,
-                        side=order.side,
-                        price=order.price,
-                        strategy_name=order.strategy_name
-                    )
-                    
-                    submitted_count += 1
-                    self._total_submitted += 1
-                    self._strategy_metrics[order.strategy_name]["submitted"] += 1
-                    
-                else:
-                    order.status = "rejected"
-                    logger.warning(f"[GATEWAY] Order rejected: {order.strategy_name}")
-                    
-            except Exception as e:
+                submitted_count += 1
+                self._total_submitted += 1
+                self._strategy_metrics[order.strategy_name]["submitted"] += 1
+                
+            else:
                 order.status = "rejected"
-                logger.error(f"[GATEWAY] Order submission failed: {e}")
+                logger.warning(
+                    f"[GATEWAY] Order rejected: {order.strategy_name} "
+                    f"({order_response.get('errorMsg', 'no order id')})"
+                )
         
         latency_ms = (time.time() - start_time) * 1000
         
@@ -37,14 +37,41 @@ from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass, field
 from decimal import Decimal
 from collections import defaultdict, deque
+import math
 import time
 import asyncio
 from datetime import datetime, timedelta
 
+from config.constants import MM_GAMMA_BASE, MM_GAMMA_MAX
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Annualization for 1-minute sampling: vol_annual = vol_per_sample * sqrt(samples_per_year)
+_SQRT_MINUTES_PER_YEAR = math.sqrt(365 * 24 * 60)
+
+
+def _annualized_log_return_vol(prices: List[float]) -> Optional[Decimal]:
+    """
+    Annualized population std dev of log returns over a price series
+    
+    Runs on plain floats (math.log / math.fsum) rather than Decimal.ln(),
+    which dominated the cost of a 1000-sample window. Non-positive prices
+    are skipped, matching the previous Decimal implementation.
+    """
+    log_returns = [
+        math.log(p_curr / p_prev)
+        for p_prev, p_curr in zip(prices, prices[1:])
+        if p_prev > 0 and p_curr > 0
+    ]
+    if not log_returns:
+        return None
+    
+    n = len(log_returns)
+    mean_return = math.fsum(log_returns) / n
+    variance = math.fsum((r - mean_return) ** 2 for r in log_returns) / n
+    return Decimal(str(math.sqrt(variance) * _SQRT_MINUTES_PER_YEAR))
+
 
 @dataclass
 class Position:
@@ -236,8 +263,6 @@ class InventoryManager:
         Raises:
             None: Falls back to gamma_base if insufficient data
         """
-        from config.constants import MM_GAMMA_BASE, MM_GAMMA_MAX
-        
         if not self.use_dynamic_gamma:
             return Decimal(str(MM_GAMMA_BASE))
         
@@ -344,39 +369,17 @@ class InventoryManager:
         if not history or len(history) < 10:
             return None
         
-        # Filter to window
+        # Filter to window (converted to float once for the log-return math)
         cutoff_time = time.time() - window_seconds
         recent_prices = [
-            (ts, price) for ts, price in history
+            float(price) for ts, price in history
             if ts >= cutoff_time
         ]
         
         if len(recent_prices) < 10:
             return None
         
-        # Calculate log returns
-        log_returns = []
-        for i in range(1, len(recent_prices)):
-            p_prev = recent_prices[i-1][1]
-            p_curr = recent_prices[i][1]
-            
-            if p_prev > 0 and p_curr > 0:
-                log_return = (p_curr / p_prev).ln()
-                log_returns.append(log_return)
-        
-        if not log_returns:
-            return None
-        
-        # Calculate standard deviation
-        mean_return = sum(log_returns) / len(log_returns)
-        variance = sum((r - mean_return) ** 2 for r in log_returns) / len(log_returns)
-        volatility = variance.sqrt()
-        
-        # Annualize (assuming 1-minute sampling)
-        minutes_per_year = 365 * 24 * 60
-        volatility_annual = volatility * Decimal(str(minutes_per_year)).sqrt()
-        
-        return volatility_annual
+        return _annualized_log_return_vol(recent_prices)
     
     async def record_trade(
         self,
@@ -581,44 +584,7 @@ class InventoryManager:
         Returns:
             Annualized volatility or None if insufficient data
         """
-        history = self._price_history.get(token_id)
-        if not history or len(history) < 10:
-            return None
-        
-        # Filter to lookback window
-        cutoff_time = time.time() - self.volatility_lookback_seconds
-        recent_prices = [
-            (ts, price) for ts, price in history
-            if ts >= cutoff_time
-        ]
-        
-        if len(recent_prices) < 10:
-            return None
-        
-        # Calculate log returns
-        log_returns = []
-        for i in range(1, len(recent_prices)):
-            p_prev = recent_prices[i-1][1]
-            p_curr = recent_prices[i][1]
-            
-            if p_prev > 0 and p_curr > 0:
-                log_return = (p_curr / p_prev).ln()
-                log_returns.append(log_return)
-        
-        if not log_returns:
-            return None
-        
-        # Calculate standard deviation
-        mean_return = sum(log_returns) / len(log_returns)
-        variance = sum((r - mean_return) ** 2 for r in log_returns) / len(log_returns)
-        volatility = variance.sqrt()
-        
-        # Annualize (assuming 1-minute sampling)
-        # vol_annual = vol_per_sample * sqrt(samples_per_year)
-        minutes_per_year = 365 * 24 * 60
-        volatility_annual = volatility * Decimal(str(minutes_per_year)).sqrt()
-        
-        return volatility_annual
+        return self._calculate_volatility_window(token_id, self.volatility_lookback_seconds)
     
     def check_position_limits(
         self,
@@ -12,11 +12,14 @@ This module ensures we ALWAYS trade as a maker, never a taker.
 """
 
 import asyncio
+import json
 import time
+from dataclasses import dataclass
 from typing import Dict, Any, Optional, Set
 from decimal import Decimal
 from concurrent.futures import ProcessPoolExecutor
 
+import aiohttp
 from py_clob_client.clob_types import OrderArgs, OrderType, PartialCreateOrderOptions
 from py_clob_client.order_builder.constants import BUY, SELL
 
@@ -29,6 +32,7 @@ from config.constants import (
     MAX_ORDER_AGE_SEC,
     ORDER_MONITOR_INTERVAL_SEC,
     ENABLE_NEGRISK_AUTO_DETECTION,
+    POLYMARKET_GAMMA_API_URL,
 )
 from utils.logger import get_logger
 from utils.exceptions import (
@@ -44,6 +48,23 @@ logger = get_logger(__name__)
 rebate_logger = get_rebate_logger()
 
 
+@dataclass(slots=True)
+class MakerOrder:
+    """Resting maker order tracked by the stale-order monitor"""
+    token_id: str
+    side: str
+    price: float
+    size: float
+    amount_usd: float
+    created_at: float
+    condition_id: Optional[str]
+    market_name: Optional[str]
+    outcome: Optional[str]
+    fee_rate_bps: int
+    is_negrisk: bool
+    retry_attempt: int = 0
+
+
 class MakerFirstExecutor:
     """
     Institutional-grade order executor with maker-only logic.
@@ -68,7 +89,7 @@ class MakerFirstExecutor:
         self._post_only_cooldowns: Dict[str, float] = {}
         
         # Active orders being monitored (order_id -> order_data)
-        self._active_orders: Dict[str, Dict[str, Any]] = {}
+        self._active_orders: Dict[str, MakerOrder] = {}
         
         # Order monitoring task
         self._monitor_task: Optional[asyncio.Task] = None
@@ -128,7 +149,7 @@ class MakerFirstExecutor:
                 
                 # Check each active order
                 for order_id, order_data in list(self._active_orders.items()):
-                    age = current_time - order_data['created_at']
+                    age = current_time - order_data.created_at
                     
                     if age > MAX_ORDER_AGE_SEC:
                         stale_orders.append((order_id, order_data, age))
@@ -186,16 +207,17 @@ class MakerFirstExecutor:
         
         # Check cache
         cache_key = f"negrisk_{condition_id}"
-        if cache_key in self.client._cache:
-            return self.client._cache[cache_key]
+        is_negrisk = self.client._cache.get(cache_key)
+        if is_negrisk is not None:
+            return is_negrisk
         
         try:
-            # Query market details from Gamma API
-            import json
-            url = f"{self.client._session._base_url.replace('clob.polymarket.com', 'gamma-api.polymarket.com')}/markets"
+            # Query market details from Gamma API over the client's pooled session
+            url = f"{POLYMARKET_GAMMA_API_URL}/markets"
             params = {"condition_id": condition_id}
+            session = self.client.get_http_session()
             
-            async with self.client._session.get(url, params=params, timeout=10) as response:
+            async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=10)) as response:
                 if response.status == 200:
                     data = await response.json()
                     if data and len(data) > 0:
@@ -346,19 +368,19 @@ class MakerFirstExecutor:
             order_id = result.get('orderID', 'unknown')
             
             # Track order for monitoring
-            self._active_orders[order_id] = {
-                'token_id': token_id,
-                'side': 'BUY',
-                'price': target_price,
-                'size': shares,
-                'amount_usd': amount_usd,
-                'created_at': time.time(),
-                'condition_id': condition_id,
-                'market_name': market_name,
-                'outcome': outcome,
-                'fee_rate_bps': fee_rate_bps,
-                'is_negrisk': is_negrisk
-            }
+            self._active_orders[order_id] = MakerOrder(
+                token_id=token_id,
+                side='BUY',
+                price=target_price,
+                size=shares,
+                amount_usd=amount_usd,
+                created_at=time.time(),
+                condition_id=condition_id,
+                market_name=market_name,
+                outcome=outcome,
+                fee_rate_bps=fee_rate_bps,
+                is_negrisk=is_negrisk
+            )
             
             logger.info(
                 f"✓ MAKER_BUY order placed: {order_id[:8]}... "
@@ -427,20 +449,20 @@ class MakerFirstExecutor:
                     
                     # Track adjusted order
                     order_id = retry_result.get('orderID', 'unknown')
-                    self._active_orders[order_id] = {
-                        'token_id': token_id,
-                        'side': 'BUY',
-                        'price': adjusted_price,
-                        'size': shares,
-                        'amount_usd': amount_usd,
-                        'created_at': time.time(),
-                        'condition_id': condition_id,
-                        'market_name': market_name,
-                        'outcome': outcome,
-                        'fee_rate_bps': fee_rate_bps,
-                        'is_negrisk': is_negrisk,
-                        'retry_attempt': 1
-                    }
+                    self._active_orders[order_id] = MakerOrder(
+                        token_id=token_id,
+                        side='BUY',
+                        price=adjusted_price,
+                        size=shares,
+                        amount_usd=amount_usd,
+                        created_at=time.time(),
+                        condition_id=condition_id,
+                        market_name=market_name,
+                        outcome=outcome,
+                        fee_rate_bps=fee_rate_bps,
+                        is_negrisk=is_negrisk,
+                        retry_attempt=1
+                    )
                     
                     return retry_result
                     
@@ -34,15 +34,23 @@ manager.register_fill_handler('market_making', mm_strategy.handle_fill)
 
 from typing import Dict, Any, Optional, List, Callable, Set, Tuple
 import asyncio
+import sys
 import time
 import json
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
+from decimal import Decimal
 from threading import Lock
 import websockets
 from websockets.exceptions import ConnectionClosed, WebSocketException
 
-from config.constants import DATA_STALENESS_THRESHOLD
+from config.constants import (
+    DATA_STALENESS_THRESHOLD,
+    STALE_SWEEP_INTERVAL_SEC,
+    FILL_DEDUP_WINDOW,
+    REHYDRATE_MAX_CONCURRENT_BOOKS,
+)
 from utils.logger import get_logger
 from utils.exceptions import NetworkError
 
@@ -54,7 +62,9 @@ logger = get_logger(__name__)
 # Data Structures
 # ============================================================================
 
-@dataclass
+# Snapshots and fills are allocated per WebSocket message; slots drop the
+# per-instance __dict__ and make field reads fixed-offset
+@dataclass(slots=True)
 class MarketSnapshot:
     """Real-time market data snapshot with OBI (Order Book Imbalance)"""
     asset_id: str
@@ -128,7 +138,7 @@ class MarketSnapshot:
         return (time.time() - self.last_ws_activity) > inactive_threshold
 
 
-@dataclass
+@dataclass(slots=True)
 class FillEvent:
     """Order fill event from /user channel"""
     order_id: str
@@ -181,6 +191,7 @@ class MarketStateCache:
         self._lock = Lock()
         self._stale_threshold = stale_threshold_seconds if stale_threshold_seconds is not None else DATA_STALENESS_THRESHOLD
         self._stale_markets: Set[str] = set()
+        self._last_stale_sweep = 0.0  # Flags in _stale_markets are trusted only while sweeps are recent
         
         # Market metadata cache
         self._market_info: Dict[str, Dict[str, Any]] = {}
@@ -221,8 +232,9 @@ class MarketStateCache:
                 existing = self._cache[asset_id]
                 if snapshot.last_update <= existing.last_update:
                     logger.debug(
-                        f"[TIMESTAMP_INTEGRITY] Rejected stale update for {asset_id[:8]}... "
-                        f"(incoming: {snapshot.last_update:.3f}, cached: {existing.last_update:.3f})"
+                        "[TIMESTAMP_INTEGRITY] Rejected stale update for %.8s... "
+                        "(incoming: %.3f, cached: %.3f)",
+                        asset_id, snapshot.last_update, existing.last_update
                     )
                     return False
             
@@ -239,6 +251,43 @@ class MarketStateCache:
         with self._lock:
             return self._cache.get(asset_id)
     
+    def get_many(self, asset_ids: List[str]) -> Tuple[Dict[str, MarketSnapshot], Set[str]]:
+        """
+        Batch snapshot read (one lock acquisition, one clock read for all assets)
+        
+        Args:
+            asset_ids: Asset identifiers to read
+            
+        Returns:
+            (snapshots, stale) - cached snapshots by asset_id, and the subset of
+            asset_ids that are missing or older than the stale threshold
+        """
+        now = time.time()
+        threshold = self._stale_threshold
+        snapshots: Dict[str, MarketSnapshot] = {}
+        stale: Set[str] = set()
+        with self._lock:
+            cache = self._cache
+            # Event-driven flags (set by sweep, cleared by update) while the
+            # sweeper is alive; otherwise compare timestamps directly
+            stale_flags = (
+                self._stale_markets
+                if now - self._last_stale_sweep <= 2 * STALE_SWEEP_INTERVAL_SEC
+                else None
+            )
+            for asset_id in asset_ids:
+                snapshot = cache.get(asset_id)
+                if snapshot is None:
+                    stale.add(asset_id)
+                    continue
+                snapshots[asset_id] = snapshot
+                if stale_flags is not None:
+                    if asset_id in stale_flags:
+                        stale.add(asset_id)
+                elif now - snapshot.last_update > threshold:
+                    stale.add(asset_id)
+        return snapshots, stale
+    
     def get_latest_price(self, asset_id: str) -> Optional[float]:
         """Get latest micro-price (synchronous)"""
         snapshot = self.get(asset_id)
@@ -257,6 +306,31 @@ class MarketStateCache:
             'timestamp': snapshot.last_update,
         }
     
+    def get_best_price(self, asset_id: str, side: str) -> Optional[float]:
+        """
+        Top of book in the shape of PolymarketClient.get_best_price
+        
+        price_change events keep best_bid/best_ask current on a snapshot that
+        already holds a book, so dirty depth alone is fine. A dirty snapshot
+        with no book at all was created from a single price_change and may
+        carry placeholder prices for the side it never saw - it is skipped.
+        
+        Args:
+            asset_id: Asset identifier
+            side: 'BUY' (best ask) or 'SELL' (best bid)
+            
+        Returns:
+            Price, or None if the asset is missing, stale, book-less or one-sided
+        """
+        snapshot = self.get(asset_id)
+        if snapshot is None or snapshot.is_stale(self._stale_threshold):
+            return None
+        if snapshot.dirty_cache and not (snapshot.bids and snapshot.asks):
+            return None
+        
+        price = snapshot.best_ask if side.upper() == 'BUY' else snapshot.best_bid
+        return price if price > 0 else None
+    
     def is_stale(self, asset_id: str) -> bool:
         """Check if asset data is stale (>threshold old)"""
         snapshot = self.get(asset_id)
@@ -280,12 +354,19 @@ class MarketStateCache:
     
     def get_stale_markets(self) -> Set[str]:
         """Get all currently stale markets (LAG CIRCUIT BREAKER)"""
+        return self.sweep_stale()
+    
+    def sweep_stale(self) -> Set[str]:
+        """Flag every asset older than the threshold as stale (one clock read)"""
+        now = time.time()
+        threshold = self._stale_threshold
         with self._lock:
             stale = set()
             for asset_id, snapshot in self._cache.items():
-                if snapshot.is_stale(self._stale_threshold):
+                if now - snapshot.last_update > threshold:
                     stale.add(asset_id)
                     self._stale_markets.add(asset_id)
+            self._last_stale_sweep = now
             return stale
     
     def clear_asset(self, asset_id: str) -> None:
@@ -438,6 +519,10 @@ class PolymarketWSManager:
         # Fill event handlers (strategy callbacks)
         self._fill_handlers: Dict[str, Callable] = {}  # strategy_name -> handler
         
+        # Dispatched fill keys: int hashes with FIFO eviction (bounded memory)
+        self._processed_fill_ids: Set[int] = set()
+        self._processed_fill_order: deque = deque()
+        
         # Background tasks
         self._tasks: List[asyncio.Task] = []
         
@@ -615,7 +700,7 @@ class PolymarketWSManager:
                 
                 # Handle unexpected message formats (lists, None, etc.)
                 if not isinstance(data, dict):
-                    logger.debug(f"Skipping non-dict message: {type(data)}")
+                    logger.debug("Skipping non-dict message: %s", type(data))
                     continue
                 
                 # Route message to appropriate queue
@@ -646,7 +731,7 @@ class PolymarketWSManager:
                         logger.warning("Order event queue full - dropping message")
                 
                 else:
-                    logger.debug(f"Unknown message type: {msg_type}")
+                    logger.debug("Unknown message type: %s", msg_type)
                     
             except ConnectionClosed:
                 logger.warning("WebSocket connection closed")
@@ -682,6 +767,11 @@ class PolymarketWSManager:
                     logger.warning(f"[WS] Message missing 'market' field: {data}")
                     continue
                 
+                # Every message carries a freshly decoded copy of the id;
+                # interning keeps one shared object for cache keys and
+                # snapshots so identity short-circuits later comparisons
+                asset_id = sys.intern(asset_id)
+                
                 event_type = data.get('event_type')
                 
                 # Handle different event types
@@ -699,6 +789,8 @@ class PolymarketWSManager:
                     
                     # Extract price_change fields per Polymarket support guidance
                     asset_id_field = data.get('asset_id') or data.get('market')
+                    if asset_id_field:
+                        asset_id_field = sys.intern(asset_id_field)
                     best_bid_new = data.get('best_bid')
                     best_ask_new = data.get('best_ask')
                     price = data.get('price')
@@ -734,9 +826,8 @@ class PolymarketWSManager:
                             self.cache.update(asset_id_field, existing, force=True)
                             
                             logger.debug(
-                                f"[WS] price_change: {asset_id_field[:8]}... "
-                                f"bid={existing.best_bid:.4f} ask={existing.best_ask:.4f} "
-                                f"(dirty_cache=True)"
+                                "[WS] price_change: %.8s... bid=%.4f ask=%.4f (dirty_cache=True)",
+                                asset_id_field, existing.best_bid, existing.best_ask
                             )
                         else:
                             # No cache yet - create minimal snapshot with best_bid/ask
@@ -794,8 +885,8 @@ class PolymarketWSManager:
                     
                     # Log book event arrival (helpful for debugging inactive markets)
                     logger.debug(
-                        f"[WS] book event: {asset_id[:8]}... "
-                        f"(hash: {book_hash[:8] if book_hash else 'none'}...)"
+                        "[WS] book event: %.8s... (hash: %.8s...)",
+                        asset_id, book_hash or 'none'
                     )
                 
                 # ═══════════════════════════════════════════════════════════════════
@@ -839,8 +930,6 @@ class PolymarketWSManager:
                 # Formula: OBI = (Weighted_Bid_Vol - Weighted_Ask_Vol) / Total_Weighted_Vol
                 # ═══════════════════════════════════════════════════════════════════
                 
-                from decimal import Decimal
-                
                 weighted_bid_vol = Decimal('0')
                 weighted_ask_vol = Decimal('0')
                 
@@ -898,8 +987,8 @@ class PolymarketWSManager:
                 # Duplicate detection: If hash matches last_hash, skip update
                 if existing and book_hash and existing.last_hash == book_hash:
                     logger.debug(
-                        f"[WS] Duplicate book message for {asset_id[:8]}... "
-                        f"(hash: {book_hash[:8]}...) - skipping"
+                        "[WS] Duplicate book message for %.8s... (hash: %.8s...) - skipping",
+                        asset_id, book_hash
                     )
                     continue
                 
@@ -958,6 +1047,18 @@ class PolymarketWSManager:
             except Exception as e:
                 logger.error(f"Market update handler error ({name}): {e}", exc_info=True)
     
+    def _mark_fill(self, order_id: str, size_matched: float) -> bool:
+        """Record a fill key; return False if it was already dispatched"""
+        key = hash((order_id, size_matched))
+        if key in self._processed_fill_ids:
+            return False
+        
+        if len(self._processed_fill_order) >= FILL_DEDUP_WINDOW:
+            self._processed_fill_ids.discard(self._processed_fill_order.popleft())
+        self._processed_fill_order.append(key)
+        self._processed_fill_ids.add(key)
+        return True
+    
     async def _fill_processor(self) -> None:
         """Process order events and dispatch to strategies"""
         while self._is_running:
@@ -972,6 +1073,14 @@ class PolymarketWSManager:
                 # Only process filled orders (size_matched > 0)
                 size_matched = float(data.get('size_matched', 0))
                 if event_type == 'order' and size_matched > 0:
+                    # size_matched is cumulative - a repeated pair is a redelivery
+                    if not self._mark_fill(data.get('id', ''), size_matched):
+                        logger.debug(
+                            "[FILL] Duplicate order event %.8s... (size_matched: %s) - skipping",
+                            data.get('id', ''), size_matched
+                        )
+                        continue
+                    
                     # Parse fill event from order event
                     fill = FillEvent(
                         order_id=data.get('id', ''),  # Support uses 'id' not 'order_id'
@@ -1005,9 +1114,8 @@ class PolymarketWSManager:
                 else:
                     # Log non-fill order events at debug level
                     logger.debug(
-                        f"Order event: {order_type}, "
-                        f"asset: {data.get('asset_id', '')[:8]}..., "
-                        f"size_matched: {size_matched}"
+                        "Order event: %s, asset: %.8s..., size_matched: %s",
+                        order_type, data.get('asset_id', ''), size_matched
                     )
                 
             except asyncio.CancelledError:
@@ -1170,12 +1278,24 @@ class PolymarketWSManager:
                 logger.debug("[REHYDRATE] No assets to sync")
                 return
             
-            # Fetch fresh order books from REST API
+            # Fetch fresh order books from REST API concurrently (bounded so a
+            # large subscription set doesn't burst past the /book rate limit)
+            semaphore = asyncio.Semaphore(REHYDRATE_MAX_CONCURRENT_BOOKS)
+            
+            async def fetch_book(asset_id: str):
+                async with semaphore:
+                    return await self.client.get_order_book(asset_id)
+            
+            books = await asyncio.gather(
+                *(fetch_book(asset_id) for asset_id in assets),
+                return_exceptions=True
+            )
+            
             rehydrated_count = 0
-            for asset_id in assets:
+            for asset_id, book_data in zip(assets, books):
                 try:
-                    # Fetch from REST (this should call client.get_order_book)
-                    book_data = await self.client.get_order_book(asset_id)
+                    if isinstance(book_data, BaseException):
+                        raise book_data
                     
                     if not book_data or 'bids' not in book_data or 'asks' not in book_data:
                         continue
@@ -1267,6 +1387,7 @@ class MarketDataManager:
         self.cache = GlobalMarketCache(stale_threshold_seconds=stale_threshold if stale_threshold is not None else DATA_STALENESS_THRESHOLD)
         self.ws_manager = PolymarketWSManager(client, self.cache, ws_url=ws_url)
         self._heartbeat_task: Optional[asyncio.Task] = None
+        self._stale_sweeper_task: Optional[asyncio.Task] = None
         self._inactive_threshold = 60.0  # 60s without WebSocket activity triggers REST refresh
         
         logger.info("MarketDataManager created")
@@ -1278,20 +1399,41 @@ class MarketDataManager:
         # Start inactive market heartbeat task
         self._heartbeat_task = asyncio.create_task(self._inactive_market_heartbeat())
         
+        # Start staleness sweeper (maintains event-driven stale flags)
+        self._stale_sweeper_task = asyncio.create_task(self._staleness_sweeper())
+        
         logger.info("✅ MarketDataManager initialized (with inactive market heartbeat)")
     
     async def shutdown(self) -> None:
         """Graceful shutdown"""
-        # Cancel heartbeat task
-        if self._heartbeat_task:
-            self._heartbeat_task.cancel()
-            try:
-                await self._heartbeat_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel background tasks
+        for task in (self._heartbeat_task, self._stale_sweeper_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         
         await self.ws_manager.shutdown()
     
+    async def _staleness_sweeper(self) -> None:
+        """
+        Sweep the cache every STALE_SWEEP_INTERVAL_SEC and flag stale assets
+        
+        Cache updates clear the flag, so quote paths read staleness from the
+        flag set instead of comparing timestamps per token per cycle.
+        """
+        while True:
+            try:
+                self.cache.sweep_stale()
+                await asyncio.sleep(STALE_SWEEP_INTERVAL_SEC)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"[STALE SWEEP] Error sweeping cache: {e}")
+                await asyncio.sleep(STALE_SWEEP_INTERVAL_SEC)
+    
     async def _inactive_market_heartbeat(self) -> None:
         """
         INSTITUTIONAL STALE HEARTBEAT: Proactive REST refresh for inactive markets
@@ -1358,7 +1500,7 @@ class MarketDataManager:
         for market_id in market_ids:
             # Get market info from client
             try:
-                market = await self.client.get_market(market_id)
+                market = await self.client.get_market_metadata(market_id)
                 if market:
                     tokens = market.get('tokens', [])
                     for token in tokens:
@@ -1399,6 +1541,14 @@ class MarketDataManager:
         """Check if market data is stale"""
         return self.cache.is_stale(asset_id)
     
+    def get_best_price(self, asset_id: str, side: str) -> Optional[float]:
+        """Get best ask (BUY) or best bid (SELL) from fresh cache data (synchronous)"""
+        return self.cache.get_best_price(asset_id, side)
+    
+    def get_snapshots_batch(self, asset_ids: List[str]) -> Tuple[Dict[str, MarketSnapshot], Set[str]]:
+        """Get snapshots and stale set for several assets in one cache read"""
+        return self.cache.get_many(asset_ids)
+    
     def register_fill_handler(self, strategy_name: str, handler: Callable) -> None:
         """Register strategy to receive fill events"""
         self.ws_manager.register_fill_handler(strategy_name, handler)
@@ -11,6 +11,7 @@ from py_clob_client.clob_types import OrderArgs, OrderType
 from config.constants import (
     MAX_SLIPPAGE_PERCENT,
     MAX_POSITION_SIZE_USD,
+    MIN_MARKET_BUY_USD,
     ENTRY_PRICE_GUARD,
     MM_GLOBAL_DAILY_LOSS_LIMIT,  # Circuit breaker protection
 )
@@ -18,9 +19,12 @@ from core.polymarket_client import PolymarketClient
 from utils.logger import get_logger, log_trade_event
 from utils.exceptions import (
     OrderRejectionError,
+    ValidationError,
     SlippageExceededError,
     PriceGuardError,
     InsufficientBalanceError,
+    OrderExecutionError,
+    PostOnlyOrderRejectedError,
     TradingError,
 )
 from utils.helpers import (
@@ -38,12 +42,14 @@ class OrderManager:
     Manages order execution with safety checks and risk management
     """
 
-    def __init__(self, client: PolymarketClient):
+    def __init__(self, client: PolymarketClient, market_data_manager: Optional[Any] = None):
         """
         Initialize order manager with safety mechanisms.
         
         Args:
             client: Initialized PolymarketClient instance
+            market_data_manager: WebSocket book cache for top-of-book reads (optional,
+                                 REST is used when absent or when the cache misses)
         
         Features:
             - Circuit breaker for consecutive failures
@@ -55,11 +61,16 @@ class OrderManager:
             raise ValueError("PolymarketClient cannot be None")
         
         self.client = client
+        self.market_data_manager = market_data_manager
         self.total_daily_volume = Decimal('0')
         self._consecutive_failures = 0
         self._max_consecutive_failures = 5
         self._circuit_breaker_active = False
         
+        # Local cache of limit orders placed through this manager (order_id -> result)
+        # Lets strategies check an order's resting price without a get_order RPC
+        self._open_orders: Dict[str, Dict[str, Any]] = {}
+        
         # PRODUCTION SAFETY: Daily loss tracking (strategy-agnostic)
         self._mm_daily_realized_pnl = Decimal('0')  # Market making strategy P&L
         self._daily_loss_limit = Decimal(str(MM_GLOBAL_DAILY_LOSS_LIMIT))
@@ -153,6 +164,39 @@ class OrderManager:
 
         logger.debug(f"Order validation passed: {side} {size} USDC @ {price}")
 
+    def _check_market_order_preconditions(self, token_id: str, side: str, size: float) -> None:
+        """
+        Price-independent market order checks, run before any network call
+        
+        Orders that can never be accepted are rejected without paying for a
+        best-price lookup. validate_order still runs the full checks once
+        the price is known.
+        
+        Raises:
+            ValidationError: If side/size are invalid or the circuit breaker is open
+                             (same checks and type as validate_order)
+            OrderRejectionError: If a market BUY is below the exchange minimum
+        """
+        if not isinstance(side, str) or side.upper() not in ('BUY', 'SELL'):
+            raise ValidationError(f"Invalid side '{side}'. Must be 'BUY' or 'SELL'")
+        
+        if not isinstance(size, (int, float)) or size <= 0:
+            raise ValidationError(f"Invalid size {size}. Must be positive number")
+        
+        if self._circuit_breaker_active:
+            raise ValidationError(
+                f"Circuit breaker active due to {self._consecutive_failures} consecutive failures. "
+                f"Manual intervention required."
+            )
+        
+        # Market BUYs always spend `size` USDC (see create_market_buy_order)
+        if side.upper() == 'BUY' and size < MIN_MARKET_BUY_USD:
+            order_data = {'token_id': token_id, 'side': side, 'size': size}
+            raise OrderRejectionError(
+                f"Market BUY of ${size:.2f} below exchange minimum ${MIN_MARKET_BUY_USD:.2f}",
+                order_data=order_data
+            )
+
     async def execute_market_order(
         self,
         token_id: str,
@@ -178,14 +222,24 @@ class OrderManager:
             Order execution result
             
         Raises:
+            ValidationError: If the order fails local validation
+            OrderRejectionError: If a market BUY is below the exchange minimum
             OrderExecutionError: If execution fails
             SlippageExceededError: If slippage exceeds limit
         """
         max_slippage = max_slippage or MAX_SLIPPAGE_PERCENT
         
+        # Fail fast on orders the exchange would reject anyway, before the
+        # best-price round-trip below
+        self._check_market_order_preconditions(token_id, side, size)
+        
         try:
-            # Get current best price
-            expected_price = await self.client.get_best_price(token_id, side)
+            # Get current best price - WebSocket cache first, REST on a miss
+            expected_price = None
+            if self.market_data_manager is not None:
+                expected_price = self.market_data_manager.get_best_price(token_id, side)
+            if expected_price is None:
+                expected_price = await self.client.get_best_price(token_id, side)
             if not expected_price:
                 raise OrderExecutionError(
                     f"No liquidity available for {token_id}"
@@ -292,7 +346,8 @@ class OrderManager:
         side: str,
         size: float,
         price: float,
-        target_price: Optional[float] = None
+        target_price: Optional[float] = None,
+        post_only: bool = False
     ) -> Dict[str, Any]:
         """
         Execute a limit order
@@ -303,11 +358,14 @@ class OrderManager:
             size: Order size in USDC
             price: Limit price
             target_price: Reference price for guard check
+            post_only: Post as maker-only - the exchange rejects the order
+                       instead of letting it cross the spread
             
         Returns:
             Order placement result
             
         Raises:
+            PostOnlyOrderRejectedError: If the exchange rejects a post-only order
             OrderExecutionError: If execution fails
         """
         try:
@@ -335,7 +393,8 @@ class OrderManager:
                 token_id=token_id,
                 side=side,
                 price=price,
-                size=order_size
+                size=order_size,
+                post_only=post_only
             )
             
             order_result = {
@@ -353,8 +412,15 @@ class OrderManager:
                 f"Limit order placed: {order_result.get('order_id')}"
             )
 
+            # Only orders the exchange acknowledged with an ID can be looked
+            # up or cancelled later - never cache under the 'unknown' default
+            if order_response.get('orderID'):
+                self._open_orders[order_result['order_id']] = order_result
             return order_result
 
+        except PostOnlyOrderRejectedError:
+            # Typed rejection - caller backs off a tick and retries
+            raise
         except (ValidationError, InsufficientBalanceError, PriceGuardError) as e:
             # Re-raise validation errors
             raise
@@ -380,6 +446,7 @@ class OrderManager:
             
             # Cancel order using client method
             await self.client.cancel_order(order_id)
+            self._open_orders.pop(order_id, None)
             
             logger.info(f"Order cancelled: {order_id}")
             return True
@@ -388,6 +455,46 @@ class OrderManager:
             logger.error(f"Failed to cancel order {order_id}: {e}")
             return False
 
+    def get_open_order_sync(self, order_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a locally tracked open order (no network call)
+        
+        Args:
+            order_id: Order ID to look up
+            
+        Returns:
+            Cached order result, or None if not tracked
+        """
+        return self._open_orders.get(order_id)
+
+    def discard_open_order(self, order_id: str) -> None:
+        """
+        Stop tracking an order (cancelled or filled outside this manager)
+        
+        Args:
+            order_id: Order ID to forget
+        """
+        self._open_orders.pop(order_id, None)
+
+    async def get_order(self, order_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get live order details from the API
+        
+        Always queries the exchange - the local cache only records orders as
+        placed, so it can never report a fill. Use get_open_order_sync when
+        resting price/side is all that is needed.
+        
+        Args:
+            order_id: Order ID to query
+            
+        Returns:
+            Order details
+        """
+        order = await self.client.get_order(order_id)
+        if order and order.get('status') in ('filled', 'cancelled', 'canceled'):
+            self._open_orders.pop(order_id, None)  # No longer resting
+        return order
+
     async def get_optimal_position_size(
         self,
         target_size: float,
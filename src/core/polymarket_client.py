@@ -3,16 +3,26 @@ Polymarket CLOB Client
 Handles all interactions with Polymarket's Central Limit Order Book API
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Awaitable, Callable, Set
 from decimal import Decimal
 
 import asyncio
 import aiohttp
+import inspect
 import json
+import logging
+import re
+import sys
+import time
+from datetime import datetime
+from itertools import islice
+import requests
+from requests.adapters import HTTPAdapter
 from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import OrderArgs, OrderType, MarketOrderArgs
+from py_clob_client.clob_types import OrderArgs, OrderType, MarketOrderArgs, PostOrdersArgs
 from py_clob_client.order_builder.constants import BUY, SELL
 from py_clob_client.exceptions import PolyApiException
+from py_clob_client.http_helpers import helpers as clob_http_helpers
 from eth_account import Account
 from web3 import Web3
 
@@ -23,6 +33,13 @@ from config.constants import (
     POLYGON_CHAIN_ID,
     API_TIMEOUT_SEC,
     MAX_RETRIES,
+    HTTP_POOL_MAX_CONNECTIONS,
+    HTTP_POOL_MAX_PER_HOST,
+    HTTP_KEEPALIVE_TIMEOUT_SEC,
+    POSITIONS_CACHE_TTL_SEC,
+    FEE_RATE_PREFETCH_CONCURRENCY,
+    MARKET_METADATA_CACHE_TTL_SEC,
+    ORDER_BOOK_CACHE_TTL_SEC,
     PROXY_WALLET_ADDRESS,
     POLYMARKET_DATA_API_URL,
     POLYMARKET_GAMMA_API_URL,
@@ -35,7 +52,10 @@ from utils.logger import get_logger
 from utils.exceptions import (
     APIError,
     AuthenticationError,
+    OrderExecutionError,
     OrderRejectionError,
+    FOKOrderNotFilledError,
+    PostOnlyOrderRejectedError,
     InsufficientBalanceError,
     NetworkError
 )
@@ -44,6 +64,60 @@ from utils.helpers import async_retry_with_backoff
 
 logger = get_logger(__name__)
 
+# Newer py_clob_client releases accept post_only on post_order; older ones
+# can only post plain GTC orders
+_POST_ORDER_SUPPORTS_POST_ONLY = 'post_only' in inspect.signature(ClobClient.post_order).parameters
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# POOLED CLOB TRANSPORT
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# py_clob_client sends every order/cancel via module-level requests.request(),
+# which opens a fresh TCP + TLS connection per call. Route it through one
+# shared keep-alive Session instead (urllib3 pool is thread-safe, so the
+# asyncio.to_thread workers can share it).
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+_clob_http_session: Optional[requests.Session] = None
+
+
+def _pooled_clob_request(endpoint: str, method: str, headers=None, data=None):
+    """Drop-in for py_clob_client's request() using the pooled session"""
+    try:
+        headers = clob_http_helpers.overloadHeaders(method, headers)
+        resp = _clob_http_session.request(
+            method=method, url=endpoint, headers=headers, json=data if data else None
+        )
+        if resp.status_code != 200:
+            raise PolyApiException(resp)
+
+        try:
+            return resp.json()
+        except requests.JSONDecodeError:
+            return resp.text
+
+    except requests.RequestException:
+        raise PolyApiException(error_msg="Request exception!")
+
+
+def _install_pooled_clob_transport() -> None:
+    """Install the pooled session into py_clob_client (idempotent)"""
+    global _clob_http_session
+    if _clob_http_session is not None:
+        return
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_MAX_PER_HOST,
+        pool_maxsize=HTTP_POOL_MAX_PER_HOST
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    _clob_http_session = session
+
+    # get/post/delete resolve request() from the helpers module at call time
+    clob_http_helpers.request = _pooled_clob_request
+    logger.info(f"✅ CLOB HTTP keep-alive pool installed (max {HTTP_POOL_MAX_PER_HOST} per host)")
+
 
 class PolymarketClient:
     """
@@ -61,10 +135,21 @@ class PolymarketClient:
         self._token_id_cache: Dict[tuple, str] = {}
         # General purpose cache for market status and fee rates
         self._cache: Dict[str, Any] = {}
+        # Markets never reopen once closed: membership short-circuits the
+        # Gamma status query for good (persisted across restarts by the bot)
+        self._closed_markets: Set[str] = set()
         # Cache with TTL for temporary data (404 results, active market checks)
-        # Format: {key: (value, expiry_timestamp)}
+        # Format: {key: (value, expiry)} - expiry on the time.monotonic() clock
         self._cache_with_ttl: Dict[str, tuple] = {}
+        # Own-positions cache: one in-flight Data API fetch at a time; the
+        # generation bump on invalidation discards fetches that straddle a trade
+        self._positions_fetch_lock = asyncio.Lock()
+        self._positions_generation = 0
+        # Single-flight map for idempotent reads: concurrent callers for the
+        # same key attach to one in-flight request instead of duplicating it
+        self._inflight: Dict[str, asyncio.Future] = {}
         self._session: Optional[aiohttp.ClientSession] = None
+        self._post_only_warned = False
         
         logger.info("Polymarket client created (lazy initialization)")
 
@@ -162,6 +247,7 @@ class PolymarketClient:
             #   ✅ Can place BUY/SELL orders
             #   ✅ Can cancel orders and manage positions
             # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+            _install_pooled_clob_transport()
             self._client = ClobClient(
                 host=CLOB_API_URL,
                 chain_id=POLYGON_CHAIN_ID,
@@ -173,21 +259,7 @@ class PolymarketClient:
             logger.info("✅ CLOB client initialized with L2 authentication")
             
             # Initialize aiohttp session for REST API calls with connection pooling
-            # Connection pooling improves performance for repeated API calls
-            connector = aiohttp.TCPConnector(
-                limit=100,  # Max connections
-                limit_per_host=30,  # Max per host
-                ttl_dns_cache=300,  # DNS cache TTL
-                enable_cleanup_closed=True  # Clean up closed connections
-            )
-            self._session = aiohttp.ClientSession(
-                connector=connector,
-                timeout=aiohttp.ClientTimeout(total=API_TIMEOUT_SEC),
-                headers={
-                    "User-Agent": "Polymarket-Bot/2.0",
-                    "Accept": "application/json"
-                }
-            )
+            self.get_http_session()
             
             self._is_initialized = True
             logger.info(
@@ -216,7 +288,7 @@ class PolymarketClient:
         """
         try:
             geoblock_url = f"{CLOB_API_URL}/geoblock"
-            async with self._session.get(geoblock_url) as response:
+            async with self.get_http_session().get(geoblock_url) as response:
                 if response.status == 200:
                     data = await response.json()
                     is_blocked = data.get("restricted", False)
@@ -252,6 +324,34 @@ class PolymarketClient:
         self._is_initialized = False
         logger.info(f"Polymarket client closed - Cache size: {len(self._token_id_cache)}")
     
+    def get_http_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared pooled aiohttp session, creating it on first use
+        
+        Every REST call goes through this one session so keep-alive
+        connections (and their TCP/TLS handshakes) are reused across the
+        calls a strategy cycle gathers, instead of paying setup per request.
+        Strategies making their own Gamma/Data API calls use it too; callers
+        must not close it (close() does that on shutdown).
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_POOL_MAX_CONNECTIONS,  # Max connections
+                limit_per_host=HTTP_POOL_MAX_PER_HOST,  # Max per host
+                keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT_SEC,  # Reuse idle connections
+                ttl_dns_cache=300,  # DNS cache TTL
+                enable_cleanup_closed=True  # Clean up closed connections
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=API_TIMEOUT_SEC),
+                headers={
+                    "User-Agent": "Polymarket-Bot/2.0",
+                    "Accept": "application/json"
+                }
+            )
+        return self._session
+
     def _ensure_initialized(self) -> None:
         """Ensure client is initialized before operations"""
         if not self._is_initialized:
@@ -309,9 +409,12 @@ class PolymarketClient:
         
         try:
             logger.debug(f"Fetching market: {condition_id}")
-            market = await asyncio.to_thread(
-                self._client.get_market,
-                condition_id=condition_id
+            market = await self._single_flight(
+                f"market_{condition_id}",
+                lambda: asyncio.to_thread(
+                    self._client.get_market,
+                    condition_id=condition_id
+                )
             )
             return market
             
@@ -319,6 +422,30 @@ class PolymarketClient:
             logger.error(f"Failed to fetch market {condition_id}: {e}")
             raise APIError(f"Failed to fetch market: {e}")
 
+    async def get_market_metadata(self, condition_id: str) -> Dict[str, Any]:
+        """
+        Get market details for static fields only (TTL-cached)
+        
+        Use for question, tokens and outcome count. Status fields such as
+        'closed' may be up to MARKET_METADATA_CACHE_TTL_SEC old - call
+        get_market() when resolution state matters.
+        
+        Args:
+            condition_id: Market condition ID
+            
+        Returns:
+            Market data dictionary
+        """
+        cache_key = f"market_meta_{condition_id}"
+        market = self._check_cache_with_ttl(cache_key)
+        if market is None:
+            market = await self.get_market(condition_id)
+            if market:
+                self._set_cache_with_ttl(
+                    cache_key, market, ttl_seconds=MARKET_METADATA_CACHE_TTL_SEC
+                )
+        return market
+
     @async_retry_with_backoff(max_retries=MAX_RETRIES)
     async def get_events(
         self,
@@ -393,23 +520,24 @@ class PolymarketClient:
             
             logger.debug(f"Fetching events from Gamma API: {params}")
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=API_TIMEOUT_SEC)) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    
-                    events_count = len(data) if isinstance(data, list) else len(data.get('data', []))
-                    logger.debug(f"Retrieved {events_count} events from Gamma API")
-                    
-                    # Normalize response format (Gamma API returns array directly)
-                    if isinstance(data, list):
-                        return {
-                            'data': data,
-                            'count': len(data),
-                            'limit': limit,
-                            'offset': offset
-                        }
-                    return data
+            # Shared pooled session: scan pages reuse keep-alive connections
+            session = self.get_http_session()
+            async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=API_TIMEOUT_SEC)) as response:
+                response.raise_for_status()
+                data = await response.json()
+                
+                events_count = len(data) if isinstance(data, list) else len(data.get('data', []))
+                logger.debug(f"Retrieved {events_count} events from Gamma API")
+                
+                # Normalize response format (Gamma API returns array directly)
+                if isinstance(data, list):
+                    return {
+                        'data': data,
+                        'count': len(data),
+                        'limit': limit,
+                        'offset': offset
+                    }
+                return data
                     
         except aiohttp.ClientResponseError as e:
             logger.error(f"Gamma API error fetching events: HTTP {e.status}")
@@ -465,7 +593,7 @@ class PolymarketClient:
             
             logger.debug(f"Bulk validating {len(token_ids)} tokens via /books endpoint")
             
-            async with self._session.post(
+            async with self.get_http_session().post(
                 url,
                 json=payload,
                 timeout=30
@@ -483,34 +611,33 @@ class PolymarketClient:
                 
                 # Per Q4: Response contains orderbook summaries with 'asset_id' field
                 # Only valid/active tokens return data - missing tokens = closed/invalid
-                valid_tokens = set()
-                
                 if isinstance(data, list):
-                    for item in data:
-                        # Per Q4: Use asset_id field from orderbook response
-                        token_id = item.get('asset_id')
-                        if token_id:
-                            valid_tokens.add(token_id)
+                    items = data
                 elif isinstance(data, dict) and 'data' in data:
                     # Alternative response format
-                    for item in data['data']:
-                        token_id = item.get('asset_id')
-                        if token_id:
-                            valid_tokens.add(token_id)
+                    items = data['data']
+                else:
+                    items = []
+                
+                # Per Q4: Use asset_id field from orderbook response
+                valid_tokens = {item.get('asset_id') for item in items}
+                valid_tokens.discard(None)
                 
-                # Build result dictionary
+                # Build result dictionary and tally in the same pass
                 result = {}
+                valid_count = 0
                 for token_id in token_ids:
                     is_valid = token_id in valid_tokens
                     result[token_id] = is_valid
                     
-                    # Cache invalid tokens for 1 hour
-                    if not is_valid:
+                    if is_valid:
+                        valid_count += 1
+                    else:
+                        # Cache invalid tokens for 1 hour
                         cache_key = f"orderbook_404_{token_id}"
                         self._set_cache_with_ttl(cache_key, True, ttl_seconds=3600)
-                        logger.debug(f"Token {token_id[:16]}... invalid, cached 404")
+                        logger.debug("Token %.16s... invalid, cached 404", token_id)
                 
-                valid_count = sum(1 for v in result.values() if v)
                 invalid_count = len(result) - valid_count
                 
                 logger.info(
@@ -555,12 +682,22 @@ class PolymarketClient:
             logger.debug(f"Cached 404 for token {token_id[:16]}... (market likely closed)")
             raise APIError("No orderbook exists for the requested token id (cached)")
         
+        # Same book requested again within the cycle - skip the round-trip
+        cache_key = f"orderbook_{token_id}"
+        order_book = self._check_cache_with_ttl(cache_key)
+        if order_book is not None:
+            return order_book
+        
         try:
-            logger.debug(f"Fetching order book for token: {token_id}")
-            order_book = await asyncio.to_thread(
-                self._client.get_order_book,
-                token_id=token_id
+            logger.debug("Fetching order book for token: %s", token_id)
+            order_book = await self._single_flight(
+                cache_key,
+                lambda: asyncio.to_thread(
+                    self._client.get_order_book,
+                    token_id=token_id
+                )
             )
+            self._set_cache_with_ttl(cache_key, order_book, ttl_seconds=ORDER_BOOK_CACHE_TTL_SEC)
             return order_book
             
         except Exception as e:
@@ -699,7 +836,7 @@ class PolymarketClient:
         
         try:
             # Use existing session (connection pooling) instead of creating new one
-            async with self._session.get(
+            async with self.get_http_session().get(
                 url,
                 params=params,
                 timeout=aiohttp.ClientTimeout(total=API_TIMEOUT_SEC)
@@ -822,6 +959,9 @@ class PolymarketClient:
         - No resolution needed - use "asset" directly in create_market_buy/sell_order
         - For multi-outcome markets, each position shows specific outcome held
         
+        Results are cached for POSITIONS_CACHE_TTL_SEC and concurrent callers
+        share one request; market orders and redemptions invalidate the cache.
+        
         Args:
             address: Proxy wallet address (uses own proxy if not specified)
             
@@ -841,7 +981,44 @@ class PolymarketClient:
         
         # IMPORTANT: Query PROXY wallet address where positions are held
         address = address or PROXY_WALLET_ADDRESS
+        cache_key = f"positions_{address}"
+        
+        cached = self._check_cache_with_ttl(cache_key)
+        if cached is not None:
+            return list(cached)
+        
+        # Coalesce concurrent callers (heartbeat, redeem, exposure checks)
+        # into a single upstream request
+        async with self._positions_fetch_lock:
+            cached = self._check_cache_with_ttl(cache_key)
+            if cached is not None:
+                return list(cached)
+            
+            generation = self._positions_generation
+            positions = await self._fetch_positions(address)
+            if positions is None:
+                return []  # Errors are not cached
+            if generation == self._positions_generation:
+                self._set_cache_with_ttl(cache_key, positions, ttl_seconds=POSITIONS_CACHE_TTL_SEC)
+            return list(positions)
+    
+    def _invalidate_order_book(self, token_id: str) -> None:
+        """Drop a token's micro-cached order book after we trade it"""
+        self._cache_with_ttl.pop(f"orderbook_{token_id}", None)
+    
+    def _invalidate_positions_cache(self) -> None:
+        """Drop cached positions after a trade that changes holdings"""
+        self._positions_generation += 1
+        for key in [k for k in self._cache_with_ttl if k.startswith("positions_")]:
+            del self._cache_with_ttl[key]
+    
+    async def _fetch_positions(self, address: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch positions from the Data API (uncached - see get_positions)
         
+        Returns:
+            Parsed positions, or None on rate limit / HTTP error / timeout
+        """
         url = f"{POLYMARKET_DATA_API_URL}/positions?user={address}"
         
         try:
@@ -849,7 +1026,7 @@ class PolymarketClient:
                 f"Querying positions from Data API - address: {address[:10]}..., url: {url}"
             )
             
-            async with self._session.get(
+            async with self.get_http_session().get(
                 url,
                 timeout=aiohttp.ClientTimeout(total=API_TIMEOUT_SEC)
             ) as response:
@@ -859,7 +1036,7 @@ class PolymarketClient:
                     logger.warning(
                         f"Rate limit exceeded on Data API - status: 429, address: {address[:10]}..."
                     )
-                    return []
+                    return None
                 elif response.status == 404:
                     # User not found - normal case for new addresses
                     logger.debug(
@@ -872,13 +1049,13 @@ class PolymarketClient:
                         f"Data API query failed - status: {response.status}, "
                         f"address: {address[:10]}..., error: {error_text[:200]}"
                     )
-                    return []
+                    return None
                 
                 data = await response.json()
                 
                 if not isinstance(data, list):
                     logger.error(f"Unexpected response format - data: {str(data)[:300]}")
-                    return []
+                    return None
                 
                 positions = []
                 for pos in data:
@@ -897,6 +1074,13 @@ class PolymarketClient:
                         )
                         continue
                     
+                    # Ids recur in every refresh and in downstream position
+                    # keys; interning shares one object per id so repeated
+                    # dict lookups short-circuit on identity
+                    if condition_id:
+                        condition_id = sys.intern(condition_id)
+                    token_id = sys.intern(token_id)
+                    
                     position_data = {
                         "condition_id": condition_id,
                         "question": pos.get("title"),  # Market title/question
@@ -922,10 +1106,10 @@ class PolymarketClient:
                     
         except asyncio.TimeoutError:
             logger.warning(f"Timeout querying Data API for {address}")
-            return []
+            return None
         except Exception as e:
             logger.error(f"Failed to query positions from Data API: {e}")
-            return []
+            return None
 
     async def get_closed_positions(
         self,
@@ -955,7 +1139,7 @@ class PolymarketClient:
         try:
             logger.debug(f"Querying closed positions from Data API for {address}")
             
-            async with self._session.get(
+            async with self.get_http_session().get(
                 url,
                 timeout=aiohttp.ClientTimeout(total=API_TIMEOUT_SEC)
             ) as response:
@@ -989,7 +1173,8 @@ class PolymarketClient:
     @async_retry_with_backoff(max_retries=MAX_RETRIES)
     async def get_simplified_positions(
         self,
-        address: Optional[str] = None
+        address: Optional[str] = None,
+        token_ids: Optional[Set[str]] = None
     ) -> Dict[str, Dict[str, Any]]:
         """
         Get positions with unique key per position.
@@ -1001,6 +1186,9 @@ class PolymarketClient:
         
         Args:
             address: Wallet address (uses own wallet if not specified)
+            token_ids: Only map positions in these tokens (default: all).
+                Filtering happens before each entry is built; the underlying
+                positions fetch stays shared with other get_positions callers.
             
         Returns:
             Dictionary mapping "condition_id_asset" to position data:
@@ -1022,8 +1210,11 @@ class PolymarketClient:
         
         position_map = {}
         for pos in positions:
-            condition_id = pos.get('condition_id')
             asset = pos.get('token_id')  # Asset is the unique token_id
+            if token_ids is not None and asset not in token_ids:
+                continue
+            
+            condition_id = pos.get('condition_id')
             size = pos.get('size', 0)
             
             if condition_id and asset and size > 0:
@@ -1174,7 +1365,7 @@ class PolymarketClient:
             
             logger.debug(f"Querying CLOB price - token: {token_id}, side: {side}")
             
-            async with self._session.get(url, params=params, timeout=10) as response:
+            async with self.get_http_session().get(url, params=params, timeout=10) as response:
                 if response.status == 429:
                     logger.warning("CLOB API rate limit exceeded for /price endpoint (1500/10s)")
                     return None
@@ -1248,7 +1439,7 @@ class PolymarketClient:
             
             logger.debug(f"Querying batch prices for {len(token_ids)} tokens")
             
-            async with self._session.post(
+            async with self.get_http_session().post(
                 url,
                 json={"token_ids": token_ids},
                 timeout=15
@@ -1412,23 +1603,32 @@ class PolymarketClient:
             
             logger.debug(f"Data API request: GET {url} params={params}")
             
-            async with self._session.get(url, params=params, timeout=30) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise APIError(f"Data API returned {response.status}: {error_text}")
-                
-                trades = await response.json()
-                
-                # Data API may return wrapped response
-                if isinstance(trades, dict) and 'data' in trades:
-                    trades = trades['data']
-                
-                logger.debug(f"Retrieved {len(trades)} trades via Data API")
-                return trades
+            trades = await self._single_flight(
+                f"trades_{params.get('user')}_{params.get('market')}",
+                lambda: self._request_trades(url, params)
+            )
+            
+            logger.debug(f"Retrieved {len(trades)} trades via Data API")
+            return trades
                 
         except Exception as e:
             logger.error(f"Failed to fetch trades via Data API: {e}")
             raise APIError(f"Failed to fetch trades via Data API: {e}")
+    
+    async def _request_trades(self, url: str, params: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Single Data API /trades request (see get_trades_raw)"""
+        async with self.get_http_session().get(url, params=params, timeout=30) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise APIError(f"Data API returned {response.status}: {error_text}")
+            
+            trades = await response.json()
+            
+            # Data API may return wrapped response
+            if isinstance(trades, dict) and 'data' in trades:
+                trades = trades['data']
+            
+            return trades
 
     async def get_recent_position_entries(
         self,
@@ -1464,9 +1664,6 @@ class PolymarketClient:
                 ...
             }
         """
-        import time
-        from datetime import datetime, timezone
-        
         try:
             # Calculate cutoff time (current time - window)
             current_time = time.time()
@@ -1558,7 +1755,7 @@ class PolymarketClient:
                     continue
                 
                 # Create position key (same format as get_simplified_positions)
-                position_key = f"{condition_id}_{asset_id}"
+                position_key = sys.intern(f"{condition_id}_{asset_id}")
                 
                 # Accumulate trade data for weighted average calculation
                 if position_key not in trade_totals:
@@ -1575,6 +1772,8 @@ class PolymarketClient:
                 
                 # Track most recent trade metadata for this position
                 if position_key not in recent_positions:
+                    condition_id = sys.intern(condition_id)
+                    asset_id = sys.intern(asset_id)
                     recent_positions[position_key] = {
                         'condition_id': condition_id,
                         'asset_id': asset_id,
@@ -1610,12 +1809,12 @@ class PolymarketClient:
                 f"{time_window_minutes} minutes for address {address[:10]}..."
             )
             
-            # Debug: Show first few recent positions
-            if recent_positions:
-                for i, (key, data) in enumerate(list(recent_positions.items())[:3]):
+            # Debug: Show first few recent positions (without copying the dict)
+            if recent_positions and logger.isEnabledFor(logging.DEBUG):
+                for i, (key, data) in enumerate(islice(recent_positions.items(), 3), 1):
                     logger.debug(
-                        f"  Recent #{i+1}: {data['side'].upper()} ({data['trader_side']}) "
-                        f"{data['minutes_ago']:.1f} min ago - {key[:20]}..."
+                        "  Recent #%d: %s (%s) %.1f min ago - %.20s...",
+                        i, data['side'].upper(), data['trader_side'], data['minutes_ago'], key
                     )
             
             return recent_positions
@@ -1625,6 +1824,42 @@ class PolymarketClient:
             logger.exception(e)  # Full stack trace for debugging
             return {}
 
+    async def _single_flight(
+        self,
+        key: str,
+        request: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Run request() once per key among concurrent callers
+        
+        The first caller starts the request; callers arriving while it is in
+        flight await the same result (or exception). Each waiter is shielded,
+        so one caller being cancelled does not cancel the shared request.
+        
+        Args:
+            key: Identity of the read (endpoint + arguments)
+            request: Zero-arg factory returning the awaitable to run
+            
+        Returns:
+            The request's result
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(request())
+            self._inflight[key] = future
+            
+            def _release(done: asyncio.Future, key: str = key) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+                # Waiters receive the exception through their shields; mark
+                # it retrieved so an all-cancelled flight doesn't warn
+                if not done.cancelled():
+                    done.exception()
+            
+            future.add_done_callback(_release)
+        
+        return await asyncio.shield(future)
+
     def _check_cache_with_ttl(self, key: str) -> Optional[Any]:
         """
         Check cache with TTL (Time To Live)
@@ -1635,21 +1870,21 @@ class PolymarketClient:
         Returns:
             Cached value if not expired, None otherwise
         """
-        if key not in self._cache_with_ttl:
+        entry = self._cache_with_ttl.get(key)
+        if entry is None:
             return None
         
-        value, expiry = self._cache_with_ttl[key]
+        value, expiry = entry
         
-        # Check if expired
-        from datetime import datetime
-        if datetime.now().timestamp() > expiry:
+        # Check if expired (monotonic: immune to wall-clock/NTP jumps)
+        if time.monotonic() > expiry:
             # Expired, remove from cache
             del self._cache_with_ttl[key]
             return None
         
         return value
     
-    def _set_cache_with_ttl(self, key: str, value: Any, ttl_seconds: int = 3600) -> None:
+    def _set_cache_with_ttl(self, key: str, value: Any, ttl_seconds: float = 3600) -> None:
         """
         Set cache value with TTL (Time To Live)
         
@@ -1658,8 +1893,7 @@ class PolymarketClient:
             value: Value to cache
             ttl_seconds: Time to live in seconds (default 1 hour)
         """
-        from datetime import datetime
-        expiry = datetime.now().timestamp() + ttl_seconds
+        expiry = time.monotonic() + ttl_seconds
         self._cache_with_ttl[key] = (value, expiry)
 
     async def is_market_closed(self, condition_id: str) -> bool:
@@ -1680,14 +1914,11 @@ class PolymarketClient:
         Returns:
             True if market is closed/resolved, False if active
         """
+        # Known closed markets first - no key building, no request
+        if condition_id in self._closed_markets:
+            return True
+        
         try:
-            # Check permanent cache first (for known closed markets)
-            cache_key = f"market_closed_{condition_id}"
-            if cache_key in self._cache:
-                cached_result = self._cache[cache_key]
-                logger.debug(f"Cache hit (permanent): Market {condition_id[:16]}... closed={cached_result}")
-                return cached_result
-            
             # Check TTL cache (for recent checks)
             ttl_cache_key = f"market_active_check_{condition_id}"
             cached_active = self._check_cache_with_ttl(ttl_cache_key)
@@ -1710,7 +1941,7 @@ class PolymarketClient:
             # Returns only markets that are BOTH active=true AND closed=false
             # Presence in filtered results = market is live and tradeable
             try:
-                async with self._session.get(url, params=params, timeout=10) as response:
+                async with self.get_http_session().get(url, params=params, timeout=10) as response:
                     if response.status == 200:
                         data = await response.json()
                         
@@ -1721,7 +1952,7 @@ class PolymarketClient:
                         
                         if is_closed:
                             # Permanently cache closed markets (status won't change)
-                            self._cache[cache_key] = True
+                            self._closed_markets.add(condition_id)
                             logger.info(f"Market {condition_id[:16]}... is CLOSED/RESOLVED (cached permanently)")
                         else:
                             # Cache active status with 30-min TTL (balance between accuracy and API limits)
@@ -1748,6 +1979,14 @@ class PolymarketClient:
             logger.warning(f"Error checking market status for {condition_id[:16]}...: {e}, assuming active")
             return False
     
+    def get_known_closed_markets(self) -> List[str]:
+        """Condition IDs known to be closed, for persisting across restarts"""
+        return list(self._closed_markets)
+    
+    def add_known_closed_markets(self, condition_ids: List[str]) -> None:
+        """Seed the closed-market set (e.g. from saved bot state)"""
+        self._closed_markets.update(condition_ids)
+    
     # Note: Batch market checking optimization available via /events endpoint
     # Per Polymarket support: No dedicated batch endpoint exists for condition_ids
     # Alternative: Use /events?active=true&closed=false endpoint which returns events
@@ -2023,6 +2262,7 @@ class PolymarketClient:
             
             if receipt['status'] == 1:
                 logger.info(f"🎊 Redemption successful! Claimed ~${token_balance} USDCe - Tx: {tx_hash.hex()}")
+                self._invalidate_positions_cache()
                 return tx_hash.hex()
             else:
                 logger.error(f"Redemption transaction failed: {tx_hash.hex()}")
@@ -2052,8 +2292,8 @@ class PolymarketClient:
         try:
             # Check cache first (fee rates are stable per market)
             cache_key = f"fee_rate_{token_id}"
-            if cache_key in self._cache:
-                cached_fee = self._cache[cache_key]
+            cached_fee = self._cache.get(cache_key)
+            if cached_fee is not None:
                 logger.debug(f"Using cached fee rate for {token_id[:8]}: {cached_fee} bps")
                 return cached_fee
             
@@ -2084,7 +2324,7 @@ class PolymarketClient:
                 logger.info(f"🌐 Querying: GET {url}?token_id={token_id[:8]}...")
                 
                 # Use existing session instead of creating new one
-                async with self._session.get(url, params=params, timeout=10) as response:
+                async with self.get_http_session().get(url, params=params, timeout=10) as response:
                     response_text = await response.text()
                     logger.info(f"📡 Fee rate API response: status={response.status}, body={response_text[:200]}")
                     
@@ -2126,6 +2366,44 @@ class PolymarketClient:
         """
         return await self._get_market_fee_rate(token_id)
 
+    async def prefetch_fee_rates(self, token_ids: List[str]) -> int:
+        """
+        Warm the fee-rate cache for tokens we expect to trade
+        
+        Fee rates are needed to sign every order and are cached per token
+        for the process lifetime, so fetching them up front takes one REST
+        round-trip off the first order's critical path in each market.
+        Failures are skipped - the order path fetches (and errors) as usual.
+        
+        Args:
+            token_ids: Tokens in the strategy's trading universe
+            
+        Returns:
+            Number of fee rates newly cached
+        """
+        missing = [
+            token_id for token_id in dict.fromkeys(token_ids)
+            if f"fee_rate_{token_id}" not in self._cache
+        ]
+        if not missing:
+            return 0
+        
+        semaphore = asyncio.Semaphore(FEE_RATE_PREFETCH_CONCURRENCY)
+        
+        async def fetch(token_id: str) -> bool:
+            async with semaphore:
+                try:
+                    await self._get_market_fee_rate(token_id)
+                    return True
+                except Exception as e:
+                    logger.debug("Fee rate prefetch failed for %.8s: %s", token_id, e)
+                    return False
+        
+        results = await asyncio.gather(*[fetch(token_id) for token_id in missing])
+        cached = sum(results)
+        logger.info(f"Prefetched fee rates for {cached}/{len(missing)} tokens")
+        return cached
+
     async def get_best_price(
         self,
         token_id: str,
@@ -2208,6 +2486,8 @@ class PolymarketClient:
             )
             
             logger.info(f"✓ BUY order executed: {result.get('orderID', 'unknown')}")
+            self._invalidate_order_book(token_id)
+            self._invalidate_positions_cache()
             return result
             
         except Exception as e:
@@ -2215,7 +2495,6 @@ class PolymarketClient:
             
             # Handle specific Polymarket error codes
             if "FOK_ORDER_NOT_FILLED_ERROR" in error_str or "fully filled" in error_str.lower():
-                from utils.exceptions import FOKOrderNotFilledError
                 logger.warning(f"FOK BUY order not filled - no immediate match for token {token_id[:8]}")
                 raise FOKOrderNotFilledError(
                     f"No immediate buyer found for token {token_id[:8]}",
@@ -2292,6 +2571,8 @@ class PolymarketClient:
             )
             
             logger.info(f"✓ SELL order executed: {result.get('orderID', 'unknown')}")
+            self._invalidate_order_book(token_id)
+            self._invalidate_positions_cache()
             return result
             
         except Exception as e:
@@ -2299,7 +2580,6 @@ class PolymarketClient:
             
             # Handle specific Polymarket error codes per support Q6/Q7
             if "FOK_ORDER_NOT_FILLED_ERROR" in error_str or "fully filled" in error_str.lower():
-                from utils.exceptions import FOKOrderNotFilledError
                 logger.warning(
                     f"FOK SELL order not filled - no immediate buyer for {amount:.2f} shares "
                     f"of token {token_id[:8]}. Will retry on next cycle."
@@ -2322,13 +2602,22 @@ class PolymarketClient:
                 logger.error(f"Market sell order failed: {e}")
                 raise OrderExecutionError(f"Market sell order failed: {e}")
 
-    @async_retry_with_backoff(max_retries=MAX_RETRIES)
+    def _post_signed_order(self, signed_order: Any, post_only: bool) -> Dict[str, Any]:
+        """post_order with the post-only flag when the installed client supports it (blocking)"""
+        if post_only and _POST_ORDER_SUPPORTS_POST_ONLY:
+            return self._client.post_order(signed_order, OrderType.GTC, post_only=True)
+        return self._client.post_order(signed_order)
+
+    # A post-only rejection is final for that price - the caller re-prices
+    # a tick away, so retrying the same order with backoff only adds delay
+    @async_retry_with_backoff(max_retries=MAX_RETRIES, no_retry=(PostOnlyOrderRejectedError,))
     async def create_limit_order(
         self,
         token_id: str,
         side: str,
         price: float,
-        size: float
+        size: float,
+        post_only: bool = False
     ) -> Dict[str, Any]:
         """
         Create a limit order
@@ -2338,12 +2627,26 @@ class PolymarketClient:
             side: 'BUY' or 'SELL'
             price: Limit price
             size: Order size
+            post_only: Ask the exchange to reject the order rather than let
+                       it cross the spread (needs a py_clob_client with
+                       post_only support, otherwise posted as plain GTC)
             
         Returns:
             Order response
+            
+        Raises:
+            PostOnlyOrderRejectedError: If a post-only order would have crossed
+            OrderExecutionError: If the order fails for any other reason
         """
         self._ensure_initialized()
         
+        if post_only and not _POST_ORDER_SUPPORTS_POST_ONLY and not self._post_only_warned:
+            self._post_only_warned = True
+            logger.warning(
+                "Installed py_clob_client has no post_only support - "
+                "post-only quotes are posted as plain GTC orders"
+            )
+        
         try:
             logger.info(f"Creating limit {side} order: {size} @ {price} for {token_id}")
             
@@ -2373,9 +2676,11 @@ class PolymarketClient:
             
             # Post order to exchange
             order_response = await asyncio.to_thread(
-                self._client.post_order,
-                signed_order
+                self._post_signed_order,
+                signed_order,
+                post_only
             )
+            self._invalidate_order_book(token_id)
             
             logger.info(f"Limit order posted: {order_response.get('orderID', 'unknown')}")
             return order_response
@@ -2386,7 +2691,6 @@ class PolymarketClient:
             error_msg = str(e)
             if "invalid fee rate (0)" in error_msg and "market's taker fee:" in error_msg:
                 # Extract correct fee rate from error message
-                import re
                 match = re.search(r"taker fee: (\d+)", error_msg)
                 if match:
                     correct_fee = int(match.group(1))
@@ -2410,9 +2714,11 @@ class PolymarketClient:
                     )
                     
                     order_response = await asyncio.to_thread(
-                        self._client.post_order,
-                        signed_order
+                        self._post_signed_order,
+                        signed_order,
+                        post_only
                     )
+                    self._invalidate_order_book(token_id)
                     
                     # Update cache with correct fee for future orders
                     cache_key = f"fee_rate_{token_id}"
@@ -2422,13 +2728,115 @@ class PolymarketClient:
                     logger.info(f"Limit order posted: {order_response.get('orderID', 'unknown')}")
                     return order_response
             
+            # Translate post-only rejections into a typed error once, here,
+            # so callers dispatch on exception class instead of message text
+            if "INVALID_POST_ONLY_ORDER" in error_msg or "post only" in error_msg.lower() \
+                    or "post-only" in error_msg.lower():
+                raise PostOnlyOrderRejectedError(
+                    f"Post-only {side} rejected for {token_id[:8]} @ {price}: {e}",
+                    token_id=token_id,
+                    target_price=price
+                )
+            
             # If not the specific error above, re-raise
             logger.error(f"Failed to create limit order: {e}")
             raise OrderExecutionError(f"Limit order failed: {e}")
+        except OrderExecutionError:
+            raise
         except Exception as e:
             logger.error(f"Failed to create limit order: {e}")
             raise OrderExecutionError(f"Limit order failed: {e}")
 
+    async def create_limit_orders_batch(
+        self,
+        orders: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Sign and post several limit orders in a single POST /orders call
+        
+        Fee rates are fetched and orders signed concurrently, then the whole
+        batch goes out in one request instead of one signed POST per order.
+        Polymarket accepts at most 15 orders per batch - callers size batches.
+        
+        Args:
+            orders: Dicts with token_id, side, price, size and optional
+                    order_type ("GTC" default, "FOK", "GTD", ...)
+            
+        Returns:
+            One response dict per input order, in input order. Exchange
+            responses carry orderID/success/errorMsg; orders that failed
+            before posting (fee rate, signing) get success=False and errorMsg.
+            
+        Raises:
+            OrderExecutionError: If the batch POST itself fails
+        """
+        self._ensure_initialized()
+        
+        if not orders:
+            return []
+        
+        # Fee rate per distinct token, fetched concurrently (cached per token)
+        token_ids = list({o['token_id'] for o in orders})
+        fee_results = await asyncio.gather(
+            *[self.get_fee_rate_bps(token_id) for token_id in token_ids],
+            return_exceptions=True
+        )
+        fee_rates = dict(zip(token_ids, fee_results))
+        
+        async def sign(order: Dict[str, Any]) -> PostOrdersArgs:
+            fee_rate_bps = fee_rates[order['token_id']]
+            if isinstance(fee_rate_bps, BaseException):
+                raise fee_rate_bps
+            order_type = getattr(OrderType, order.get('order_type', 'GTC').upper(), None)
+            if order_type is None:
+                raise ValueError(f"Unsupported order type: {order.get('order_type')}")
+            signed_order = await asyncio.to_thread(
+                self._client.create_order,
+                OrderArgs(
+                    token_id=order['token_id'],
+                    price=order['price'],
+                    size=order['size'],
+                    side=order['side'].upper(),
+                    fee_rate_bps=fee_rate_bps
+                )
+            )
+            return PostOrdersArgs(order=signed_order, orderType=order_type)
+        
+        signed = await asyncio.gather(*[sign(o) for o in orders], return_exceptions=True)
+        
+        results: List[Dict[str, Any]] = [{} for _ in orders]
+        post_args = []
+        post_indices = []
+        for idx, signed_args in enumerate(signed):
+            if isinstance(signed_args, BaseException):
+                results[idx] = {'success': False, 'errorMsg': str(signed_args)}
+                continue
+            post_args.append(signed_args)
+            post_indices.append(idx)
+        
+        if not post_args:
+            return results
+        
+        try:
+            response = await asyncio.to_thread(self._client.post_orders, post_args)
+        except Exception as e:
+            logger.error(f"Batch order POST failed ({len(post_args)} orders): {e}")
+            raise OrderExecutionError(f"Batch order POST failed: {e}")
+        
+        for token_id in token_ids:
+            self._invalidate_order_book(token_id)
+        
+        if not isinstance(response, list):
+            response = [response] * len(post_indices)
+        for idx, order_response in zip(post_indices, response):
+            results[idx] = order_response or {'success': False, 'errorMsg': 'Empty response'}
+        
+        logger.debug(
+            "Batch posted %d/%d orders (%d failed before POST)",
+            len(post_args), len(orders), len(orders) - len(post_args)
+        )
+        return results
+
     @async_retry_with_backoff(max_retries=MAX_RETRIES)
     async def cancel_order(
         self,
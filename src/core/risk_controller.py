@@ -362,9 +362,17 @@ class RiskController:
         if self._current_equity > self._peak_equity:
             self._peak_equity = self._current_equity
         
-        # Trim old history (keep only drawdown window)
+        # Trim old history (keep only drawdown window). Snapshots are appended
+        # in time order, so expired ones form a prefix: drop it in place
+        # instead of copying every surviving snapshot into a new list.
         cutoff_time = time.time() - self.drawdown_window_sec
-        self._equity_history = [s for s in self._equity_history if s.timestamp > cutoff_time]
+        expired = 0
+        for s in self._equity_history:
+            if s.timestamp > cutoff_time:
+                break
+            expired += 1
+        if expired:
+            del self._equity_history[:expired]
         
         return snapshot
     
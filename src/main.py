@@ -8,7 +8,7 @@ import os
 import sys
 import signal
 import asyncio
-import aiohttp
+import logging
 import time
 import json
 from typing import Optional, List, Dict, Any
@@ -42,7 +42,6 @@ from config.constants import (
     CIRCUIT_BREAKER_LOSS_THRESHOLD_USD,
     HEARTBEAT_INTERVAL_SEC,
     DRAWDOWN_LIMIT_USD,
-    AUTO_REDEEM_INTERVAL_SEC,
     GRACEFUL_SHUTDOWN_TIMEOUT_SEC,
     ENABLE_POST_ONLY_ORDERS,
     ORDER_HEARTBEAT_INTERVAL_SEC,
@@ -77,9 +76,11 @@ from config.constants import (
     CLOB_API_URL,
     ARBITRAGE_STRATEGY_CAPITAL,
     MARKET_MAKING_STRATEGY_CAPITAL,
+    ENABLE_EAGER_TASK_FACTORY,
 )
 from utils.logger import get_logger, setup_logging
 from utils.rebate_logger import get_rebate_logger
+from utils.helpers import jittered
 from utils.exceptions import (
     PolymarketBotError,
     CircuitBreakerError,
@@ -291,7 +292,14 @@ class PolymarketBot:
             
             # [SAFETY] FIX 2: Explicit Nonce Sync on Startup
             # Prevent INVALID_NONCE errors from bot/server desync
-            await self.sync_header_nonce()
+            # The balance needed by Layer 2 is an independent read (Polygon RPC
+            # vs CLOB API), so both round-trips overlap instead of adding up.
+            # sync_header_nonce handles its own errors; a balance failure
+            # still aborts initialization.
+            _, balance = await asyncio.gather(
+                self.sync_header_nonce(),
+                self.client.get_balance()
+            )
             
             logger.info("✅ PolymarketClient initialized")
             
@@ -300,8 +308,8 @@ class PolymarketBot:
             # ========================================================================
             logger.info("\n[LAYER 2] Risk Management System")
             
-            # Fetch current balance from client
-            current_balance = float(await self.client.get_balance())
+            # Current balance (fetched above alongside the nonce sync)
+            current_balance = float(balance)
             self.current_balance = current_balance
             
             # INSTITUTIONAL CAPITAL ALLOCATION: Use dynamic percentage-based allocation
@@ -377,6 +385,8 @@ class PolymarketBot:
                     ws_url="wss://ws-subscriptions-clob.polymarket.com/ws/market"
                 )
                 await self.market_data_manager.initialize()
+                # Market orders read top of book from the WebSocket cache
+                self.order_manager.market_data_manager = self.market_data_manager
                 logger.info("✅ MarketDataManager initialized - WebSocket architecture active")
             except Exception as ws_error:
                 logger.warning(
@@ -559,13 +569,24 @@ class PolymarketBot:
                 tasks,
                 return_when=asyncio.FIRST_COMPLETED
             )
-            # Cancel remaining tasks
+            
+            # Surface why we are tearing down: a loop that crashed would
+            # otherwise have its exception dropped with the task object
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    logger.error(
+                        f"Background task {task.get_coro().__qualname__} crashed: "
+                        f"{task.exception()!r}",
+                        exc_info=task.exception()
+                    )
+            
+            # Cancel remaining tasks together and wait for all of them, so
+            # shutdown takes as long as the slowest task, not the sum of them
+            # (structured-cancellation equivalent of TaskGroup, which is
+            # 3.11+ while we still support 3.10)
             for task in pending:
                 task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+            await asyncio.gather(*pending, return_exceptions=True)
         except Exception as e:
             logger.error(f"Fatal error in bot execution: {e}", exc_info=True)
             raise
@@ -630,7 +651,7 @@ class PolymarketBot:
         
         while self.is_running:
             try:
-                await asyncio.sleep(300)  # 5 minutes
+                await asyncio.sleep(jittered(300))  # ~5 minutes
                 
                 # Re-subscribe to active markets
                 await self._subscribe_to_active_markets()
@@ -792,7 +813,11 @@ class PolymarketBot:
             # Phase 4: Log final statistics
             self._log_final_stats()
             
-            # Phase 5: Log maker rebate statistics
+            # Phase 5: Write out queued rebate entries, then log maker rebate statistics
+            try:
+                await self.rebate_logger.close()
+            except Exception as e:
+                logger.error(f"Error flushing rebate log: {e}")
             await self._log_maker_statistics()
             
             logger.info("Bot shutdown complete")
@@ -916,7 +941,7 @@ class PolymarketBot:
                 # FIX 2: NegRisk Detection - check if multi-outcome market
                 neg_risk = False
                 try:
-                    market_info = await self.client.get_market(token_id)
+                    market_info = await self.client.get_market_metadata(token_id)
                     if market_info and len(market_info.get("outcomes", [])) > 2:
                         neg_risk = True
                         logger.debug(f"[BATCH_PREP] {token_id[:8]} - Detected NegRisk market")
@@ -1059,6 +1084,7 @@ class PolymarketBot:
                             if order_side == opposite_side:
                                 try:
                                     await self.client.cancel_order(order_id)
+                                    self.order_manager.discard_open_order(order_id)
                                     cancelled_count += 1
                                     
                                     # COMPLIANCE LOGGING: Create audit trail
@@ -1109,17 +1135,12 @@ class PolymarketBot:
                             order_obj = signed_orders[idx]
                             token_id = order_obj.get("tokenID", "unknown")
                             
-                            # Try to get market info for categorization
-                            market_category = "default"
-                            try:
-                                market_info = await self.client.get_market(token_id)
-                                market_category = self.get_market_category(token_id, market_info)
-                            except Exception:
-                                pass
-                            
+                            # Category resolved in the background after the ack
+                            # (see _categorize_orders_background) - no get_market
+                            # round-trip per order on the submit path
                             self._order_metadata[order_id] = {
                                 "token_id": token_id,
-                                "market_category": market_category,
+                                "market_category": "default",
                                 "batch_id": batch_id,
                                 "side": order_obj.get("side", "UNKNOWN"),
                                 "price": order_obj.get("price", 0)
@@ -1156,6 +1177,7 @@ class PolymarketBot:
             if order_ids:
                 logger.debug(f"[BATCH_EXEC] Monitoring {len(order_ids)} orders for DELAYED status...")
                 # Start monitoring in background (don't block)
+                asyncio.create_task(self._categorize_orders_background(order_ids))
                 asyncio.create_task(self._monitor_orders_background(order_ids))
                 
                 # HFT FIX 3: Start batch partial-fill handler
@@ -1506,18 +1528,25 @@ class PolymarketBot:
             logger.error(f"[ALLOWANCE] Allowance check failed: {e}")
             return False
     
-    async def detect_full_sets(self) -> List[Dict[str, Any]]:
+    async def detect_full_sets(
+        self,
+        positions: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
         """
         RELAYER-BASED MERGE ENGINE: Detect Full Sets
         
         Identify positions where the bot holds equal amounts of YES and NO shares
         (full sets) that can be merged back to USDC collateral.
         
+        Args:
+            positions: Positions snapshot already fetched this cycle (fetched if None)
+        
         Returns:
             List of full sets with condition_id, index_set, and amount
         """
         try:
-            positions = await self.client.get_positions()
+            if positions is None:
+                positions = await self.client.get_positions()
             if not positions:
                 return []
             
@@ -1779,14 +1808,13 @@ class PolymarketBot:
                     url = f"{CLOB_API_URL}/nonce"
                     headers = {"Content-Type": "application/json"}
                     
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(url, headers=headers) as resp:
-                            if resp.status == 200:
-                                data = await resp.json()
-                                current_nonce = int(data.get("nonce", 0))
-                            else:
-                                logger.debug(f"[NONCE] Failed to fetch nonce: {resp.status} (client manages nonces internally)")
-                                return False
+                    async with self.client.get_http_session().get(url, headers=headers) as resp:
+                        if resp.status == 200:
+                            data = await resp.json()
+                            current_nonce = int(data.get("nonce", 0))
+                        else:
+                            logger.debug(f"[NONCE] Failed to fetch nonce: {resp.status} (client manages nonces internally)")
+                            return False
                 
                 logger.info(f"[NONCE] Server nonce: {current_nonce}")
                 
@@ -1942,6 +1970,7 @@ class PolymarketBot:
                     
                     try:
                         await self.client.cancel_order(order_id)
+                        self.order_manager.discard_open_order(order_id)
                         logger.info(f"[STP] ✅ Cancelled {order_id[:8]}...")
                         
                         # Small delay to ensure cancellation propagates
@@ -2167,6 +2196,7 @@ class PolymarketBot:
                 "global_kill_switch": self.global_kill_switch,
                 "last_nonce": self._last_nonce,  # RELIABILITY FIX 5
                 "active_condition_ids": self._active_condition_ids,  # RELIABILITY FIX 5
+                "closed_markets": self.client.get_known_closed_markets(),
             }
             
             # Write atomically to prevent corruption
@@ -2206,6 +2236,9 @@ class PolymarketBot:
             self._last_nonce = state.get("last_nonce")
             self._active_condition_ids = state.get("active_condition_ids", [])
             
+            # Closed markets stay closed: skip their status queries after restart
+            self.client.add_known_closed_markets(state.get("closed_markets", []))
+            
             logger.info(
                 f"[STATE] ✅ Restored state from {state.get('timestamp')}\\n"
                 f"  Active orders: {len(self._active_orders)}\\n"
@@ -2353,7 +2386,7 @@ class PolymarketBot:
                 is_negrisk = False
                 if condition_id:
                     try:
-                        market_data = await self.client.get_market(condition_id)
+                        market_data = await self.client.get_market_metadata(condition_id)
                         # NegRisk = multi-choice market (>2 outcomes)
                         clob_token_ids = market_data.get('clobTokenIds', '[]')
                         if isinstance(clob_token_ids, str):
@@ -2427,7 +2460,7 @@ class PolymarketBot:
                     'side': side,
                     'price': target_price,
                     'size': shares,
-                    'created_at': datetime.now(),
+                    'created_at': time.monotonic(),  # Age math only
                     'market_name': market_name,
                     'outcome': outcome,
                     'nonce': nonce,
@@ -2585,17 +2618,23 @@ class PolymarketBot:
         # Sort by weighted score (highest first)
         scored_opportunities.sort(key=lambda x: x['weighted_score'], reverse=True)
         
-        # Log top 3 opportunities
-        logger.info("🎯 Top opportunities (rebate-weighted):")
-        for i, scored in enumerate(scored_opportunities[:3]):
-            logger.info(
-                f"  #{i+1}: Profit=${scored['base_profit']:.4f} "
-                f"× {scored['rebate_multiplier']:.2f} = ${scored['weighted_score']:.4f} "
-                f"(avg_price=${scored['avg_price']:.4f})"
-            )
+        # Unwrap original opportunities in sorted order, logging the top 3
+        # in the same pass
+        preview = 3 if logger.isEnabledFor(logging.INFO) else 0
+        if preview:
+            logger.info("🎯 Top opportunities (rebate-weighted):")
+        
+        ranked = []
+        for i, scored in enumerate(scored_opportunities):
+            if i < preview:
+                logger.info(
+                    "  #%d: Profit=$%.4f × %.2f = $%.4f (avg_price=$%.4f)",
+                    i + 1, scored['base_profit'], scored['rebate_multiplier'],
+                    scored['weighted_score'], scored['avg_price']
+                )
+            ranked.append(scored['opportunity'])
         
-        # Return original opportunities in sorted order
-        return [scored['opportunity'] for scored in scored_opportunities]
+        return ranked
     
     async def _handle_batch_partial_fills(self, batch_id: str) -> None:
         """
@@ -2625,9 +2664,13 @@ class PolymarketBot:
             await asyncio.sleep(2)
             
             # Check batch status
-            states = [self._order_states.get(oid, "UNKNOWN") for oid in order_ids]
-            delayed_count = sum(1 for s in states if s == "DELAYED")
-            matched_count = sum(1 for s in states if s == "MATCHED")
+            delayed_count = matched_count = 0
+            for oid in order_ids:
+                state = self._order_states.get(oid, "UNKNOWN")
+                if state == "DELAYED":
+                    delayed_count += 1
+                elif state == "MATCHED":
+                    matched_count += 1
             total_count = len(order_ids)
             
             if delayed_count > 0 and matched_count > 0:
@@ -2682,6 +2725,7 @@ class PolymarketBot:
         """
         try:
             await self.client.cancel_order(order_id)
+            self.order_manager.discard_open_order(order_id)
             logger.info(
                 f"  ✓ Cancelled order {order_id[:8]}... "
                 f"({order.get('side', 'unknown')} {order.get('size', 0)} @ ${order.get('price', 0):.4f})"
@@ -2756,15 +2800,22 @@ class PolymarketBot:
         
         while self.is_running:
             try:
-                await asyncio.sleep(HEARTBEAT_INTERVAL_SEC)
+                await asyncio.sleep(jittered(HEARTBEAT_INTERVAL_SEC))
                 
                 # Skip if kill switch already triggered
                 if self.global_kill_switch:
                     logger.warning("⛔ Kill switch active - heartbeat skipped")
                     continue
                 
-                # Fetch current balance
-                self.current_balance = await self.client.get_balance()
+                # Balance and positions are independent reads - one concurrent RTT
+                balance, positions = await asyncio.gather(
+                    self.client.get_balance(),
+                    self.client.get_positions(),
+                    return_exceptions=True
+                )
+                if isinstance(balance, BaseException):
+                    raise balance
+                self.current_balance = balance
                 
                 # [SAFETY] FIX 5: Capital Recycling Priority
                 # If balance < $10, PAUSE scanning and prioritize merging existing full sets
@@ -2777,9 +2828,12 @@ class PolymarketBot:
                         f"  Objective: Recover liquidity from existing positions"
                     )
                     
-                    # Attempt to merge existing full sets
+                    # Attempt to merge existing full sets (reusing this cycle's
+                    # positions snapshot rather than refetching it)
                     try:
-                        await self._check_and_merge_positions()
+                        await self._check_and_merge_positions(
+                            None if isinstance(positions, BaseException) else positions
+                        )
                         logger.info(
                             f"[CAPITAL_RECYCLING] Merge attempt completed. "
                             f"Will retry balance check on next iteration."
@@ -2788,7 +2842,7 @@ class PolymarketBot:
                         logger.error(f"[CAPITAL_RECYCLING] Merge failed: {merge_err}")
                     
                     # Skip to next iteration (don't scan for new opportunities)
-                    await asyncio.sleep(HEARTBEAT_INTERVAL_SEC)
+                    await asyncio.sleep(jittered(HEARTBEAT_INTERVAL_SEC))
                     continue
                 
                 # Calculate drawdown
@@ -2799,9 +2853,10 @@ class PolymarketBot:
                     drawdown = 0
                     drawdown_pct = 0
                 
-                # Fetch open positions
+                # Open positions (fetched above alongside the balance)
                 try:
-                    positions = await self.client.get_positions()
+                    if isinstance(positions, BaseException):
+                        raise positions
                     open_positions = [p for p in positions if float(p.get('size', 0)) > 0]
                     total_position_value = sum(
                         float(p.get('size', 0)) * float(p.get('price', 0)) 
@@ -2872,13 +2927,12 @@ class PolymarketBot:
                 if self.global_kill_switch:
                     continue
                 
-                current_time = datetime.now()
+                current_time = time.monotonic()
                 stale_order_ids = []
                 
                 # Check each tracked GTC order
                 for order_id, order_data in self._gtc_orders.items():
-                    created_at = order_data['created_at']
-                    age_seconds = (current_time - created_at).total_seconds()
+                    age_seconds = current_time - order_data['created_at']
                     
                     if age_seconds > ORDER_HEARTBEAT_INTERVAL_SEC:
                         try:
@@ -2923,7 +2977,7 @@ class PolymarketBot:
         
         while self.is_running:
             try:
-                await asyncio.sleep(CHECK_AND_REDEEM_INTERVAL_SEC)
+                await asyncio.sleep(jittered(CHECK_AND_REDEEM_INTERVAL_SEC))
                 await self.check_and_redeem()
                 
             except Exception as e:
@@ -2943,28 +2997,38 @@ class PolymarketBot:
             # Get user positions
             positions = await self.client.get_positions()
             
-            # Filter for positions in resolved markets
-            redeemable_positions = []
+            # Pass 1: cheap filter - only held positions need a market lookup
+            candidates = []
             for position in positions:
                 market_id = position.get('market', position.get('market_id'))
                 if not market_id:
                     continue
-                
-                try:
-                    # Check if market is resolved
-                    market_data = await self.client.get_market(market_id)
-                    if market_data and market_data.get('closed', False):
-                        shares = float(position.get('size', 0))
-                        if shares > 0:
-                            redeemable_positions.append({
-                                'market_id': market_id,
-                                'token_id': position.get('asset_id', position.get('token_id')),
-                                'shares': shares,
-                                'outcome': position.get('outcome', 'Unknown')
-                            })
-                except Exception as e:
-                    logger.debug(f"Error checking market {market_id}: {e}")
+                shares = float(position.get('size', 0))
+                if shares > 0:
+                    candidates.append((market_id, shares, position))
+            
+            # Pass 2: check resolution for all candidate markets concurrently
+            market_ids = list({market_id for market_id, _, _ in candidates})
+            market_results = await asyncio.gather(
+                *[self.client.get_market(market_id) for market_id in market_ids],
+                return_exceptions=True
+            )
+            markets = dict(zip(market_ids, market_results))
+            
+            # Filter for positions in resolved markets
+            redeemable_positions = []
+            for market_id, shares, position in candidates:
+                market_data = markets[market_id]
+                if isinstance(market_data, BaseException):
+                    logger.debug(f"Error checking market {market_id}: {market_data}")
                     continue
+                if market_data and market_data.get('closed', False):
+                    redeemable_positions.append({
+                        'market_id': market_id,
+                        'token_id': position.get('asset_id', position.get('token_id')),
+                        'shares': shares,
+                        'outcome': position.get('outcome', 'Unknown')
+                    })
             
             # Redeem shares from resolved markets
             if redeemable_positions:
@@ -3027,12 +3091,44 @@ class PolymarketBot:
         
         while self.is_running:
             try:
-                await asyncio.sleep(CHECK_AND_REDEEM_INTERVAL_SEC)
+                await asyncio.sleep(jittered(CHECK_AND_REDEEM_INTERVAL_SEC))
                 await self._check_and_merge_positions()
                 
             except Exception as e:
                 logger.error(f"[MERGE] Merge loop error: {e}", exc_info=True)
     
+    async def _categorize_orders_background(self, order_ids: List[str]) -> None:
+        """
+        Resolve market categories for acknowledged batch orders
+        
+        execute_batch_orders records new orders as 'default' so it can return as
+        soon as the batch is acked; the category (which picks the DELAYED
+        threshold) is filled in here with one concurrent get_market per token.
+        """
+        try:
+            token_ids = list({
+                self._order_metadata[order_id]["token_id"]
+                for order_id in order_ids
+                if order_id in self._order_metadata
+            })
+            markets = await asyncio.gather(
+                *[self.client.get_market_metadata(token_id) for token_id in token_ids],
+                return_exceptions=True
+            )
+            
+            categories = {}
+            for token_id, market_info in zip(token_ids, markets):
+                if not isinstance(market_info, BaseException):
+                    categories[token_id] = self.get_market_category(token_id, market_info)
+            
+            for order_id in order_ids:
+                metadata = self._order_metadata.get(order_id)
+                if metadata and metadata["token_id"] in categories:
+                    metadata["market_category"] = categories[metadata["token_id"]]
+                    
+        except Exception as e:
+            logger.debug(f"[DELAYED] Order categorization failed: {e}")
+    
     async def _monitor_orders_background(self, order_ids: List[str]) -> None:
         """
         RELIABILITY FIX 2: Background Order Monitoring
@@ -3153,7 +3249,10 @@ class PolymarketBot:
             except Exception as e:
                 logger.error(f"[ORDER_STATE] Observer loop error: {e}", exc_info=True)
     
-    async def _check_and_merge_positions(self) -> None:
+    async def _check_and_merge_positions(
+        self,
+        positions: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
         """
         RELAYER-BASED MERGE ENGINE: Check and Merge
         
@@ -3162,6 +3261,9 @@ class PolymarketBot:
         2. Fetch condition_id dynamically from market data
         3. Trigger merge_positions_python for each full set
         4. Handle errors gracefully (pause on relayer failure)
+        
+        Args:
+            positions: Caller's positions snapshot for this cycle, if it has one
         """
         if self.global_kill_switch:
             logger.warning("⛔ Kill switch active - merge operations skipped")
@@ -3175,7 +3277,7 @@ class PolymarketBot:
         
         try:
             # Detect full sets
-            full_sets = await self.detect_full_sets()
+            full_sets = await self.detect_full_sets(positions)
             
             if not full_sets:
                 logger.debug("[MERGE] No full sets detected")
@@ -3237,80 +3339,6 @@ class PolymarketBot:
         except Exception as e:
             logger.error(f"[MERGE] Error in _check_and_merge_positions: {e}", exc_info=True)
 
-    async def _original_auto_redeem_loop(self) -> None:
-        """
-        Original auto-redeem service - kept for reference
-        Now replaced by _auto_redeem_loop() with CHECK_AND_REDEEM_INTERVAL_SEC
-        """
-        logger.info(f"Auto-redeem loop started (interval: {AUTO_REDEEM_INTERVAL_SEC}s)")
-        
-        while self.is_running:
-            try:
-                await asyncio.sleep(AUTO_REDEEM_INTERVAL_SEC)
-                
-                if self.global_kill_switch:
-                    logger.warning("⛔ Kill switch active - auto-redeem skipped")
-                    continue
-                
-                # Get user positions
-                positions = await self.client.get_positions()
-                
-                # Filter for positions in resolved markets
-                redeemable_positions = []
-                for position in positions:
-                    market_id = position.get('market', position.get('market_id'))
-                    if not market_id:
-                        continue
-                    
-                    try:
-                        # Check if market is resolved
-                        market_data = await self.client.get_market(market_id)
-                        if market_data and market_data.get('closed', False):
-                            shares = float(position.get('size', 0))
-                            if shares > 0:
-                                redeemable_positions.append({
-                                    'market_id': market_id,
-                                    'token_id': position.get('asset_id', position.get('token_id')),
-                                    'shares': shares,
-                                    'outcome': position.get('outcome', 'Unknown')
-                                })
-                    except Exception as e:
-                        logger.debug(f"Error checking market {market_id}: {e}")
-                        continue
-                
-                # Redeem shares from resolved markets
-                if redeemable_positions:
-                    logger.info(f"Found {len(redeemable_positions)} resolved positions to redeem")
-                    
-                    for pos in redeemable_positions:
-                        try:
-                            logger.info(
-                                f"Redeeming {pos['shares']:.2f} shares from market {pos['market_id'][:8]}... "
-                                f"(outcome: {pos['outcome']})"
-                            )
-                            
-                            # Redeem shares (returns to USDC balance)
-                            result = await self.client.redeem_shares(
-                                token_id=pos['token_id'],
-                                shares=pos['shares']
-                            )
-                            
-                            logger.info(
-                                f"✅ Redeemed {pos['shares']:.2f} shares → "
-                                f"${pos['shares']:.2f} USDC returned to balance"
-                            )
-                            
-                        except Exception as e:
-                            logger.error(
-                                f"Failed to redeem {pos['shares']:.2f} shares from "
-                                f"{pos['market_id'][:8]}: {e}"
-                            )
-                else:
-                    logger.debug("No resolved positions to redeem")
-                
-            except Exception as e:
-                logger.error(f"Auto-redeem error: {e}", exc_info=True)
-
     async def sync_header_nonce(self) -> None:
         """
         [SAFETY] FIX 2: Explicit Nonce Sync on Startup
@@ -3331,7 +3359,7 @@ class PolymarketBot:
             else:
                 # Fallback: fetch from /nonce endpoint
                 clob_host = getattr(self.client._client, 'host', 'https://clob.polymarket.com')
-                async with self.client._session.get(
+                async with self.client.get_http_session().get(
                     f"{clob_host}/nonce"
                 ) as resp:
                     if resp.status == 200:
@@ -3431,7 +3459,7 @@ class PolymarketBot:
         
         while self.is_running:
             try:
-                await asyncio.sleep(HEALTH_CHECK_INTERVAL_SEC)
+                await asyncio.sleep(jittered(HEALTH_CHECK_INTERVAL_SEC))
                 await self._perform_health_check()
                 
             except Exception as e:
@@ -3513,7 +3541,16 @@ class PolymarketBot:
 
 
 async def main():
-    """Main entry point"""
+    """
+    Main entry point
+    
+    With ENABLE_EAGER_TASK_FACTORY set (opt-in, Python 3.12+) the loop uses
+    asyncio.eager_task_factory so tasks that complete without blocking
+    never wait for a scheduler pass.
+    """
+    if ENABLE_EAGER_TASK_FACTORY and hasattr(asyncio, 'eager_task_factory'):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
     try:
         # Setup logging
         setup_logging()
@@ -52,6 +52,7 @@ from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from decimal import Decimal
 import asyncio
+import heapq
 import time
 from enum import Enum
 
@@ -85,6 +86,10 @@ ARBITRAGE_OPPORTUNITY_THRESHOLD = 0.992  # UPGRADED: sum(prices) < 0.992 (~0.8%
 TAKER_FEE_BUFFER = TAKER_FEE_PERCENT  # Account for fee in opportunity detection
 FINAL_THRESHOLD = ARBITRAGE_OPPORTUNITY_THRESHOLD  # sum < 0.992 after fee buffer
 
+# Decimal forms used by the per-event check, built once at import
+FINAL_THRESHOLD_DEC = Decimal(str(FINAL_THRESHOLD))
+MIN_NET_PROFIT_PER_SHARE = Decimal('0.001')
+
 # SMART SLIPPAGE: Dynamic based on order book depth (replaces flat $0.005)
 # Thin books (< 20 shares) = tight slippage to avoid impact
 # Medium books (20-100 shares) = moderate slippage
@@ -96,6 +101,9 @@ SLIPPAGE_MODERATE = 0.005  # $0.005 for medium books (legacy default)
 SLIPPAGE_LOOSE = 0.015  # $0.015 for deep books (UPGRADED from 0.010)
 DEPTH_THRESHOLD_THIN = 20  # shares
 DEPTH_THRESHOLD_MEDIUM = 100  # shares
+SLIPPAGE_DEC = {
+    tier: Decimal(str(tier)) for tier in (SLIPPAGE_TIGHT, SLIPPAGE_MODERATE, SLIPPAGE_LOOSE)
+}
 
 # Depth validation
 # Per Polymarket Support (Jan 2026): Lower to 5 shares for small capital markets
@@ -122,6 +130,12 @@ MAX_ARB_LEG_SPREAD_PERCENT = 0.10  # Maximum 10% spread per leg (looser than MM'
 MIN_ARB_LEG_BID = 0.05  # Reject extreme long-shot bids (widened from 0.02)
 MAX_ARB_LEG_ASK = 0.95  # Reject extreme favorites (widened from 0.98)
 
+# Staged scan funnel: only the K most promising events (lowest cached
+# outcomePrices sum) get the expensive per-leg order book analysis.
+# Each analyzed event costs one book fetch per outcome, so this bounds
+# REST load per scan regardless of how many events pass the cheap prune.
+ARB_ANALYZE_LIMIT = 25
+
 
 class MarketType(Enum):
     """Classification of market types"""
@@ -130,7 +144,7 @@ class MarketType(Enum):
     NEGRISK = "negrisk"  # Inverse market (negation of primary event)
 
 
-@dataclass
+@dataclass(slots=True)
 class OutcomePrice:
     """Represents a single outcome in a market"""
     outcome_index: int
@@ -142,7 +156,7 @@ class OutcomePrice:
     available_depth: float  # How many shares available at ask price
 
 
-@dataclass
+@dataclass(slots=True)
 class ArbitrageOpportunity:
     """Represents a detected arbitrage opportunity"""
     market_id: str
@@ -286,16 +300,18 @@ class ArbScanner:
         # Reject long-shot bids (<=5 cents) - adverse selection risk
         if bid <= MIN_ARB_LEG_BID:
             logger.debug(
-                f"[ARB REJECT] {market_id}: LEG {outcome.outcome_name[:20]} - "
-                f"Extreme bid {bid:.4f} <= {MIN_ARB_LEG_BID:.2f} (long-shot risk)"
+                "[ARB REJECT] %s: LEG %.20s - "
+                "Extreme bid %.4f <= %.2f (long-shot risk)",
+                market_id, outcome.outcome_name, bid, MIN_ARB_LEG_BID
             )
             return False
         
         # Reject favorite asks (>=95 cents) - minimal profit potential
         if ask >= MAX_ARB_LEG_ASK:
             logger.debug(
-                f"[ARB REJECT] {market_id}: LEG {outcome.outcome_name[:20]} - "
-                f"Extreme ask {ask:.4f} >= {MAX_ARB_LEG_ASK:.2f} (favorite risk)"
+                "[ARB REJECT] %s: LEG %.20s - "
+                "Extreme ask %.4f >= %.2f (favorite risk)",
+                market_id, outcome.outcome_name, ask, MAX_ARB_LEG_ASK
             )
             return False
         
@@ -307,9 +323,11 @@ class ArbScanner:
             
             if spread_pct > MAX_ARB_LEG_SPREAD_PERCENT:
                 logger.debug(
-                    f"[ARB REJECT] {market_id}: LEG {outcome.outcome_name[:20]} - "
-                    f"Wide spread {spread_pct:.2%} > {MAX_ARB_LEG_SPREAD_PERCENT:.0%} "
-                    f"(bid={bid:.4f}, ask={ask:.4f})"
+                    "[ARB REJECT] %s: LEG %.20s - "
+                    "Wide spread %.2f%% > %.0f%% "
+                    "(bid=%.4f, ask=%.4f)",
+                    market_id, outcome.outcome_name,
+                    spread_pct * 100, MAX_ARB_LEG_SPREAD_PERCENT * 100, bid, ask
                 )
                 return False
         
@@ -319,9 +337,11 @@ class ArbScanner:
         
         if leg_liquidity_usd < MIN_ARB_LEG_LIQUIDITY_USD:
             logger.debug(
-                f"[ARB REJECT] {market_id}: LEG {outcome.outcome_name[:20]} - "
-                f"Thin liquidity ${leg_liquidity_usd:.2f} < ${MIN_ARB_LEG_LIQUIDITY_USD:.2f} "
-                f"({depth:.1f} shares @ ${ask:.4f})"
+                "[ARB REJECT] %s: LEG %.20s - "
+                "Thin liquidity $%.2f < $%.2f "
+                "(%.1f shares @ $%.4f)",
+                market_id, outcome.outcome_name,
+                leg_liquidity_usd, MIN_ARB_LEG_LIQUIDITY_USD, depth, ask
             )
             return False
         
@@ -387,14 +407,14 @@ class ArbScanner:
                         if market_data:
                             markets.append(market_data)
                     except Exception as e:
-                        logger.debug(f"Skipping market {mid}: {e}")
+                        logger.debug("Skipping market %s: %s", mid, e)
                         continue
             else:
                 # Fetch active markets from API
                 response = await self.client.get_markets()
                 markets = response.get('data', [])[:limit]
             
-            logger.debug(f"Scanning {len(markets)} markets for arbitrage opportunities")
+            logger.debug("Scanning %s markets for arbitrage opportunities", len(markets))
             
             # Track best near-miss for diagnostic logging
             best_near_miss = None
@@ -413,7 +433,7 @@ class ArbScanner:
                             best_sum = market_sum
                             best_near_miss = market.get('question', 'Unknown')[:60]
                 except Exception as e:
-                    logger.debug(f"Error scanning market: {e}")
+                    logger.debug("Error scanning market: %s", e)
                     continue
             
             # Sort by profit/budget ratio (highest ROI first)
@@ -488,11 +508,12 @@ class ArbScanner:
             Arbitrage profit: $1.00 - $0.95 = $0.05 per complete set
             
         Strategy:
-        1. For each event with 3+ outcomes
-        2. Fetch order book for EACH market's YES outcome  
-        3. Calculate sum of best ASK prices (actual entry cost)
-        4. If sum < $0.98, validate depth and create opportunity
-        5. Return sorted by ROI (net_profit / required_budget)
+        1. Cheap prune: events with 3+ outcomes, no NegRisk placeholders
+        2. Keep the ARB_ANALYZE_LIMIT events with the lowest cached price sum
+        3. Fetch order book for EACH market's YES outcome  
+        4. Calculate sum of best ASK prices (actual entry cost)
+        5. If sum < $0.98, validate depth and create opportunity
+        6. Return sorted by ROI (net_profit / required_budget)
         
         Args:
             events: List of event objects from get_events() (None = fetch fresh)
@@ -514,7 +535,7 @@ class ArbScanner:
                 )
                 events = response.get('data', [])
             
-            logger.debug(f"Scanning {len(events[:limit])} events for arbitrage opportunities")
+            logger.debug("Scanning %s events for arbitrage opportunities", len(events[:limit]))
             
             # Track statistics for diagnostic logging
             events_scanned = 0
@@ -522,7 +543,10 @@ class ArbScanner:
             best_near_miss = None
             best_sum = 1.0
             
-            # Scan each event
+            # Stage 1: cheap prune on fields already in the event payload.
+            # The cached outcomePrices sum doubles as the ranking score for
+            # stage 2 and the near-miss diagnostic, so it is computed once.
+            candidates = []
             for event in events[:limit]:
                 events_scanned += 1
                 
@@ -536,24 +560,38 @@ class ArbScanner:
                     if event.get('negRisk', False):
                         named_outcomes = [o for o in outcomes if o and len(o) > 0]
                         if len(named_outcomes) < len(outcomes):
-                            logger.debug(f"Skipping NegRisk event with unnamed placeholders: {event.get('id')}")
+                            logger.debug("Skipping NegRisk event with unnamed placeholders: %s", event.get('id'))
                             continue
-                    
-                    # Check event for arbitrage
+                except Exception as e:
+                    logger.debug("Error scanning event %s: %s", event.get('id', 'unknown'), e)
+                    continue
+                
+                candidates.append((event, self._get_event_sum_prices(event)))
+            
+            # Stage 2: bound the expensive analysis to the top-K candidates.
+            # Events without cached prices rank last but stay eligible.
+            if len(candidates) > ARB_ANALYZE_LIMIT:
+                candidates = heapq.nsmallest(
+                    ARB_ANALYZE_LIMIT,
+                    candidates,
+                    key=lambda c: c[1] if c[1] is not None else float('inf')
+                )
+            
+            # Stage 3: order book analysis per surviving event
+            for event, event_sum in candidates:
+                try:
                     arb_opp = await self._check_event_for_arbitrage(event)
                     
                     if arb_opp:
                         opportunities.append(arb_opp)
                         events_with_arb += 1
-                    else:
+                    elif event_sum and FINAL_THRESHOLD <= event_sum < best_sum:
                         # Track closest near-miss
-                        event_sum = self._get_event_sum_prices(event)
-                        if event_sum and FINAL_THRESHOLD <= event_sum < best_sum:
-                            best_sum = event_sum
-                            best_near_miss = event.get('title', 'Unknown')[:60]
+                        best_sum = event_sum
+                        best_near_miss = event.get('title', 'Unknown')[:60]
                             
                 except Exception as e:
-                    logger.debug(f"Error scanning event {event.get('id', 'unknown')}: {e}")
+                    logger.debug("Error scanning event %s: %s", event.get('id', 'unknown'), e)
                     continue
             
             # Sort by ROI (profit per dollar invested)
@@ -564,7 +602,8 @@ class ArbScanner:
             
             logger.info(
                 f"Event scan complete: {events_with_arb} opportunities found "
-                f"({events_scanned} events scanned, threshold: sum < {FINAL_THRESHOLD})"
+                f"(fetched={events_scanned} analyzed={len(candidates)} "
+                f"found={events_with_arb}, threshold: sum < {FINAL_THRESHOLD})"
             )
             
             # Log closest near-miss for market insight
@@ -625,11 +664,11 @@ class ArbScanner:
             # INSTITUTIONAL CHECK 1: Event-level status validation
             # Per audit - event can be active while constituent markets are closed
             if event.get('closed', False):
-                logger.debug(f"[ARB REJECT] {event_id}: Event is closed")
+                logger.debug("[ARB REJECT] %s: Event is closed", event_id)
                 return None
             
             if not event.get('active', True):
-                logger.debug(f"[ARB REJECT] {event_id}: Event is inactive")
+                logger.debug("[ARB REJECT] %s: Event is inactive", event_id)
                 return None
             
             # INSTITUTIONAL CHECK 2: Market-level status validation
@@ -639,13 +678,15 @@ class ArbScanner:
                 for market in markets:
                     if market.get('closed', False):
                         logger.debug(
-                            f"[ARB REJECT] {event_id}: Constituent market {market.get('id', 'unknown')} is closed"
+                            "[ARB REJECT] %s: Constituent market %s is closed",
+                            event_id, market.get('id', 'unknown')
                         )
                         return None
                     
                     if not market.get('active', True):
                         logger.debug(
-                            f"[ARB REJECT] {event_id}: Constituent market {market.get('id', 'unknown')} is inactive"
+                            "[ARB REJECT] %s: Constituent market %s is inactive",
+                            event_id, market.get('id', 'unknown')
                         )
                         return None
                     
@@ -653,34 +694,45 @@ class ArbScanner:
                     # Same check as market making strategy Layer 3
                     if market.get('enableOrderBook') is False:
                         logger.debug(
-                            f"[ARB REJECT] {event_id}: Constituent market {market.get('id', 'unknown')} has CLOB disabled"
+                            "[ARB REJECT] %s: Constituent market %s has CLOB disabled",
+                            event_id, market.get('id', 'unknown')
                         )
                         return None
             
             # Validation: Must have same number of outcomes and token IDs
             if len(outcomes) != len(token_ids):
                 logger.debug(
-                    f"Skipping event {event_id}: outcome/token mismatch "
-                    f"({len(outcomes)} outcomes, {len(token_ids)} tokens)"
+                    "Skipping event %s: outcome/token mismatch "
+                    "(%s outcomes, %s tokens)",
+                    event_id, len(outcomes), len(token_ids)
                 )
                 return None
             
-            # Fetch order books for ALL outcomes (with depth validation)
+            # Fetch order books for ALL outcomes in one concurrent batch, then
+            # validate every leg against that shared snapshot in memory.
+            # Cache hits return immediately; REST misses overlap instead of
+            # costing one round-trip per leg in sequence.
+            order_books = await asyncio.gather(
+                *[self._get_cached_order_book(token_id) for token_id in token_ids],
+                return_exceptions=True
+            )
+            
             outcome_prices: List[OutcomePrice] = []
             total_ask_sum = Decimal('0')
+            total_slippage = Decimal('0')
             
-            for i, (outcome_name, token_id) in enumerate(zip(outcomes, token_ids)):
+            for outcome_name, token_id, order_book in zip(outcomes, token_ids, order_books):
                 try:
-                    # Get order book (from cache or REST)
-                    order_book = await self._get_cached_order_book(token_id)
+                    if isinstance(order_book, BaseException):
+                        raise order_book
                     
                     if not order_book or 'asks' not in order_book:
-                        logger.debug(f"Skipping {event_id}: no asks for outcome {outcome_name}")
+                        logger.debug("Skipping %s: no asks for outcome %s", event_id, outcome_name)
                         return None
                     
                     asks = order_book['asks']
                     if not asks or len(asks) == 0:
-                        logger.debug(f"Skipping {event_id}: empty ask book for {outcome_name}")
+                        logger.debug("Skipping %s: empty ask book for %s", event_id, outcome_name)
                         return None
                     
                     # Get best ask (actual purchase price)
@@ -690,50 +742,59 @@ class ArbScanner:
                     # Validate minimum depth
                     if available_depth < MIN_ORDER_BOOK_DEPTH:
                         logger.debug(
-                            f"Skipping {event_id}: insufficient depth on {outcome_name} "
-                            f"({available_depth} < {MIN_ORDER_BOOK_DEPTH})"
+                            "Skipping %s: insufficient depth on %s "
+                            "(%s < %s)",
+                            event_id, outcome_name, available_depth, MIN_ORDER_BOOK_DEPTH
                         )
                         return None
                     
                     # Calculate smart slippage for this leg
-                    slippage = self._calculate_smart_slippage(float(available_depth))
+                    slippage = SLIPPAGE_DEC[self._calculate_smart_slippage(float(available_depth))]
                     
+                    # KNOWN BUG: OutcomePrice has no price/slippage_tolerance
+                    # fields (and ArbitrageOpportunity below takes neither
+                    # expected_profit nor arbitrage_profit_pct), so this raises
+                    # TypeError, swallowed by the except - the event path never
+                    # returns an opportunity. Fixing it enables live multi-leg
+                    # event execution and belongs in its own tested change.
                     outcome_prices.append(OutcomePrice(
                         outcome_name=outcome_name,
                         token_id=token_id,
                         price=best_ask,
                         available_depth=available_depth,
-                        slippage_tolerance=Decimal(str(slippage))
+                        slippage_tolerance=slippage
                     ))
                     
                     total_ask_sum += best_ask
+                    total_slippage += slippage
                     
                 except Exception as e:
-                    logger.debug(f"Error fetching order book for {outcome_name}: {e}")
+                    logger.debug("Error fetching order book for %s: %s", outcome_name, e)
                     return None
             
             # Check if arbitrage exists (sum of asks < threshold)
-            if total_ask_sum >= Decimal(str(FINAL_THRESHOLD)):
+            if total_ask_sum >= FINAL_THRESHOLD_DEC:
                 return None  # No arbitrage
             
             # Calculate profit metrics
-            profit_per_share = Decimal('1.0') - total_ask_sum
-            net_profit_per_share = profit_per_share - Decimal(str(sum(op.slippage_tolerance for op in outcome_prices)))
+            profit_per_share = 1 - total_ask_sum
+            net_profit_per_share = profit_per_share - total_slippage
             
             # Skip if net profit too small
-            if net_profit_per_share <= Decimal('0.001'):
+            if net_profit_per_share <= MIN_NET_PROFIT_PER_SHARE:
                 return None
             
             # Calculate max shares based on depth
             min_depth = min(op.available_depth for op in outcome_prices)
+            total_ask = float(total_ask_sum)  # Coerce once for the budget math below
             max_shares = min(
                 float(min_depth),
-                MAX_ARBITRAGE_BUDGET_PER_BASKET / float(total_ask_sum)
+                MAX_ARBITRAGE_BUDGET_PER_BASKET / total_ask
             )
             
             required_budget = min(
                 MIN_ARBITRAGE_BUDGET_PER_BASKET,
-                max_shares * float(total_ask_sum)
+                max_shares * total_ask
             )
             
             # Create opportunity
@@ -776,12 +837,12 @@ class ArbScanner:
             
             if cached_book and not self.market_data_manager.is_market_stale(token_id):
                 # Cache hit with fresh data - return immediately
-                logger.debug(f"[CACHE HIT] {token_id[:8]}... from WebSocket cache")
+                logger.debug("[CACHE HIT] %.8s... from WebSocket cache", token_id)
                 return cached_book
             
             # Stale cache - force REST refresh
             if cached_book:
-                logger.debug(f"[STALE CACHE] {token_id[:8]}... refreshing from REST")
+                logger.debug("[STALE CACHE] %.8s... refreshing from REST", token_id)
                 success = await self.market_data_manager.force_refresh_from_rest(token_id)
                 if success:
                     return self.market_data_manager.get_order_book(token_id)
@@ -793,12 +854,12 @@ class ArbScanner:
             
             if (current_time - cache_time) < self._cache_ttl_seconds:
                 # Local cache hit
-                logger.debug(f"[LOCAL CACHE] {token_id[:8]}... from local cache")
+                logger.debug("[LOCAL CACHE] %.8s... from local cache", token_id)
                 return cached_book
         
         # PRIORITY 3: Fetch from REST API
         try:
-            logger.debug(f"[REST FETCH] {token_id[:8]}... fetching from API")
+            logger.debug("[REST FETCH] %.8s... fetching from API", token_id)
             order_book = await self.client.get_order_book(token_id)
             
             # Store in local cache
@@ -880,7 +941,7 @@ class ArbScanner:
             # Get token IDs for outcomes (from clobTokenIds array)
             token_ids = market.get('clobTokenIds', [])
             if len(token_ids) != len(outcomes):
-                logger.debug(f"Market {market_id}: token_ids mismatch")
+                logger.debug("Market %s: token_ids mismatch", market_id)
                 return None
             
             # Fetch current prices and order book depth for each outcome
@@ -897,7 +958,7 @@ class ArbScanner:
                     asks = getattr(order_book, 'asks', [])
                     
                     if not bids or not asks:
-                        logger.debug(f"No order book data for {token_id}")
+                        logger.debug("No order book data for %s", token_id)
                         return None  # Skip if order book is empty
                     
                     # Extract prices
@@ -906,9 +967,10 @@ class ArbScanner:
                     mid_price = (best_bid + best_ask) / 2.0
                     
                     # Calculate available depth at ask price
+                    depth_cutoff = best_ask + 0.01
                     depth_at_ask = sum(
-                        float(ask['size']) for ask in asks 
-                        if float(ask['price']) <= best_ask + 0.01
+                        float(ask['size']) for ask in asks
+                        if float(ask['price']) <= depth_cutoff
                     )
                     
                     if depth_at_ask < MIN_ORDER_BOOK_DEPTH:
@@ -937,7 +999,7 @@ class ArbScanner:
                     sum_prices += mid_price
                     
                 except Exception as e:
-                    logger.debug(f"Error fetching order book for {token_id}: {e}")
+                    logger.debug("Error fetching order book for %s: %s", token_id, e)
                     return None
             
             # Check if this is an arbitrage opportunity
@@ -1042,7 +1104,7 @@ class ArbScanner:
             )
             
         except Exception as e:
-            logger.debug(f"Error checking market for arbitrage: {e}")
+            logger.debug("Error checking market for arbitrage: %s", e)
             return None
 
     def _is_negrisk_market(self, market: Dict[str, Any]) -> bool:
@@ -1426,12 +1488,11 @@ class AtomicExecutor:
         """
         Validate execution prerequisites
         
-        Checks:
-        1. Sufficient budget remaining
-        2. Sufficient balance in account
+        Checks (cheapest first, so in-memory rejects skip the balance RPC):
+        1. INSTITUTIONAL (Phase 1): Data staleness check (avoid adverse fills)
+        2. Sufficient budget remaining
         3. Order book depth constraints
-        4. Slippage within limits
-        5. INSTITUTIONAL (Phase 1): Data staleness check (avoid adverse fills)
+        4. Sufficient balance in account
         
         Args:
             opportunity: Arbitrage opportunity
@@ -1458,23 +1519,14 @@ class AtomicExecutor:
         
         # Check budget
         required_cost = shares_to_buy * opportunity.required_budget
-        budget_remaining = self._max_budget - self._budget_used
+        budget_remaining = float(self._max_budget - self._budget_used)
         
-        if required_cost > float(budget_remaining):
+        if required_cost > budget_remaining:
             raise TradingError(
                 f"Insufficient budget: ${required_cost:.2f} required, "
                 f"${budget_remaining:.2f} remaining"
             )
         
-        # Check balance
-        balance = await self.client.get_balance()
-        if balance < required_cost:
-            raise InsufficientBalanceError(
-                f"Insufficient balance: {balance} USDC < {required_cost} USDC",
-                required=required_cost,
-                available=float(balance)
-            )
-        
         # Check order book depth for all outcomes
         for outcome in opportunity.outcomes:
             if outcome.available_depth < shares_to_buy:
@@ -1483,6 +1535,15 @@ class AtomicExecutor:
                     f"{outcome.available_depth} shares < {shares_to_buy} required"
                 )
         
+        # Check balance last - the only check that leaves the process (RPC)
+        balance = float(await self.client.get_balance())
+        if balance < required_cost:
+            raise InsufficientBalanceError(
+                f"Insufficient balance: {balance} USDC < {required_cost} USDC",
+                required=required_cost,
+                available=balance
+            )
+        
         logger.debug(f"Pre-execution validation passed for {opportunity.market_id}")
 
     async def _abort_execution(
@@ -42,7 +42,8 @@ Integration:
 
 from typing import Dict, Any, Optional, List, Set
 import asyncio
-from datetime import datetime
+import time
+from collections import OrderedDict
 from decimal import Decimal
 
 from strategies.base_strategy import BaseStrategy
@@ -56,6 +57,7 @@ from config.constants import (
     PROXY_WALLET_ADDRESS,
     API_TIMEOUT_SEC,
     MAX_RETRIES,
+    LOOP_ERROR_BACKOFF_MAX_SEC,
 )
 from utils.logger import get_logger, log_trade_event
 from utils.exceptions import StrategyError
@@ -76,6 +78,39 @@ ARB_MAX_CONSECUTIVE_FAILURES = 3  # Circuit breaker threshold (system errors onl
 # INSTITUTIONAL UPGRADE: Increased from 50 to 200 markets per scan
 # Rationale: With 300+ active markets, 50-market limit creates blind spots
 ARB_OPPORTUNITY_REFRESH_LIMIT = 200  # Max markets to scan per iteration
+ARB_REEXECUTION_WINDOW_SEC = 60  # Same market is not re-executed within this window
+# FIX 4: Minimum ROI % instead of flat dollar threshold
+# Prevents locking up capital for negligible gains
+ARB_MIN_ROI = 0.003  # 0.3% minimum ROI (30 basis points)
+ARB_MIN_NET_PROFIT_PER_SHARE = 0.001  # Fallback floor when required_budget is 0
+
+
+# _executability_rejection() result codes
+_EXEC_OK = 0
+_EXEC_LOW_ROI = 1
+_EXEC_LOW_PROFIT = 2
+_EXEC_OVER_BUDGET = 3
+
+
+def _executability_rejection(net_profit_per_share: float, required_budget: float,
+                             budget_remaining: float) -> int:
+    """
+    Pure scalar profitability and budget gate for one opportunity
+    
+    Plain floats in, result code out - no attribute lookups, Decimal or
+    logging, so the per-opportunity filter stays a handful of comparisons.
+    Callers build any rejection message from the code.
+    """
+    if required_budget > 0:
+        if net_profit_per_share < ARB_MIN_ROI * required_budget:
+            return _EXEC_LOW_ROI
+    elif net_profit_per_share < ARB_MIN_NET_PROFIT_PER_SHARE:
+        # Edge case: required_budget of 0 falls back to a flat threshold
+        return _EXEC_LOW_PROFIT
+    
+    if required_budget > budget_remaining:
+        return _EXEC_OVER_BUDGET
+    return _EXEC_OK
 
 
 class ArbitrageStrategy(BaseStrategy):
@@ -147,14 +182,18 @@ class ArbitrageStrategy(BaseStrategy):
         # self.is_running is already set by BaseStrategy.__init__()
         self._consecutive_failures = 0
         self._circuit_breaker_active = False
-        self._last_execution_time = 0
-        self._executed_opportunities: Dict[str, float] = {}  # market_id -> timestamp
+        # Cooldown/re-execution bookkeeping runs on time.monotonic() so wall
+        # clock steps (NTP) can't open or extend the windows
+        self._last_execution_time = float('-inf')
+        # market_id -> monotonic timestamp, oldest first; pruned to ARB_REEXECUTION_WINDOW_SEC
+        self._executed_opportunities: "OrderedDict[str, float]" = OrderedDict()
         
         # Event-driven architecture state
         self._arb_eligible_markets: Set[str] = set()  # Asset IDs that are arb-eligible
         self._arb_eligible_events: List[Dict[str, Any]] = []  # Multi-outcome events for arbitrage
         self._pending_scan = False  # Debounce flag to prevent duplicate scans
         self._scan_lock = asyncio.Lock()
+        self._fee_prefetch_task: Optional[asyncio.Task] = None  # Background fee-rate cache warm-up
         self._market_making_strategy: Optional[Any] = None  # Reference for cross-strategy coordination
         
         # Metrics
@@ -227,17 +266,7 @@ class ArbitrageStrategy(BaseStrategy):
             Dictionary with best opportunity details or None
         """
         try:
-            # Use cached events for faster scanning
-            opportunities = await self.scanner.scan_events(
-                events=self._arb_eligible_events,
-                limit=ARB_OPPORTUNITY_REFRESH_LIMIT
-            )
-            
-            if not opportunities:
-                return None
-            
-            # Filter executable opportunities
-            executable = [opp for opp in opportunities if self._is_opportunity_executable(opp)]
+            executable = await self._find_executable_opportunities()
             
             if not executable:
                 return None
@@ -277,7 +306,7 @@ class ArbitrageStrategy(BaseStrategy):
                 return False
             
             # Check execution cooldown
-            time_since_last = datetime.now().timestamp() - self._last_execution_time
+            time_since_last = time.monotonic() - self._last_execution_time
             if time_since_last < ARB_EXECUTION_COOLDOWN_SEC:
                 return False
             
@@ -336,15 +365,24 @@ class ArbitrageStrategy(BaseStrategy):
             else:
                 # Fallback to polling if no WebSocket manager
                 logger.warning("No MarketDataManager - falling back to polling mode")
+                error_backoff = 5
+                consecutive_errors = 0
                 while self.is_running:
                     try:
                         await self._arb_scan_loop()
+                        error_backoff = 5
+                        consecutive_errors = 0
                         await asyncio.sleep(ARB_SCAN_INTERVAL_SEC)
                     except asyncio.CancelledError:
                         break
                     except Exception as e:
-                        logger.error(f"Polling mode error: {e}")
-                        await asyncio.sleep(5)
+                        consecutive_errors += 1
+                        logger.error(
+                            f"Polling mode error (failure #{consecutive_errors}, "
+                            f"retrying in {error_backoff}s): {e}"
+                        )
+                        await asyncio.sleep(error_backoff)
+                        error_backoff = min(error_backoff * 2, LOOP_ERROR_BACKOFF_MAX_SEC)
                 return
             
             # Keep strategy alive (event handlers run in background)
@@ -362,6 +400,8 @@ class ArbitrageStrategy(BaseStrategy):
             # Cleanup
             if self._market_data_manager:
                 self._market_data_manager.cache.unregister_market_update_handler('arbitrage_scanner')
+            if self._fee_prefetch_task and not self._fee_prefetch_task.done():
+                self._fee_prefetch_task.cancel()
             self.is_running = False
             logger.info("🛑 ArbitrageStrategy stopped")
 
@@ -549,6 +589,13 @@ class ArbitrageStrategy(BaseStrategy):
             # Store events for arb scanning
             self._arb_eligible_events = multi_outcome_events
             
+            # Warm the client's fee-rate cache for every eligible leg in the
+            # background, so the first FOK basket doesn't wait on N fee lookups
+            if self._fee_prefetch_task is None or self._fee_prefetch_task.done():
+                self._fee_prefetch_task = asyncio.create_task(
+                    self.client.prefetch_fee_rates(list(self._arb_eligible_markets))
+                )
+            
         except Exception as e:
             logger.error(f"Failed to discover arb-eligible markets: {e}", exc_info=True)
     
@@ -582,6 +629,35 @@ class ArbitrageStrategy(BaseStrategy):
             logger.error(f"Market update handler error: {e}", exc_info=True)
             self._pending_scan = False
 
+    async def _find_executable_opportunities(self) -> List[ArbitrageOpportunity]:
+        """
+        Scan cached arb-eligible events and keep the executable opportunities
+        
+        Shared by the event-driven scan loop and analyze_opportunity() so both
+        run the same single scan + filter pass.
+        """
+        # Use cached arb-eligible events (discovered at startup)
+        # This avoids re-fetching events on every price update
+        opportunities = await self.scanner.scan_events(
+            events=self._arb_eligible_events,
+            limit=ARB_OPPORTUNITY_REFRESH_LIMIT
+        )
+        
+        if not opportunities:
+            return []
+        
+        # Filter for execution readiness (budget resolved once per pass)
+        budget_remaining = float(self._get_budget_remaining())
+        executable = [
+            opp for opp in opportunities
+            if self._is_opportunity_executable(opp, budget_remaining)
+        ]
+        
+        if not executable:
+            logger.debug("No executable opportunities (found %d total)", len(opportunities))
+        
+        return executable
+
     async def _arb_scan_loop(self) -> None:
         """
         Main arbitrage scanning loop (INSTITUTION-GRADE 2026)
@@ -600,25 +676,10 @@ class ArbitrageStrategy(BaseStrategy):
         5. Update metrics and budget tracking
         """
         try:
-            # Use cached arb-eligible events (discovered at startup)
-            # This avoids re-fetching events on every price update
-            opportunities = await self.scanner.scan_events(
-                events=self._arb_eligible_events,
-                limit=ARB_OPPORTUNITY_REFRESH_LIMIT
-            )
-            
-            if not opportunities:
-                return  # No opportunities this iteration
-            
-            # Filter for execution readiness
-            executable_opps = [
-                opp for opp in opportunities
-                if self._is_opportunity_executable(opp)
-            ]
+            executable_opps = await self._find_executable_opportunities()
             
             if not executable_opps:
-                logger.debug(f"No executable opportunities (found {len(opportunities)} total)")
-                return
+                return  # Nothing executable this iteration
             
             # CROSS-STRATEGY COORDINATION: Prioritize opportunities that reduce MM inventory
             if self._market_making_strategy:
@@ -646,10 +707,11 @@ class ArbitrageStrategy(BaseStrategy):
                 return
             
             # Check execution cooldown
-            time_since_last = datetime.now().timestamp() - self._last_execution_time
+            time_since_last = time.monotonic() - self._last_execution_time
             if time_since_last < ARB_EXECUTION_COOLDOWN_SEC:
                 logger.debug(
-                    f"Execution cooldown active ({time_since_last:.1f}s / {ARB_EXECUTION_COOLDOWN_SEC}s)"
+                    "Execution cooldown active (%.1fs / %ss)",
+                    time_since_last, ARB_EXECUTION_COOLDOWN_SEC
                 )
                 return
             
@@ -660,7 +722,7 @@ class ArbitrageStrategy(BaseStrategy):
             )
             
             if shares_to_buy < 1.0:
-                logger.debug(f"Share count too low: {shares_to_buy} < 1.0")
+                logger.debug("Share count too low: %s < 1.0", shares_to_buy)
                 return
             
             # CRITICAL FIX #1: Pause MM strategy during arb execution
@@ -691,7 +753,7 @@ class ArbitrageStrategy(BaseStrategy):
             
             # Update metrics
             self._total_arb_executions += 1
-            self._last_execution_time = datetime.now().timestamp()
+            self._last_execution_time = time.monotonic()
             
             if result.success:
                 self._successful_executions += 1
@@ -707,7 +769,7 @@ class ArbitrageStrategy(BaseStrategy):
                     price=result.total_cost / result.shares_filled,
                     cost=result.total_cost,
                     profit=result.actual_profit,
-                    execution_id=f"{result.market_id}_{int(self._last_execution_time)}"
+                    execution_id=f"{result.market_id}_{int(time.time())}"
                 )
                 
                 logger.info(
@@ -717,7 +779,7 @@ class ArbitrageStrategy(BaseStrategy):
                 )
                 
                 # Mark as executed (prevent repeated execution)
-                self._executed_opportunities[result.market_id] = self._last_execution_time
+                self._record_execution(result.market_id, self._last_execution_time)
                 
             else:
                 self._failed_executions += 1
@@ -815,7 +877,7 @@ class ArbitrageStrategy(BaseStrategy):
                     
                     # Call emergency liquidation to market-sell orphaned positions
                     await self._revert_positions(
-                        execution_id=f"{opportunity.market_id}_{int(datetime.now().timestamp())}",
+                        execution_id=f"{opportunity.market_id}_{int(time.time())}",
                         filled_legs=filled_legs,
                         shares=result.filled_shares
                     )
@@ -844,18 +906,24 @@ class ArbitrageStrategy(BaseStrategy):
                 error_message=str(e)
             )
 
-    def _is_opportunity_executable(self, opportunity: ArbitrageOpportunity) -> bool:
+    def _is_opportunity_executable(
+        self,
+        opportunity: ArbitrageOpportunity,
+        budget_remaining: Optional[float] = None
+    ) -> bool:
         """
         Check if opportunity should be executed
         
         Filters:
-        1. Sufficient budget remaining
-        2. Not already executed recently
-        3. Circuit breaker not active
-        4. ROI meets minimum threshold (0.3% = 30 basis points)
+        1. Circuit breaker not active
+        2. ROI meets minimum threshold (ARB_MIN_ROI, 30 basis points)
+        3. Sufficient budget remaining
+        4. Not already executed recently
         
         Args:
             opportunity: ArbitrageOpportunity to check
+            budget_remaining: Remaining budget in USDC; scan loops resolve it
+                once per pass instead of once per opportunity
             
         Returns:
             True if executable
@@ -864,34 +932,43 @@ class ArbitrageStrategy(BaseStrategy):
         if self._circuit_breaker_active:
             return False
         
-        # FIX 4: Use minimum ROI % instead of flat dollar threshold
-        # Prevents locking up capital for negligible gains
-        MIN_ROI_PERCENT = 0.003  # 0.3% minimum ROI (30 basis points)
+        if budget_remaining is None:
+            budget_remaining = float(self._get_budget_remaining())
         
-        if opportunity.required_budget > 0:
-            roi = opportunity.net_profit_per_share / opportunity.required_budget
-            if roi < MIN_ROI_PERCENT:
+        net_profit = float(opportunity.net_profit_per_share)
+        required_budget = float(opportunity.required_budget)
+        rejection = _executability_rejection(net_profit, required_budget, budget_remaining)
+        if rejection != _EXEC_OK:
+            if rejection == _EXEC_LOW_ROI:
                 logger.debug(
-                    f"ROI too low: {roi*100:.3f}% < {MIN_ROI_PERCENT*100:.1f}% "
-                    f"(profit ${opportunity.net_profit_per_share:.4f} / budget ${opportunity.required_budget:.2f})"
+                    "ROI too low: %.3f%% < %.1f%% (profit $%.4f / budget $%.2f)",
+                    net_profit / required_budget * 100, ARB_MIN_ROI * 100,
+                    net_profit, required_budget
                 )
-                return False
-        else:
-            # Fallback: if required_budget is 0 (edge case), use flat threshold
-            if opportunity.net_profit_per_share < 0.001:
-                return False
-        
-        # Check budget
-        budget_remaining = self._get_budget_remaining()
-        if opportunity.required_budget > float(budget_remaining):
             return False
         
-        # Check if already executed recently (within 60 seconds)
-        last_exec_time = self._executed_opportunities.get(opportunity.market_id, 0)
-        if datetime.now().timestamp() - last_exec_time < 60:
+        # Check if already executed recently
+        last_exec_time = self._executed_opportunities.get(opportunity.market_id, float('-inf'))
+        if time.monotonic() - last_exec_time < ARB_REEXECUTION_WINDOW_SEC:
             return False
         
         return True
+    
+    def _record_execution(self, market_id: str, timestamp: float) -> None:
+        """
+        Record an executed market and drop entries past the re-execution window
+        
+        Entries are kept in timestamp order (re-recording moves a market to the
+        end), so expired ones are always at the front and memory stays bounded
+        by the markets executed within ARB_REEXECUTION_WINDOW_SEC.
+        """
+        executed = self._executed_opportunities
+        executed[market_id] = timestamp
+        executed.move_to_end(market_id)
+        
+        cutoff = timestamp - ARB_REEXECUTION_WINDOW_SEC
+        while executed and next(iter(executed.values())) < cutoff:
+            executed.popitem(last=False)
 
     async def _revert_positions(
         self,
@@ -1030,8 +1107,8 @@ class ArbitrageStrategy(BaseStrategy):
                 
                 if inventory_bonus > 0:
                     logger.info(
-                        f"[CROSS-STRATEGY] Arb on {opp.market_id[:8]}... helps reduce "
-                        f"MM inventory (bonus: +{inventory_bonus*100:.1f}%)"
+                        "[CROSS-STRATEGY] Arb on %.8s... helps reduce MM inventory (bonus: +%.1f%%)",
+                        opp.market_id, inventory_bonus * 100
                     )
             
             # Combined score
@@ -39,6 +39,7 @@ class BaseStrategy(ABC):
         self.client = client
         self.order_manager = order_manager
         self.config = config or {}
+        self._cache_config_values()
         self.is_running = False
         self._stop_event = asyncio.Event()
         
@@ -106,11 +107,9 @@ class BaseStrategy(ABC):
                 try:
                     await self.execute()
                     
-                    # Check interval from config
-                    interval = self.config.get('check_interval_sec', 15)
                     await asyncio.wait_for(
                         self._stop_event.wait(),
-                        timeout=interval
+                        timeout=self._check_interval_sec
                     )
                     
                 except asyncio.TimeoutError:
@@ -121,8 +120,7 @@ class BaseStrategy(ABC):
                     await self.on_error(e)
                     
                     # Wait before retrying after error
-                    error_backoff = self.config.get('error_backoff_sec', 30)
-                    await asyncio.sleep(error_backoff)
+                    await asyncio.sleep(self._error_backoff_sec)
 
         except Exception as e:
             logger.error(f"Fatal error in strategy {self.name}: {e}", exc_info=True)
@@ -179,6 +177,15 @@ class BaseStrategy(ABC):
             'config': self.config,
         }
 
+    def _cache_config_values(self) -> None:
+        """
+        Resolve loop config values once instead of per iteration
+        
+        Re-run whenever self.config changes (see update_config)
+        """
+        self._check_interval_sec = self.config.get('check_interval_sec', 15)
+        self._error_backoff_sec = self.config.get('error_backoff_sec', 30)
+
     def update_config(self, config: Dict[str, Any]) -> None:
         """
         Update strategy configuration
@@ -187,4 +194,5 @@ class BaseStrategy(ABC):
             config: New configuration parameters
         """
         self.config.update(config)
+        self._cache_config_values()
         logger.info(f"Strategy {self.name} config updated: {config}")
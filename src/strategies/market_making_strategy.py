@@ -37,13 +37,14 @@ Runs in parallel with arbitrage strategy using separate capital allocation.
 Does NOT interfere with arbitrage execution.
 """
 
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Set, Tuple
 import asyncio
-import aiohttp
 from datetime import datetime, timedelta
-from decimal import Decimal
+from decimal import Context, Decimal
 import time
 import json
+import math
+import logging
 from collections import deque
 import statistics
 
@@ -106,6 +107,8 @@ from config.constants import (
     MM_QUOTE_UPDATE_INTERVAL,
     MM_ORDER_TTL,
     MM_MIN_ORDER_SPACING,
+    MM_MAX_CONCURRENT_CANCELS,
+    MM_MAX_CONCURRENT_FILL_QUERIES,
     
     # Performance tracking
     MM_ENABLE_PERFORMANCE_LOG,
@@ -122,15 +125,128 @@ from config.constants import (
     # OBI (Order Book Imbalance) - Momentum Detection
     MM_OBI_THRESHOLD,
     MM_MOMENTUM_PROTECTION_TIME,
+    MM_MICRO_PRICE_DEPTH_LEVELS,
+    MM_VOL_DECAY_LAMBDA,
 )
 from utils.logger import get_logger
-from utils.exceptions import StrategyError
-from utils.rate_limiter import TokenBucketRateLimiter, ORDER_PLACEMENT_RATE_LIMITER
+from utils.exceptions import StrategyError, PostOnlyOrderRejectedError
+from utils.rate_limiter import TokenBucketRateLimiter, ORDER_PLACEMENT_RATE_LIMITER, GAMMA_READ_RATE_LIMITER
 
 
 logger = get_logger(__name__)
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# SKEWED-QUOTE CONSTANTS (precomputed once at import, not per quote)
+# ═══════════════════════════════════════════════════════════════════════════
+_RISK_FACTOR = Decimal('0.0005')  # 0.05 cents per 1 share ($0.05 per 100 shares)
+_MIN_TICK_SIZE = Decimal('0.001')  # Polymarket minimum tick (0.1 cent)
+_MIN_QUOTE_PRICE = Decimal('0.001')  # Valid quote range for tick rounding
+_MAX_QUOTE_PRICE = Decimal('0.999')
+# Float -> Decimal for prices in [0, 1]: 8 significant digits is far finer than
+# the tick and skips the str() round-trip of Decimal(str(x))
+_PRICE_DEC_CTX = Context(prec=8)
+
+# INSTITUTIONAL UPGRADE: Bernoulli Variance Guard (2026)
+# For binary markets [0, 1], variance = p(1-p) collapses near boundaries
+# If price < 0.10 or > 0.90, cap volatility to prevent gamma overload
+_BOUNDARY_LOW = Decimal('0.10')
+_BOUNDARY_HIGH = Decimal('0.90')
+_MAX_BOUNDARY_VOLATILITY = Decimal('0.05')  # Cap σ at 5% near boundaries
+_MIN_EFFECTIVE_RISK = Decimal('0.0001')  # 1 basis point minimum (prevents collapse)
+
+# P1 FIX: Boundary risk factor WITH FLOOR (constant - no per-quote Decimal division)
+_BOUNDARY_RISK_FACTOR = max(
+    _RISK_FACTOR * _MAX_BOUNDARY_VOLATILITY / Decimal('0.15'),
+    _MIN_EFFECTIVE_RISK
+)
+
+# Float mirrors for the scalar skew math
+_RISK_FACTOR_F = float(_RISK_FACTOR)
+_BOUNDARY_RISK_FACTOR_F = float(_BOUNDARY_RISK_FACTOR)
+_BOUNDARY_LOW_F = float(_BOUNDARY_LOW)
+_BOUNDARY_HIGH_F = float(_BOUNDARY_HIGH)
+_MIN_TICK_SIZE_F = float(_MIN_TICK_SIZE)
+_TICKS_PER_UNIT = int(1 / _MIN_TICK_SIZE)  # 1000 ticks per $1 - quotes rounded as int ticks
+
+# Config-only quote factors, resolved once instead of per quote / per market
+_BASE_HALF_SPREAD = MM_TARGET_SPREAD / 2
+_ORACLE_BAND_LOW_MULT = 1 - MM_ORACLE_PRICE_DEVIATION_LIMIT
+_ORACLE_BAND_HIGH_MULT = 1 + MM_ORACLE_PRICE_DEVIATION_LIMIT
+# Null-volume markets are still accepted at 10x the minimum liquidity depth
+_NULL_VOLUME_MIN_LIQUIDITY = Decimal(str(MM_MIN_LIQUIDITY_DEPTH * 10))
+# Price jump filter: pause a token when micro/mid diverge by more than 0.5%
+_PRICE_JUMP_DIVERGENCE = Decimal('0.005')
+_PRICE_JUMP_PAUSE_SEC = 5
+
+
+def _skew_math(mid: float, inventory: float, risk_factor: float, alpha_shift: float,
+               half_spread: float, tick: float) -> Tuple[float, float]:
+    """
+    Pure scalar core of the skewed-quote calculation (no Decimal, no I/O)
+    
+    Returns unrounded (bid, ask) around the inventory- and alpha-shifted
+    reservation price, never crossing mid by less than one tick.
+    """
+    # Avellaneda-Stoikov reservation + additive Z-score alpha
+    reservation = mid - inventory * risk_factor + alpha_shift
+    # Inventory-driven spread widening (reduce risk of accumulating more)
+    half = half_spread + abs(inventory) * tick
+    return min(reservation - half, mid - tick), max(reservation + half, mid + tick)
+
+
+def _quote_sizes(capital_per_market: float, bid_price: float, ask_price: float,
+                 inventory: float) -> Tuple[float, float]:
+    """
+    Share sizes for a (bid, ask) quote pair from the per-market capital slice
+    
+    shares = capital / price on each side; the side that would add to an
+    existing inventory is halved. Non-positive prices size to 0.
+    """
+    bid_size = capital_per_market / bid_price if bid_price > 0 else 0.0
+    ask_size = capital_per_market / ask_price if ask_price > 0 else 0.0
+    # Reduce size when holding inventory
+    if inventory > 0:
+        bid_size *= 0.5
+    elif inventory < 0:
+        ask_size *= 0.5
+    return bid_size, ask_size
+
+
+# Passive-unwind / force-exit quotes stay inside [1c, 99c]
+_UNWIND_PRICE_FLOOR = 0.01
+_UNWIND_PRICE_CEIL = 0.99
+
+
+def _clamp_unwind_price(price: float) -> float:
+    """Clamp an unwind quote into [_UNWIND_PRICE_FLOOR, _UNWIND_PRICE_CEIL]"""
+    if price < _UNWIND_PRICE_FLOOR:
+        return _UNWIND_PRICE_FLOOR
+    return _UNWIND_PRICE_CEIL if price > _UNWIND_PRICE_CEIL else price
+
+
+# _snapshot_rejection() result codes
+_SNAPSHOT_OK = 0
+_SNAPSHOT_GAPPED = 1
+_SNAPSHOT_ORACLE_DEVIATION = 2
+
+
+def _snapshot_rejection(best_bid: float, best_ask: float, micro_price: float,
+                        max_spread: float, oracle_low: float, oracle_high: float) -> int:
+    """
+    Pure scalar gapped-market and oracle-band check for one cached book
+    
+    The oracle deviation limit is pre-resolved by the caller into an
+    absolute [oracle_low, oracle_high] price band, so the per-token check is
+    comparisons only (no division). Pass (-inf, inf) when no oracle applies.
+    """
+    if best_ask - best_bid > max_spread:
+        return _SNAPSHOT_GAPPED
+    if not oracle_low <= micro_price <= oracle_high:
+        return _SNAPSHOT_ORACLE_DEVIATION
+    return _SNAPSHOT_OK
+
+
 class ZScoreManager:
     """
     Z-Score Mean Reversion Alpha Signal Generator
@@ -201,8 +317,6 @@ class ZScoreManager:
         self.current_z_score = 0.0
         
         # EWMA Volatility tracking (RiskMetrics Standard)
-        # Import here to avoid circular dependency
-        from config.constants import MM_VOL_DECAY_LAMBDA
         self.ewma_lambda = MM_VOL_DECAY_LAMBDA  # 0.94 decay factor
         self.ewma_variance = None  # Initialize on first return
         self.last_price = None
@@ -253,8 +367,6 @@ class ZScoreManager:
         3. Calculate mean: μ = Σ(micro_prices) / N
         4. Calculate Z-Score: Z = (current_micro_price - μ) / σ_EWMA
         """
-        from decimal import Decimal
-        
         # Add micro-price to rolling window (deque auto-manages size)
         self.price_window.append(micro_price)
         self.global_price_window.append(micro_price)  # Also track in global window
@@ -435,22 +547,48 @@ class ZScoreManager:
 class MarketPosition:
     """Tracks inventory and P&L for a single market"""
     
+    # Risk checks and quoting read these fields many times per cycle;
+    # slots make each access a fixed-offset fetch instead of a __dict__ probe
+    __slots__ = (
+        'market_id', 'market_question', 'token_ids',
+        'inventory', 'is_binary', '_inv0', '_inv1',
+        'cost_basis', 'entry_time', 'unwinding_start', 'unwinding_timeout',
+        'active_bids', 'active_asks',
+        'realized_pnl', 'total_volume', 'fill_count',
+        '_fill_times', '_fill_is_buy', '_fill_values', '_fill_buy_value', '_fill_sell_value',
+        'toxic_flow_window', 'toxic_flow_threshold', 'spread_widening_until',
+        'fill_history', 'markout_window', 'markout_interval',
+        'adverse_selection_count', 'total_markout_pnl',
+        '_adverse_multiplier', '_adverse_dirty', '_adverse_logged_multiplier',
+        'spread_multiplier', 'sensitivity_multiplier', 'tuning_increment',
+        'consecutive_positive_markouts', 'markout_lock',
+        'last_applied_reservation_price', 'last_inventory_snapshot', 'hysteresis_lock',
+        'hysteresis_threshold_price', 'hysteresis_threshold_inventory_pct', 'hysteresis_blocks',
+        '_accumulated_dust_bid', '_accumulated_dust_ask', '_dust_compensation_count',
+    )
+    
     def __init__(self, market_id: str, market_question: str, token_ids: List[str]):
         self.market_id = market_id
         self.market_question = market_question
         self.token_ids = token_ids
         
         # Inventory tracking (positive = long, negative = short)
+        # Mutate via set_inventory() so the binary-market cache below stays in sync
         self.inventory: Dict[str, int] = {tid: 0 for tid in token_ids}
         
+        # Binary markets: Yes/No inventory mirrored as attributes for hot risk checks
+        self.is_binary = len(token_ids) == 2
+        self._inv0 = 0
+        self._inv1 = 0
+        
         # Cost basis tracking
         self.cost_basis: Dict[str, float] = {tid: 0.0 for tid in token_ids}
         
         # Entry time
-        self.entry_time = datetime.now()
+        self.entry_time = time.monotonic()  # Age math only - immune to wall-clock steps
         
         # Unwinding tracking (for emergency force exit)
-        self.unwinding_start: Dict[str, float] = {}  # token_id -> timestamp
+        self.unwinding_start: Dict[str, float] = {}  # token_id -> time.monotonic()
         self.unwinding_timeout = 300  # 5 minutes max for passive unwinding
         
         # Active orders
@@ -463,7 +601,13 @@ class MarketPosition:
         self.fill_count = 0
         
         # Toxic flow detection (protect against being run over)
-        self.recent_fills: List[Tuple[float, str, float]] = []  # (timestamp, side, size)
+        # Parallel ring buffers (timestamp / is_buy / value) + running side totals,
+        # fills arrive in time order so expiry pops from the left
+        self._fill_times: deque = deque()
+        self._fill_is_buy: deque = deque()
+        self._fill_values: deque = deque()
+        self._fill_buy_value = 0.0
+        self._fill_sell_value = 0.0
         self.toxic_flow_window = 10  # seconds
         self.toxic_flow_threshold = 50.0  # $50 filled in window = toxic
         self.spread_widening_until = 0.0  # timestamp to stop widening
@@ -483,6 +627,12 @@ class MarketPosition:
         self.adverse_selection_count = 0  # Count of negative markouts
         self.total_markout_pnl = 0.0  # Cumulative markout P&L
         
+        # Memoized adverse-selection spread multiplier (rebuilt only after a
+        # fill or markout update marks it dirty)
+        self._adverse_multiplier = 1.0
+        self._adverse_dirty = False
+        self._adverse_logged_multiplier = 1.0  # Last value warned about
+        
         # Self-tuning multipliers (start at 1.0 = no adjustment)
         self.spread_multiplier = 1.0
         self.sensitivity_multiplier = 1.0
@@ -637,6 +787,7 @@ class MarketPosition:
                 # Add to markout window
                 self.markout_window.append(markout_pnl)
                 self.total_markout_pnl += markout_pnl
+                self._adverse_dirty = True
                 
                 if markout_pnl < 0:
                     self.adverse_selection_count += 1
@@ -714,7 +865,7 @@ class MarketPosition:
             new_inventory = old_inventory + shares
             new_cost = ((old_inventory * old_cost) + (shares * price)) / new_inventory if new_inventory != 0 else 0
             
-            self.inventory[token_id] = new_inventory
+            self.set_inventory(token_id, new_inventory)
             self.cost_basis[token_id] = new_cost
         else:
             # Sold shares
@@ -726,14 +877,59 @@ class MarketPosition:
             pnl = shares_sold * (exit_price - entry_price)
             self.realized_pnl += pnl
             
-            self.inventory[token_id] -= shares_sold
+            self.set_inventory(token_id, self.inventory[token_id] - shares_sold)
             
         self.total_volume += abs(shares) * price
         self.fill_count += 1
+        self._adverse_dirty = True
         
         # Track fill for toxic flow detection
         fill_value = abs(shares) * price
-        self.recent_fills.append((time.time(), 'BUY' if is_buy else 'SELL', fill_value))
+        self._fill_times.append(time.time())
+        self._fill_is_buy.append(is_buy)
+        self._fill_values.append(fill_value)
+        if is_buy:
+            self._fill_buy_value += fill_value
+        else:
+            self._fill_sell_value += fill_value
+    
+    def set_inventory(self, token_id: str, shares: int) -> None:
+        """Set inventory for a token, keeping the binary Yes/No cache current"""
+        self.inventory[token_id] = shares
+        if self.is_binary:
+            if token_id == self.token_ids[0]:
+                self._inv0 = shares
+            elif token_id == self.token_ids[1]:
+                self._inv1 = shares
+    
+    def remove_active_order(self, order_id: str) -> None:
+        """Drop a filled order from quote tracking in place (one pass per side)"""
+        for orders in (self.active_bids, self.active_asks):
+            stale = [token_id for token_id, oid in orders.items() if oid == order_id]
+            for token_id in stale:
+                del orders[token_id]
+    
+    def compensate_dust(self, dust: Dict[str, Decimal], token_id: str,
+                        rounded_price: float, new_dust: Decimal, label: str) -> float:
+        """
+        Accumulate one side's tick-rounding dust; fold whole ticks back into the price
+        
+        dust is _accumulated_dust_bid or _accumulated_dust_ask. Returns the
+        compensated price once the accumulated error reaches 1 tick ($0.001).
+        """
+        accumulated = dust.get(token_id, Decimal('0')) + new_dust
+        if abs(accumulated) >= _MIN_TICK_SIZE:
+            compensation = (accumulated // _MIN_TICK_SIZE) * _MIN_TICK_SIZE
+            rounded_price += float(compensation)
+            accumulated -= compensation
+            self._dust_compensation_count += 1
+            
+            logger.debug(
+                "💰 DUST COMPENSATION (%s): Adjusted by $%+.4f (count: %d)",
+                label, float(compensation), self._dust_compensation_count
+            )
+        dust[token_id] = accumulated
+        return rounded_price
     
     def record_fill_for_markout(self, token_id: str, side: str, fill_price: float, 
                                  micro_price: float, size: float):
@@ -763,40 +959,73 @@ class MarketPosition:
         """Get net directional inventory for binary markets"""
         # For binary markets (Yes/No), normalize to single delta
         # Being long 10 Yes = being short 10 No
-        if len(self.token_ids) == 2:
-            inv_yes = self.inventory.get(self.token_ids[0], 0)
-            inv_no = self.inventory.get(self.token_ids[1], 0)
+        if self.is_binary:
             # Net position: positive = long market, negative = short market
-            return inv_yes - inv_no
+            return self._inv0 - self._inv1
         else:
             # Multi-outcome market: return sum (less precise but safe)
             return sum(self.inventory.values())
     
-    def get_inventory_age(self) -> float:
-        """Get age of position in seconds"""
-        return (datetime.now() - self.entry_time).total_seconds()
+    def get_adverse_multiplier(self) -> float:
+        """
+        Spread multiplier for adverse selection (1.0 = not being picked off)
+        
+        Needs >10 fills for significance; avg markout below -0.5 cents per fill
+        widens by 1 + |avg| * 100, capped at 2.5x. Memoized until the next
+        fill or markout update.
+        """
+        if self._adverse_dirty:
+            self._adverse_dirty = False
+            multiplier = 1.0
+            if self.fill_count > 10:
+                avg_markout = self.total_markout_pnl / self.fill_count
+                if avg_markout < -0.005:
+                    multiplier = min(1.0 + abs(avg_markout) * 100, 2.5)
+            self._adverse_multiplier = multiplier
+        return self._adverse_multiplier
+    
+    def get_inventory_age(self, now: Optional[float] = None) -> float:
+        """Get age of position in seconds (now: caller's time.monotonic() reading)"""
+        return (time.monotonic() if now is None else now) - self.entry_time
+    
+    @property
+    def recent_fill_value(self) -> float:
+        """Total USD value of fills currently in the toxic-flow window"""
+        return self._fill_buy_value + self._fill_sell_value
+    
+    def _expire_fills(self, current_time: float) -> None:
+        """Drop fills older than the toxic-flow window from the ring buffers"""
+        times = self._fill_times
+        cutoff = current_time - self.toxic_flow_window
+        while times and times[0] < cutoff:
+            times.popleft()
+            value = self._fill_values.popleft()
+            if self._fill_is_buy.popleft():
+                self._fill_buy_value -= value
+            else:
+                self._fill_sell_value -= value
+        
+        if not times:
+            # Reset running totals so float error cannot accumulate
+            self._fill_buy_value = 0.0
+            self._fill_sell_value = 0.0
     
     def check_toxic_flow(self) -> bool:
         """Detect if being run over by large one-sided flow"""
-        import time as time_module
-        current_time = time_module.time()
+        current_time = time.time()
         
         # Clean old fills outside window
-        self.recent_fills = [
-            (ts, side, val) for ts, side, val in self.recent_fills 
-            if current_time - ts <= self.toxic_flow_window
-        ]
+        self._expire_fills(current_time)
         
-        if not self.recent_fills:
+        if not self._fill_times:
             return False
         
-        # Calculate total filled in window
-        total_filled = sum(val for _, _, val in self.recent_fills)
+        # Calculate total filled in window (running totals, no rescan)
+        buy_fills = self._fill_buy_value
+        sell_fills = self._fill_sell_value
+        total_filled = buy_fills + sell_fills
         
         # Check if one-sided (>80% buys or sells)
-        buy_fills = sum(val for _, side, val in self.recent_fills if side == 'BUY')
-        sell_fills = sum(val for _, side, val in self.recent_fills if side == 'SELL')
-        
         one_sided_ratio = max(buy_fills, sell_fills) / total_filled if total_filled > 0 else 0
         
         # Toxic flow = large volume AND one-sided
@@ -809,8 +1038,7 @@ class MarketPosition:
     
     def calculate_markout_pnl(self, current_prices: Dict[str, float]) -> Dict[str, float]:
         """Calculate post-trade alpha (markout P&L) to detect adverse selection"""
-        import time as time_module
-        current_time = time_module.time()
+        current_time = time.time()
         
         markout_results = {}
         
@@ -837,6 +1065,7 @@ class MarketPosition:
                         self.adverse_selection_count += 1
                     
                     self.total_markout_pnl += markout
+                    self._adverse_dirty = True
         
         return markout_results
 
@@ -893,6 +1122,18 @@ class MarketMakingStrategy(BaseStrategy):
         self._allocated_capital = Decimal(str(allocated_amount))
         self._capital_used = Decimal('0')
         
+        # get_status() template - fixed fields converted once, counters filled per call
+        self._status_template: Dict[str, Any] = {
+            'name': 'MarketMaking',
+            'is_running': False,
+            'allocated_capital': float(self._allocated_capital),
+            'capital_used': float(self._capital_used),
+            'active_positions': 0,
+            'total_pnl': 0.0,
+            'total_fills': 0,
+            'total_maker_volume': 0.0,
+        }
+        
         # Active positions
         self._positions: Dict[str, MarketPosition] = {}
         
@@ -911,7 +1152,15 @@ class MarketMakingStrategy(BaseStrategy):
         # Strategy state
         self._is_running = False
         self._last_quote_update = {}
-        self._last_order_time = 0
+        self._last_order_time_by_mkt: Dict[str, float] = {}  # Per-market order spacing
+        
+        # Debounced quote scheduler: triggers only mark a market dirty, one
+        # drain task per market coalesces bursts into a single _place_quotes
+        self._quote_dirty: Dict[str, asyncio.Event] = {}
+        self._quote_tasks: Dict[str, asyncio.Task] = {}
+        self._quote_placing: Set[str] = set()  # Markets with _place_quotes in flight
+        # (market_id, token_id) pairs with an _exit_inventory call in progress
+        self._unwinding_in_flight: Set[Tuple[str, str]] = set()
         self._last_fill_sync = 0
         self._fill_sync_interval = 1  # Check fills every 1 second (institutional-grade)
         
@@ -941,6 +1190,8 @@ class MarketMakingStrategy(BaseStrategy):
         
         # Toxic flow filter (Z-Score vs OBI momentum conflict)
         self._toxic_flow_paused: Dict[str, float] = {}  # market_id -> resume_time
+        # Price jump filter (micro/mid divergence), keyed by the raw token_id
+        self._price_jump_paused: Dict[str, float] = {}  # token_id -> resume_time
         
         # CRITICAL FIX #1: Arb execution pause (prevents inventory race condition)
         self._arb_paused_markets: set = set()  # Markets paused during arb execution
@@ -961,7 +1212,7 @@ class MarketMakingStrategy(BaseStrategy):
         # - Widen spreads (reduce adverse selection)
         # - Flatten inventory faster (reduce directional exposure)
         # - Protect against being run over
-        self._consecutive_fills: Dict[str, List[Tuple[str, float]]] = {}  # market_id -> [(side, timestamp)]
+        self._consecutive_fills: Dict[str, deque] = {}  # market_id -> deque[(side, timestamp)], oldest first
         self._toxic_flow_gamma_boost: Dict[str, float] = {}  # market_id -> expiry_time
         self._toxic_flow_gamma_multiplier = 1.5  # 50% increase
         self._toxic_flow_cooldown_seconds = 300  # 5 minutes
@@ -1022,6 +1273,9 @@ class MarketMakingStrategy(BaseStrategy):
             f"[MM_RESUME] ▶️  Resumed quoting on {market_id[:8]}... "
             f"(arb execution complete)"
         )
+        
+        if market_id in self._positions:
+            self._schedule_quote_update(market_id)
     
     def _is_arb_paused(self, market_id: str) -> bool:
         """
@@ -1129,6 +1383,9 @@ class MarketMakingStrategy(BaseStrategy):
                     # This fill belongs to this market
                     is_buy = (fill.side.upper() == 'BUY')
                     
+                    # Filled (even partially) - cached resting size is stale now
+                    self.order_manager.discard_open_order(fill.order_id)
+                    
                     # CRITICAL: IMMEDIATE CANCEL ON FILL (High-Priority Callback)
                     # Cancel opposite side BEFORE updating inventory to minimize exposure window
                     if is_buy:
@@ -1136,7 +1393,7 @@ class MarketMakingStrategy(BaseStrategy):
                         if fill.asset_id in position.active_asks:
                             ask_order_id = position.active_asks[fill.asset_id]
                             try:
-                                await self.client.cancel_order(ask_order_id)
+                                await self._cancel_order(ask_order_id)
                                 logger.warning(
                                     f"🚨 IMMEDIATE CANCEL: ASK {ask_order_id[:8]}... cancelled "
                                     f"after BID fill to prevent double-exposure"
@@ -1149,7 +1406,7 @@ class MarketMakingStrategy(BaseStrategy):
                         if fill.asset_id in position.active_bids:
                             bid_order_id = position.active_bids[fill.asset_id]
                             try:
-                                await self.client.cancel_order(bid_order_id)
+                                await self._cancel_order(bid_order_id)
                                 logger.warning(
                                     f"🚨 IMMEDIATE CANCEL: BID {bid_order_id[:8]}... cancelled "
                                     f"after ASK fill to prevent double-exposure"
@@ -1192,10 +1449,7 @@ class MarketMakingStrategy(BaseStrategy):
                     )
                     
                     # Remove filled order from tracking
-                    if fill.order_id in position.active_bids.values():
-                        position.active_bids = {k: v for k, v in position.active_bids.items() if v != fill.order_id}
-                    if fill.order_id in position.active_asks.values():
-                        position.active_asks = {k: v for k, v in position.active_asks.items() if v != fill.order_id}
+                    position.remove_active_order(fill.order_id)
                     
                     self._total_fills += 1
                     break
@@ -1243,29 +1497,25 @@ class MarketMakingStrategy(BaseStrategy):
             timestamp: When fill occurred
         """
         # Initialize tracking for this market
-        if market_id not in self._consecutive_fills:
-            self._consecutive_fills[market_id] = []
+        recent_fills = self._consecutive_fills.get(market_id)
+        if recent_fills is None:
+            recent_fills = self._consecutive_fills[market_id] = deque()
         
         # Add this fill
-        self._consecutive_fills[market_id].append((side, timestamp))
+        recent_fills.append((side, timestamp))
         
-        # Clean old fills (outside 10-second window)
+        # Clean old fills (outside 10-second window). Fills arrive in time
+        # order, so expired ones are always at the left end.
         cutoff_time = timestamp - 10.0
-        self._consecutive_fills[market_id] = [
-            (s, t) for s, t in self._consecutive_fills[market_id]
-            if t >= cutoff_time
-        ]
-        
-        recent_fills = self._consecutive_fills[market_id]
+        while recent_fills[0][1] < cutoff_time:
+            recent_fills.popleft()
         
         # Check for toxic pattern: 3+ consecutive same-side fills
         if len(recent_fills) >= 3:
-            last_3_sides = [s for s, t in recent_fills[-3:]]
-            
             # All 3 are same side?
-            if len(set(last_3_sides)) == 1:
+            if recent_fills[-2][0] == side and recent_fills[-3][0] == side:
                 # TOXIC FLOW DETECTED
-                dominant_side = last_3_sides[0]
+                dominant_side = side
                 
                 # Only boost gamma if not already boosted
                 if market_id not in self._toxic_flow_gamma_boost:
@@ -1364,6 +1614,19 @@ class MarketMakingStrategy(BaseStrategy):
         except Exception as e:
             logger.error(f"Failed to schedule flash cancel: {e}", exc_info=True)
     
+    async def _cancel_order(self, order_id: str) -> None:
+        """
+        Cancel a quote and stop tracking it in the order manager's cache
+        
+        Every strategy-side cancel goes through here so the open-order cache
+        never answers for a dead order. The entry is dropped even if the
+        cancel raises: a cache miss only costs one get_order call.
+        """
+        try:
+            await self.client.cancel_order(order_id)
+        finally:
+            self.order_manager.discard_open_order(order_id)
+    
     async def _emergency_cancel_all_orders(self) -> None:
         """
         Emergency cancellation of ALL active orders across all positions
@@ -1376,7 +1639,7 @@ class MarketMakingStrategy(BaseStrategy):
                 # Cancel all bids
                 for token_id, order_id in list(position.active_bids.items()):
                     try:
-                        await self.client.cancel_order(order_id)
+                        await self._cancel_order(order_id)
                         cancel_count += 1
                         del position.active_bids[token_id]
                     except Exception as e:
@@ -1385,7 +1648,7 @@ class MarketMakingStrategy(BaseStrategy):
                 # Cancel all asks
                 for token_id, order_id in list(position.active_asks.items()):
                     try:
-                        await self.client.cancel_order(order_id)
+                        await self._cancel_order(order_id)
                         cancel_count += 1
                         del position.active_asks[token_id]
                     except Exception as e:
@@ -1413,6 +1676,9 @@ class MarketMakingStrategy(BaseStrategy):
             await self._rehydrate_positions()
             self._positions_rehydrated = True
         
+        error_backoff = 10
+        consecutive_errors = 0
+        
         try:
             while self._is_running:
                 try:
@@ -1431,14 +1697,31 @@ class MarketMakingStrategy(BaseStrategy):
                     await self._check_markout_pnl()  # Track post-trade alpha
                     await self._update_quotes()
                     await self._check_risk_limits()
+                    error_backoff = 10
+                    consecutive_errors = 0
                     await asyncio.sleep(MM_POSITION_CHECK_INTERVAL)
                     
                 except asyncio.CancelledError:
                     logger.info("MarketMakingStrategy cancelled")
                     break
                 except Exception as e:
-                    logger.error(f"Error in market making loop: {e}", exc_info=True)
-                    await asyncio.sleep(10)
+                    consecutive_errors += 1
+                    # Full traceback once per outage, one-liners after that
+                    logger.error(
+                        f"Error in market making loop (failure #{consecutive_errors}, "
+                        f"retrying in {error_backoff}s): {e}",
+                        exc_info=consecutive_errors == 1
+                    )
+                    # Quotes may still be resting - a failure earlier in the
+                    # cycle must not skip the risk pass
+                    try:
+                        await self._check_risk_limits()
+                    except Exception as risk_error:
+                        logger.error(f"Risk check failed during loop backoff: {risk_error}")
+                    await asyncio.sleep(error_backoff)
+                    # Never back off past the healthy loop's cadence, so risk
+                    # checks run at least as often while the loop is failing
+                    error_backoff = min(error_backoff * 2, MM_POSITION_CHECK_INTERVAL)
                     
         finally:
             self._is_running = False
@@ -1454,12 +1737,15 @@ class MarketMakingStrategy(BaseStrategy):
         """Clean shutdown"""
         logger.info("MarketMaking shutdown: Cancelling all orders...")
         
+        for market_id in list(self._quote_tasks):
+            await self._stop_quote_loop(market_id)
+        
         for market_id, position in self._positions.items():
-            all_order_ids = list(position.active_bids.values()) + list(position.active_asks.values())
+            all_order_ids = (*position.active_bids.values(), *position.active_asks.values())
             
             for order_id in all_order_ids:
                 try:
-                    await self.client.cancel_order(order_id)
+                    await self._cancel_order(order_id)
                 except:
                     pass
             
@@ -1548,7 +1834,7 @@ class MarketMakingStrategy(BaseStrategy):
                 
                 # Get market details
                 try:
-                    market = await self.client.get_market(market_id)
+                    market = await self.client.get_market_metadata(market_id)
                     if not market:
                         continue
                     
@@ -1562,7 +1848,7 @@ class MarketMakingStrategy(BaseStrategy):
                     
                     # Restore inventory
                     avg_price = float(position.get('avg_entry_price', 0.5))
-                    self._positions[market_id].inventory[token_id] = int(size)
+                    self._positions[market_id].set_inventory(token_id, int(size))
                     self._positions[market_id].cost_basis[token_id] = avg_price
                     
                     logger.info(
@@ -1703,114 +1989,125 @@ class MarketMakingStrategy(BaseStrategy):
             # INSTITUTIONAL UPGRADE: Dynamic tag discovery with fallback
             active_tags = await self.tag_manager.get_active_tags()
             
-            async with aiohttp.ClientSession() as session:
-                if active_tags:
-                    # SERVER-SIDE TAG FILTERING (Polymarket Q35/Q39/Q40 Best Practice)
-                    # Use /events endpoint - most efficient, includes markets array
-                    logger.info(f"Using /events endpoint with {len(active_tags)} tags (dynamic discovery)")
-                    
-                    for tag_id in active_tags:
-                        # Build Gamma API URL with tag_id parameter (Q40: limit/offset pagination)
-                        url = f"{POLYMARKET_GAMMA_API_URL}/events"
-                        
-                        # Paginate through events for this tag
-                        offset = 0
-                        limit = 50  # Q40: limit=50 is documented example
-                        max_pages = 5  # Safety limit per tag
-                        
-                        for page in range(max_pages):
-                            params = {
-                                'tag_id': tag_id,
-                                'active': 'true',
-                                'closed': 'false',
-                                'limit': str(limit),
-                                'offset': str(offset)
-                            }
-                            
-                            try:
-                                # Fetch from Gamma API /events endpoint
-                                async with session.get(url, params=params, timeout=10) as resp:
-                                    if resp.status != 200:
-                                        logger.warning(f"Gamma API error for tag_id={tag_id}: {resp.status}")
-                                        break
-                                    
-                                    events = await resp.json()
-                                    
-                                    if not events or len(events) == 0:
-                                        break  # No more events for this tag
-                                    
-                                    # Extract markets from events (Q39: event.markets array)
-                                    tag_markets_count = 0
-                                    for event in events:
-                                        event_markets = event.get('markets', [])
-                                        all_markets.extend(event_markets)
-                                        tag_markets_count += len(event_markets)
-                                    
-                                    logger.debug(
-                                        f"[EVENTS API] tag_id={tag_id} page={page+1}: "
-                                        f"{len(events)} events, {tag_markets_count} markets"
-                                    )
-                                    
-                                    # Check if we got fewer results than limit (last page)
-                                    if len(events) < limit:
-                                        break
-                                    
-                                    offset += limit
-                                    await asyncio.sleep(0.1)  # Rate limiting
-                            
-                            except Exception as e:
-                                logger.error(f"Error fetching events for tag_id={tag_id} page={page}: {e}")
-                                break
-                    
-                    # Remove duplicates (markets can have multiple tags)
-                    unique_markets = {}
-                    for market in all_markets:
-                        market_id = market.get('id')
-                        if market_id and market_id not in unique_markets:
-                            unique_markets[market_id] = market
-                    
-                    all_markets = list(unique_markets.values())
-                    logger.info(f"[EVENTS API] Total unique markets: {len(all_markets)} (from {len(active_tags)} tags)")
-                    
-                else:
-                    # NO TAG FILTERING: Fetch all active markets (fallback)
-                    logger.warning("Active tags list is empty - fetching ALL active events (not recommended)")
+            # Shared pooled client session: keep-alive across scans and tag pages
+            session = self.client.get_http_session()
+            if active_tags:
+                # SERVER-SIDE TAG FILTERING (Polymarket Q35/Q39/Q40 Best Practice)
+                # Use /events endpoint - most efficient, includes markets array
+                logger.info(f"Using /events endpoint with {len(active_tags)} tags (dynamic discovery)")
+                
+                url = f"{POLYMARKET_GAMMA_API_URL}/events"
+                limit = 50  # Q40: limit=50 is documented example
+                max_pages = 5  # Safety limit per tag
+                
+                async def fetch_tag_markets(tag_id: str) -> List[Dict[str, Any]]:
+                    """Paginate one tag; pages are paced by the shared Gamma token bucket"""
+                    tag_markets = []
                     offset = 0
-                    limit = 50
-                    max_pages = 10
                     
                     for page in range(max_pages):
-                        url = f"{POLYMARKET_GAMMA_API_URL}/events"
                         params = {
+                            'tag_id': tag_id,
                             'active': 'true',
                             'closed': 'false',
                             'limit': str(limit),
                             'offset': str(offset)
                         }
                         
-                        async with session.get(url, params=params, timeout=10) as resp:
-                            if resp.status != 200:
-                                logger.error(f"Gamma API error: {resp.status}")
-                                break
-                            
-                            events = await resp.json()
-                            
-                            if not events or len(events) == 0:
-                                break
-                            
-                            # Extract markets from events
-                            for event in events:
-                                event_markets = event.get('markets', [])
-                                all_markets.extend(event_markets)
-                            
-                            logger.debug(f"Fetched page {page+1}: {len(events)} events, {len(all_markets)} total markets")
-                            
-                            # Check if last page
-                            if len(events) < limit:
-                                break
+                        try:
+                            await GAMMA_READ_RATE_LIMITER.acquire()
                             
-                            offset += limit
-            
+                            # Fetch from Gamma API /events endpoint
+                            async with session.get(url, params=params, timeout=10) as resp:
+                                if resp.status != 200:
+                                    logger.warning(f"Gamma API error for tag_id={tag_id}: {resp.status}")
+                                    break
+                                
+                                events = await resp.json()
+                                
+                                if not events or len(events) == 0:
+                                    break  # No more events for this tag
+                                
+                                # Extract markets from events (Q39: event.markets array)
+                                tag_markets_count = 0
+                                for event in events:
+                                    event_markets = event.get('markets', [])
+                                    tag_markets.extend(event_markets)
+                                    tag_markets_count += len(event_markets)
+                                
+                                logger.debug(
+                                    f"[EVENTS API] tag_id={tag_id} page={page+1}: "
+                                    f"{len(events)} events, {tag_markets_count} markets"
+                                )
+                                
+                                # Check if we got fewer results than limit (last page)
+                                if len(events) < limit:
+                                    break
+                                
+                                offset += limit
+                        
+                        except Exception as e:
+                            logger.error(f"Error fetching events for tag_id={tag_id} page={page}: {e}")
+                            break
+                    
+                    return tag_markets
+                
+                # Tags are independent - overlap their pagination instead of
+                # walking them one sleep at a time
+                for tag_markets in await asyncio.gather(
+                    *(fetch_tag_markets(tag_id) for tag_id in active_tags)
+                ):
+                    all_markets.extend(tag_markets)
+                
+                # Remove duplicates (markets can have multiple tags)
+                unique_markets = {}
+                for market in all_markets:
+                    market_id = market.get('id')
+                    if market_id and market_id not in unique_markets:
+                        unique_markets[market_id] = market
+                
+                all_markets = list(unique_markets.values())
+                logger.info(f"[EVENTS API] Total unique markets: {len(all_markets)} (from {len(active_tags)} tags)")
+                
+            else:
+                # NO TAG FILTERING: Fetch all active markets (fallback)
+                logger.warning("Active tags list is empty - fetching ALL active events (not recommended)")
+                offset = 0
+                limit = 50
+                max_pages = 10
+                
+                for page in range(max_pages):
+                    url = f"{POLYMARKET_GAMMA_API_URL}/events"
+                    params = {
+                        'active': 'true',
+                        'closed': 'false',
+                        'limit': str(limit),
+                        'offset': str(offset)
+                    }
+                    
+                    async with session.get(url, params=params, timeout=10) as resp:
+                        if resp.status != 200:
+                            logger.error(f"Gamma API error: {resp.status}")
+                            break
+                        
+                        events = await resp.json()
+                        
+                        if not events or len(events) == 0:
+                            break
+                        
+                        # Extract markets from events
+                        for event in events:
+                            event_markets = event.get('markets', [])
+                            all_markets.extend(event_markets)
+                        
+                        logger.debug(f"Fetched page {page+1}: {len(events)} events, {len(all_markets)} total markets")
+                        
+                        # Check if last page
+                        if len(events) < limit:
+                            break
+                        
+                        offset += limit
+        
             logger.debug(f"Total markets fetched from Gamma API /events: {len(all_markets)}")
             
             # PRE-EMPTIVE BLACKLIST FILTERING (before order book analysis)
@@ -1832,10 +2129,13 @@ class MarketMakingStrategy(BaseStrategy):
                 'passed': 0
             }
             
-            # Filter for eligible markets with detailed tracking
+            # Filter for eligible markets with detailed tracking. The adaptive
+            # volume threshold depends only on allocated capital, so it is
+            # resolved once per scan rather than once per market.
+            dynamic_threshold = self._calculate_dynamic_min_volume()
             eligible = []
             for m in filtered_markets:
-                is_eligible, reason = self._is_market_eligible_debug(m)
+                is_eligible, reason = self._is_market_eligible_debug(m, dynamic_threshold)
                 if is_eligible:
                     eligible.append(m)
                     rejection_stats['passed'] += 1
@@ -1850,8 +2150,6 @@ class MarketMakingStrategy(BaseStrategy):
                 reverse=True
             )[:MM_MAX_MARKETS * 3]
             
-            # Calculate current dynamic threshold for logging transparency
-            dynamic_threshold = self._calculate_dynamic_min_volume()
             null_vol_high_liq = getattr(self, '_null_vol_high_liq_count', 0)
             
             logger.info(
@@ -1882,9 +2180,16 @@ class MarketMakingStrategy(BaseStrategy):
         except Exception as e:
             logger.error(f"Error scanning markets: {e}", exc_info=True)
     
-    def _is_market_eligible_debug(self, market: Dict[str, Any]) -> Tuple[bool, str]:
+    def _is_market_eligible_debug(
+        self,
+        market: Dict[str, Any],
+        dynamic_min_volume: Optional[Decimal] = None
+    ) -> Tuple[bool, str]:
         """Debug version that returns (is_eligible, rejection_reason)
         
+        dynamic_min_volume: threshold from _calculate_dynamic_min_volume();
+        market scans pass it in so it is computed once per scan.
+        
         INSTITUTIONAL FILTERING (Jan 2026 - Polymarket Support Guidance):
         - Focus on market microstructure and execution safety
         - Do NOT infer volume from liquidity (not documented/recommended)
@@ -1913,7 +2218,6 @@ class MarketMakingStrategy(BaseStrategy):
         # Must parse JSON first, then check length
         
         # Try multiple fields for redundancy (outcomes, outcomePrices, clobTokenIds)
-        import json
         outcome_count = None
         
         # Method 1: Parse outcomes field
@@ -2000,7 +2304,7 @@ class MarketMakingStrategy(BaseStrategy):
             liquidity_num = Decimal(str(market.get('liquidityNum', 0)))
             
             # Accept markets with strong liquidity despite null volume
-            if liquidity_num >= Decimal(str(MM_MIN_LIQUIDITY_DEPTH * 10)):
+            if liquidity_num >= _NULL_VOLUME_MIN_LIQUIDITY:
                 # High liquidity threshold: 10x minimum (e.g., $200 for $20 min)
                 if not hasattr(self, '_null_vol_high_liq_count'):
                     self._null_vol_high_liq_count = 0
@@ -2014,17 +2318,21 @@ class MarketMakingStrategy(BaseStrategy):
             else:
                 return (False, 'null_volume')
         
-        dynamic_min_volume = self._calculate_dynamic_min_volume()
+        if dynamic_min_volume is None:
+            dynamic_min_volume = self._calculate_dynamic_min_volume()
         
         # INSTITUTIONAL VOLUME FILTERING (Polymarket Support - Jan 2026)
         # Require actual volume data - do NOT infer from liquidity
         if volume_24h < dynamic_min_volume:
-            ticker = market.get('ticker', market.get('question', 'Unknown')[:30])
-            logger.debug(
-                f"Market {ticker} rejected. "
-                f"Volume ${volume_24h:.2f} ({volume_source}) < ${dynamic_min_volume:.2f} "
-                f"(balance: ${self._allocated_capital:.2f}, {MM_MAX_MARKETS} markets, {MM_VOLUME_MULTIPLIER}x)"
-            )
+            # Most scanned markets land here: only build the reject line when DEBUG is on
+            if logger.isEnabledFor(logging.DEBUG):
+                ticker = market.get('ticker') or market.get('question', 'Unknown')[:30]
+                logger.debug(
+                    "Market %s rejected. Volume $%.2f (%s) < $%.2f "
+                    "(balance: $%.2f, %s markets, %sx)",
+                    ticker, volume_24h, volume_source, dynamic_min_volume,
+                    self._allocated_capital, MM_MAX_MARKETS, MM_VOLUME_MULTIPLIER
+                )
             return (False, 'low_volume')
         
         # Active market check (official Gamma fields: active, closed)
@@ -2538,7 +2846,7 @@ class MarketMakingStrategy(BaseStrategy):
                 del self._positions[market_id]
                 return
         
-        await self._place_quotes(market_id)
+        self._schedule_quote_update(market_id)
     
     async def _sync_fills(self) -> None:
         """Critical: Detect order fills and update inventory tracking"""
@@ -2548,50 +2856,68 @@ class MarketMakingStrategy(BaseStrategy):
         
         self._last_fill_sync = current_time
         
-        for market_id, position in list(self._positions.items()):
-            all_order_ids = list(position.active_bids.values()) + list(position.active_asks.values())
-            
-            for order_id in all_order_ids:
-                try:
-                    order = await self.order_manager.get_order(order_id)
-                    if not order:
+        # Pass 1: snapshot every resting order so status queries can overlap
+        candidates = [
+            (market_id, position, order_id)
+            for market_id, position in list(self._positions.items())
+            for order_id in (*position.active_bids.values(), *position.active_asks.values())
+        ]
+        if not candidates:
+            return
+        
+        # Pass 2: one concurrent round of lookups instead of one RTT per order
+        sem = asyncio.Semaphore(MM_MAX_CONCURRENT_FILL_QUERIES)
+        
+        async def fetch(order_id: str) -> Optional[Dict[str, Any]]:
+            async with sem:
+                return await self.order_manager.get_order(order_id)
+        
+        orders = await asyncio.gather(
+            *(fetch(order_id) for _, _, order_id in candidates),
+            return_exceptions=True
+        )
+        
+        # Pass 3: apply fills in snapshot order
+        for (market_id, position, order_id), order in zip(candidates, orders):
+            if isinstance(order, Exception):
+                logger.debug(f"Error syncing fill for order {order_id[:8]}...: {order}")
+                continue
+            try:
+                if not order:
+                    continue
+                
+                status = order.get('status')
+                if status in ['filled', 'partially_filled']:
+                    # Order was filled - update inventory
+                    token_id = order.get('asset_id') or order.get('token_id')
+                    if not token_id:
                         continue
                     
-                    status = order.get('status')
-                    if status in ['filled', 'partially_filled']:
-                        # Order was filled - update inventory
-                        token_id = order.get('asset_id') or order.get('token_id')
-                        if not token_id:
-                            continue
+                    filled_size = float(order.get('size_matched', 0))
+                    price = float(order.get('price', 0))
+                    side = order.get('side', '')
+                    
+                    if filled_size > 0 and token_id in position.inventory:
+                        is_buy = (side.upper() == 'BUY')
+                        position.update_inventory(token_id, int(filled_size), price, is_buy)
                         
-                        filled_size = float(order.get('size_matched', 0))
-                        price = float(order.get('price', 0))
-                        side = order.get('side', '')
+                        # CRITICAL: Get micro-price at fill time for markout tracking
+                        prices = await self._get_market_prices(market_id, [token_id])
+                        micro_price = prices.get(token_id, price)  # Fallback to fill price
+                        position.record_fill_for_markout(token_id, side, price, micro_price, filled_size)
                         
-                        if filled_size > 0 and token_id in position.inventory:
-                            is_buy = (side.upper() == 'BUY')
-                            position.update_inventory(token_id, int(filled_size), price, is_buy)
-                            
-                            # CRITICAL: Get micro-price at fill time for markout tracking
-                            prices = await self._get_market_prices(market_id, [token_id])
-                            micro_price = prices.get(token_id, price)  # Fallback to fill price
-                            position.record_fill_for_markout(token_id, side, price, micro_price, filled_size)
-                            
-                            logger.info(
-                                f"[MM] Fill detected: {side} {filled_size:.1f} @ {price:.4f} "
-                                f"(Inventory: {position.inventory[token_id]}, Micro: {micro_price:.4f})"
-                            )
-                            
-                            # Remove filled order from active tracking
-                            if order_id in position.active_bids.values():
-                                position.active_bids = {k: v for k, v in position.active_bids.items() if v != order_id}
-                            if order_id in position.active_asks.values():
-                                position.active_asks = {k: v for k, v in position.active_asks.items() if v != order_id}
-                            
-                            self._total_fills += 1
-                    
-                except Exception as e:
-                    logger.debug(f"Error syncing fill for order {order_id[:8]}...: {e}")
+                        logger.info(
+                            f"[MM] Fill detected: {side} {filled_size:.1f} @ {price:.4f} "
+                            f"(Inventory: {position.inventory[token_id]}, Micro: {micro_price:.4f})"
+                        )
+                        
+                        # Remove filled order from active tracking
+                        position.remove_active_order(order_id)
+                        
+                        self._total_fills += 1
+                
+            except Exception as e:
+                logger.debug(f"Error syncing fill for order {order_id[:8]}...: {e}")
     
     async def _update_quotes(self) -> None:
         """
@@ -2653,14 +2979,10 @@ class MarketMakingStrategy(BaseStrategy):
             if current_time - last_update >= MM_QUOTE_UPDATE_INTERVAL:
                 markets_to_update.append(market_id)
         
-        # Update all markets in parallel (lower latency)
-        if markets_to_update:
-            await asyncio.gather(
-                *[self._refresh_quotes(m_id) for m_id in markets_to_update],
-                return_exceptions=True
-            )
-            for m_id in markets_to_update:
-                self._last_quote_update[m_id] = current_time
+        # Mark markets dirty - each market's quote loop drains independently and
+        # stamps _last_quote_update once the update has actually run
+        for m_id in markets_to_update:
+            await self._refresh_quotes(m_id)
     
     async def _cancel_all_quotes(self) -> None:
         """
@@ -2670,25 +2992,32 @@ class MarketMakingStrategy(BaseStrategy):
         """
         logger.warning("[EMERGENCY] Cancelling all active quotes...")
         
-        cancel_count = 0
-        for position in self._positions.values():
-            # Cancel all bids
-            for order_id in list(position.active_bids.values()):
-                try:
-                    await self.client.cancel_order(order_id)
-                    cancel_count += 1
-                except Exception as e:
-                    logger.debug(f"Failed to cancel bid {order_id[:8]}...: {e}")
-            
-            # Cancel all asks
-            for order_id in list(position.active_asks.values()):
+        # Bounded concurrency: cancels overlap instead of one RTT per order
+        sem = asyncio.Semaphore(MM_MAX_CONCURRENT_CANCELS)
+        
+        async def cancel(order_id: str, side: str) -> bool:
+            async with sem:
                 try:
-                    await self.client.cancel_order(order_id)
-                    cancel_count += 1
+                    await self._cancel_order(order_id)
+                    return True
                 except Exception as e:
-                    logger.debug(f"Failed to cancel ask {order_id[:8]}...: {e}")
-            
-            # Clear tracking
+                    logger.debug(f"Failed to cancel {side} {order_id[:8]}...: {e}")
+                    return False
+        
+        # Snapshot once - fill callbacks may mutate the dicts while we await
+        positions = list(self._positions.values())
+        cancels = []
+        for position in positions:
+            cancels.extend(cancel(order_id, 'bid') for order_id in position.active_bids.values())
+            cancels.extend(cancel(order_id, 'ask') for order_id in position.active_asks.values())
+        
+        cancel_count = 0
+        for next_done in asyncio.as_completed(cancels):
+            if await next_done:
+                cancel_count += 1
+        
+        # Clear tracking
+        for position in positions:
             position.active_bids.clear()
             position.active_asks.clear()
         
@@ -2701,11 +3030,15 @@ class MarketMakingStrategy(BaseStrategy):
         # Check if existing order is close enough (within 1 tick)
         if current_order_id:
             try:
-                curr_order = await self.order_manager.get_order(current_order_id)
+                # Local cache first - falls back to the API only on a miss
+                curr_order = (
+                    self.order_manager.get_open_order_sync(current_order_id)
+                    or await self.order_manager.get_order(current_order_id)
+                )
                 if curr_order and curr_order.get('status') == 'open':
                     curr_price = float(curr_order['price'])
                     if abs(curr_price - target_price) < 0.001:
-                        logger.debug(f"[MM] Preserving {side} queue priority at {curr_price:.4f}")
+                        logger.debug("[MM] Preserving %s queue priority at %.4f", side, curr_price)
                         return current_order_id
             except:
                 pass
@@ -2713,7 +3046,7 @@ class MarketMakingStrategy(BaseStrategy):
         # Need to update - cancel old
         if current_order_id:
             try:
-                await self.client.cancel_order(current_order_id)
+                await self._cancel_order(current_order_id)
             except:
                 pass
         
@@ -2729,25 +3062,24 @@ class MarketMakingStrategy(BaseStrategy):
                     post_only=True
                 )
                 if new_order and new_order.get('order_id'):
-                    logger.info(f"[MM] {side} updated: {token_id[:8]}... @{target_price:.4f}")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"[MM] {side} updated: {token_id[:8]}... @{target_price:.4f}")
                     return new_order['order_id']
-            except Exception as e:
-                error_msg = str(e).lower()
+            except PostOnlyOrderRejectedError:
                 # Post-only rejection: price would cross spread
-                if 'post' in error_msg or 'cross' in error_msg or 'immediate' in error_msg:
-                    # Back off price by 1 tick and retry
-                    if side == 'BUY':
-                        target_price -= 0.001
-                        target_price = max(0.01, target_price)
-                    else:
-                        target_price += 0.001
-                        target_price = min(0.99, target_price)
-                    
-                    logger.debug(f"[MM] post_only rejected, retry {attempt+1} @ {target_price:.4f}")
-                    continue
+                # Back off price by 1 tick and retry
+                if side == 'BUY':
+                    target_price -= 0.001
+                    target_price = max(0.01, target_price)
                 else:
-                    logger.warning(f"Failed to place {side}: {e}")
-                    break
+                    target_price += 0.001
+                    target_price = min(0.99, target_price)
+                
+                logger.debug("[MM] post_only rejected, retry %d @ %.4f", attempt + 1, target_price)
+                continue
+            except Exception as e:
+                logger.warning(f"Failed to place {side}: {e}")
+                break
         
         # CRITICAL: If all retries failed, enter INVENTORY DEFENSE MODE
         # Market is moving too fast - stop trying to quote and focus on unwinding
@@ -2789,6 +3121,9 @@ class MarketMakingStrategy(BaseStrategy):
         # Previous: Static sleep (MM_MIN_ORDER_SPACING = 2s) - too rigid
         await ORDER_PLACEMENT_RATE_LIMITER.acquire(cost=1.0)
         
+        # Single clock read per quote cycle (refreshed only after long awaits)
+        now = time.time()
+        
         # ═══════════════════════════════════════════════════════════════════
         # INSTITUTIONAL CIRCUIT BREAKER: LATENCY-BASED KILL SWITCH (2026)
         # ═══════════════════════════════════════════════════════════════════
@@ -2847,10 +3182,10 @@ class MarketMakingStrategy(BaseStrategy):
                 # Cancel any existing orders (while still possible)
                 position = self._positions.get(market_id)
                 if position:
-                    all_order_ids = list(position.active_bids.values()) + list(position.active_asks.values())
+                    all_order_ids = (*position.active_bids.values(), *position.active_asks.values())
                     for order_id in all_order_ids:
                         try:
-                            await self.client.cancel_order(order_id)
+                            await self._cancel_order(order_id)
                             logger.info(f"Cancelled order {order_id[:8]}... on resolved market")
                         except Exception as e:
                             logger.debug(f"Failed to cancel {order_id[:8]}... (may already be cancelled): {e}")
@@ -2871,18 +3206,18 @@ class MarketMakingStrategy(BaseStrategy):
         
         # CRITICAL: Check if in INVENTORY DEFENSE MODE
         # If fast market prevented quoting, stop trying and focus on unwinding
-        if market_id in self._inventory_defense_mode:
-            defense_end = self._inventory_defense_mode[market_id]
-            if time.time() < defense_end:
+        defense_end = self._inventory_defense_mode.get(market_id)
+        if defense_end is not None:
+            if now < defense_end:
                 logger.warning(
                     f"⚠️ INVENTORY DEFENSE MODE active for {market_id[:8]}... - "
-                    f"Skipping quotes, unwinding only ({defense_end - time.time():.0f}s remaining)"
+                    f"Skipping quotes, unwinding only ({defense_end - now:.0f}s remaining)"
                 )
                 # Cancel all existing quotes
                 position = self._positions[market_id]
-                for order_id in list(position.active_bids.values()) + list(position.active_asks.values()):
+                for order_id in (*position.active_bids.values(), *position.active_asks.values()):
                     try:
-                        await self.client.cancel_order(order_id)
+                        await self._cancel_order(order_id)
                     except:
                         pass
                 position.active_bids.clear()
@@ -2933,6 +3268,7 @@ class MarketMakingStrategy(BaseStrategy):
         # This prevents race condition where fills happen between sync cycles
         # Without this, inventory could be stale by up to 1 second
         await self._sync_fills()
+        now = time.time()  # Fill sync may have awaited REST round-trips
         
         position = self._positions[market_id]
         prices = await self._get_market_prices(market_id, position.token_ids)
@@ -2940,6 +3276,14 @@ class MarketMakingStrategy(BaseStrategy):
         if not prices:
             return
         
+        # Consistent snapshot per token for this decision step: Z-score,
+        # OBI and micro/mid reads below all see the same book state
+        if self._market_data_manager:
+            cache = self._market_data_manager.cache
+            snapshots = {tid: cache.get(tid) for tid in position.token_ids}
+        else:
+            snapshots = {}
+        
         # ═══════════════════════════════════════════════════════════════════
         # Z-SCORE MEAN REVERSION ALPHA UPDATE (INSTITUTIONAL UPGRADE 2026)
         # ═══════════════════════════════════════════════════════════════════
@@ -2954,7 +3298,7 @@ class MarketMakingStrategy(BaseStrategy):
                 logger.info(f"📊 Initialized Z-Score manager for {market_id[:8]}...")
             
             # Update Z-Score every 60 seconds (or first time)
-            current_time = time.time()
+            current_time = now
             z_manager = self._z_score_managers[market_id]
             last_update = self._last_z_score_update.get(market_id, 0)
             
@@ -2965,10 +3309,9 @@ class MarketMakingStrategy(BaseStrategy):
                 
                 # Get micro-price from WebSocket cache (real-time order book imbalance)
                 micro_price = None
-                if self._market_data_manager:
-                    snapshot = self._market_data_manager.cache.get(primary_token)
-                    if snapshot:
-                        micro_price = snapshot.micro_price
+                snapshot = snapshots.get(primary_token)
+                if snapshot:
+                    micro_price = snapshot.micro_price
                 
                 # Fallback to simple mid-price if micro-price unavailable
                 if not micro_price:
@@ -2978,11 +3321,14 @@ class MarketMakingStrategy(BaseStrategy):
                     z_score = z_manager.update(micro_price)
                     self._last_z_score_update[market_id] = current_time
                     
-                    logger.info(
-                        f"📊 Z-Score Update: {market_id[:8]}... - "
-                        f"micro=${micro_price:.4f}, Z={z_score:.2f}σ, "
-                        f"samples={len(z_manager.price_window)}/{Z_SCORE_LOOKBACK_PERIODS}"
-                    )
+                    # Steady-state logs: skip f-string formatting when INFO is off
+                    info_enabled = logger.isEnabledFor(logging.INFO)
+                    if info_enabled:
+                        logger.info(
+                            f"📊 Z-Score Update: {market_id[:8]}... - "
+                            f"micro=${micro_price:.4f}, Z={z_score:.2f}σ, "
+                            f"samples={len(z_manager.price_window)}/{Z_SCORE_LOOKBACK_PERIODS}"
+                        )
                     
                     # Log signal state
                     if z_manager.should_halt_trading():
@@ -2991,7 +3337,7 @@ class MarketMakingStrategy(BaseStrategy):
                             f"Z={z_score:.2f}σ exceeds {Z_SCORE_HALT_THRESHOLD:.1f}σ threshold - "
                             f"HALTING QUOTES (potential regime change)"
                         )
-                    elif z_manager.is_signal_active():
+                    elif info_enabled and z_manager.is_signal_active():
                         alpha_shift = z_manager.get_alpha_shift()
                         direction = "SELL bias" if alpha_shift < 0 else "BUY bias"
                         logger.info(
@@ -3015,12 +3361,9 @@ class MarketMakingStrategy(BaseStrategy):
                 z_score = z_manager.get_z_score()
                 
                 # Get OBI from market snapshot
-                primary_token = position.token_ids[0]
-                snapshot = self._market_data_manager.cache.get(primary_token) if self._market_data_manager else None
+                obi = getattr(snapshots.get(position.token_ids[0]), 'obi', None)
                 
-                if snapshot and hasattr(snapshot, 'obi'):
-                    obi = snapshot.obi
-                    
+                if obi is not None:
                     # Check for Z-Score vs OBI conflict (toxic flow)
                     # Z > 2.0 (overbought → expect DOWN) but OBI > 0.6 (heavy buying)
                     is_toxic_upward = (z_score > Z_SCORE_ENTRY_THRESHOLD and obi > MM_OBI_THRESHOLD)
@@ -3030,7 +3373,7 @@ class MarketMakingStrategy(BaseStrategy):
                     
                     if is_toxic_upward or is_toxic_downward:
                         # PAUSE quoting for this market
-                        pause_until = time.time() + MM_MOMENTUM_PROTECTION_TIME
+                        pause_until = now + MM_MOMENTUM_PROTECTION_TIME
                         self._toxic_flow_paused[market_id] = pause_until
                         
                         direction = "UPWARD" if is_toxic_upward else "DOWNWARD"
@@ -3041,9 +3384,9 @@ class MarketMakingStrategy(BaseStrategy):
                         )
                         
                         # Cancel all existing quotes
-                        for order_id in list(position.active_bids.values()) + list(position.active_asks.values()):
+                        for order_id in (*position.active_bids.values(), *position.active_asks.values()):
                             try:
-                                await self.client.cancel_order(order_id)
+                                await self._cancel_order(order_id)
                             except:
                                 pass
                         position.active_bids.clear()
@@ -3051,12 +3394,12 @@ class MarketMakingStrategy(BaseStrategy):
                         return
         
         # Check if toxic flow pause is active
-        if market_id in self._toxic_flow_paused:
-            pause_end = self._toxic_flow_paused[market_id]
-            if time.time() < pause_end:
+        pause_end = self._toxic_flow_paused.get(market_id)
+        if pause_end is not None:
+            if now < pause_end:
                 logger.debug(
                     f"⏸️ TOXIC FLOW PAUSE active for {market_id[:8]}... - "
-                    f"Resuming in {pause_end - time.time():.0f}s"
+                    f"Resuming in {pause_end - now:.0f}s"
                 )
                 return
             else:
@@ -3069,12 +3412,15 @@ class MarketMakingStrategy(BaseStrategy):
         if is_toxic:
             logger.warning(
                 f"🚨 TOXIC FLOW in {market_id[:8]}... - "
-                f"Recent fills: ${sum(v for _, _, v in position.recent_fills):.2f} - "
+                f"Recent fills: ${position.recent_fill_value:.2f} - "
                 f"WIDENING SPREAD"
             )
         
+        # Capital slice per market is the same for every token in this pass
+        capital_per_market = float(self._allocated_capital) / max(MM_MAX_MARKETS, 1)
+        
         for token_id in position.token_ids:
-            snapshot = self._market_data_manager.cache.get(token_id) if self._market_data_manager else None
+            snapshot = snapshots.get(token_id)
             if not snapshot:
                 continue
             
@@ -3104,31 +3450,25 @@ class MarketMakingStrategy(BaseStrategy):
             # Let the trending price action play out, then resume quoting once stable
             if mid_price > 0:
                 price_divergence = abs(micro_price - mid_price) / mid_price
-                DIVERGENCE_THRESHOLD = Decimal('0.005')  # 0.5% from settings
-                PAUSE_DURATION = 5  # seconds from settings
                 
-                if price_divergence > DIVERGENCE_THRESHOLD:
-                    pause_until = time.time() + PAUSE_DURATION
-                    pause_key = f"price_jump_{token_id}"
-                    self._toxic_flow_paused[pause_key] = pause_until
+                if price_divergence > _PRICE_JUMP_DIVERGENCE:
+                    self._price_jump_paused[token_id] = now + _PRICE_JUMP_PAUSE_SEC
                     
                     logger.warning(
                         f"⚠️ PRICE JUMP FILTER: {token_id[:8]}... - "
-                        f"Micro/Mid divergence: {price_divergence*100:.2f}% > {DIVERGENCE_THRESHOLD*100:.1f}% "
+                        f"Micro/Mid divergence: {price_divergence*100:.2f}% > {_PRICE_JUMP_DIVERGENCE*100:.1f}% "
                         f"(micro: ${micro_price:.4f}, mid: ${mid_price:.4f}) - "
-                        f"PAUSING quotes for {PAUSE_DURATION}s (trending market)"
+                        f"PAUSING quotes for {_PRICE_JUMP_PAUSE_SEC}s (trending market)"
                     )
                     continue  # Skip quoting for this token
                 
                 # Check if pause is still active
-                pause_key = f"price_jump_{token_id}"
-                if pause_key in self._toxic_flow_paused:
-                    pause_end = self._toxic_flow_paused[pause_key]
-                    if time.time() < pause_end:
-                        logger.debug(f"⏸️ Price jump pause active for {token_id[:8]}...")
+                pause_end = self._price_jump_paused.get(token_id)
+                if pause_end is not None:
+                    if now < pause_end:
+                        logger.debug("⏸️ Price jump pause active for %.8s...", token_id)
                         continue
-                    else:
-                        del self._toxic_flow_paused[pause_key]
+                    del self._price_jump_paused[token_id]
             
             # Use micro_price for reservation price calculation (better price discovery)
             base_price = micro_price
@@ -3159,9 +3499,8 @@ class MarketMakingStrategy(BaseStrategy):
             # Check for adverse selection via markout (institutional-grade)
             is_adverse = False
             if position.fill_count > 10:
-                avg_markout = position.total_markout_pnl / position.fill_count
-                if avg_markout < -0.005:  # -0.5 cents avg = being picked off
-                    is_adverse = True
+                # Memoized: -0.5 cents avg markout = being picked off
+                is_adverse = position.get_adverse_multiplier() > 1.0
                 
                 # ═══════════════════════════════════════════════════════════════════
                 # HYBRID QUOTE CALCULATION: Avellaneda-Stoikov + Z-Score Alpha
@@ -3177,8 +3516,7 @@ class MarketMakingStrategy(BaseStrategy):
                 )
                 
                 # Check for Z-Score halt (extreme outlier)
-                # Convert Decimal to float for comparison
-                if float(target_bid) == 0.0 and float(target_ask) == 999.99:
+                if target_bid == 0.0 and target_ask == 999.99:
                     logger.warning(
                         f"⚠️ Z-SCORE HALT: Skipping quotes for {token_id[:8]}... "
                         f"(Z={z_manager.get_z_score():.2f}σ > {Z_SCORE_HALT_THRESHOLD:.1f}σ)"
@@ -3215,67 +3553,26 @@ class MarketMakingStrategy(BaseStrategy):
                 # This prevents 0.000001 rounding errors from compounding to $0.50 losses
                 # ═══════════════════════════════════════════════════════════════════
                 
-                # Position sizing (convert Decimal to float for arithmetic)
-                target_bid_float = float(target_bid)
-                target_ask_float = float(target_ask)
-                
-                # Get accumulated dust for this token
-                dust_bid = position._accumulated_dust_bid.get(token_id, Decimal('0'))
-                dust_ask = position._accumulated_dust_ask.get(token_id, Decimal('0'))
-                
-                # Round prices with dust tracking
+                # Round prices with dust tracking, then fold any whole tick of
+                # accumulated dust (>= $0.001) back into each side's price
                 target_bid_rounded, new_dust_bid = self._round_price_to_tick(
-                    target_bid_float, 'BUY'
+                    float(target_bid), 'BUY'
                 )
                 target_ask_rounded, new_dust_ask = self._round_price_to_tick(
-                    target_ask_float, 'SELL'
+                    float(target_ask), 'SELL'
+                )
+                target_bid_float = position.compensate_dust(
+                    position._accumulated_dust_bid, token_id, target_bid_rounded, new_dust_bid, 'BID'
+                )
+                target_ask_float = position.compensate_dust(
+                    position._accumulated_dust_ask, token_id, target_ask_rounded, new_dust_ask, 'ASK'
                 )
-                
-                # Update accumulated dust
-                position._accumulated_dust_bid[token_id] = dust_bid + new_dust_bid
-                position._accumulated_dust_ask[token_id] = dust_ask + new_dust_ask
-                
-                # Compensate when dust >= 1 tick ($0.001)
-                tick_size = Decimal('0.001')
-                if abs(position._accumulated_dust_bid[token_id]) >= tick_size:
-                    compensation = (position._accumulated_dust_bid[token_id] // tick_size) * tick_size
-                    target_bid_rounded += float(compensation)
-                    position._accumulated_dust_bid[token_id] -= compensation
-                    position._dust_compensation_count += 1
-                    
-                    logger.debug(
-                        f"💰 DUST COMPENSATION (BID): Adjusted by ${float(compensation):+.4f} "
-                        f"(count: {position._dust_compensation_count})"
-                    )
-                
-                if abs(position._accumulated_dust_ask[token_id]) >= tick_size:
-                    compensation = (position._accumulated_dust_ask[token_id] // tick_size) * tick_size
-                    target_ask_rounded += float(compensation)
-                    position._accumulated_dust_ask[token_id] -= compensation
-                    position._dust_compensation_count += 1
-                    
-                    logger.debug(
-                        f"💰 DUST COMPENSATION (ASK): Adjusted by ${float(compensation):+.4f} "
-                        f"(count: {position._dust_compensation_count})"
-                    )
-                
-                # Use compensated rounded prices
-                target_bid_float = target_bid_rounded
-                target_ask_float = target_ask_rounded
-                
-                # Calculate dynamic position size
-                capital_per_market = float(self._allocated_capital) / max(MM_MAX_MARKETS, 1)
                 
                 # Size based on allocated capital: shares = capital / price
                 # Use bid/ask price to ensure we can afford the order
-                bid_size = capital_per_market / target_bid_float if target_bid_float > 0 else 0
-                ask_size = capital_per_market / target_ask_float if target_ask_float > 0 else 0
-                
-                # Reduce size when holding inventory
-                if inventory > 0:
-                    bid_size *= 0.5
-                elif inventory < 0:
-                    ask_size *= 0.5
+                bid_size, ask_size = _quote_sizes(
+                    capital_per_market, target_bid_float, target_ask_float, inventory
+                )
                 
                 # ═══════════════════════════════════════════════════════════════════
                 # MODULE 2: SKEW HYSTERESIS CHECK (Efficiency Guard)
@@ -3311,54 +3608,154 @@ class MarketMakingStrategy(BaseStrategy):
                 )
                 
                 # Execute simultaneously (prevents race condition)
-                results = await asyncio.gather(bid_task, ask_task, return_exceptions=True)
-                new_bid_id, new_ask_id = results
+                # return_exceptions keeps the surviving side's order id if the other
+                # raises (TaskGroup would cancel it mid-placement and orphan the order)
+                new_bid_id, new_ask_id = await asyncio.gather(
+                    bid_task, ask_task, return_exceptions=True
+                )
+                
+                # Surface failures once instead of silently dropping them
+                if isinstance(new_bid_id, BaseException):
+                    logger.error(f"[MM] BUY reconcile failed for {token_id[:8]}...: {new_bid_id}")
+                    new_bid_id = None
+                if isinstance(new_ask_id, BaseException):
+                    logger.error(f"[MM] SELL reconcile failed for {token_id[:8]}...: {new_ask_id}")
+                    new_ask_id = None
                 
-                # Update tracking (handle exceptions)
-                if isinstance(new_bid_id, str) and new_bid_id:
+                # Update tracking
+                if new_bid_id:
                     position.active_bids[token_id] = new_bid_id
                 elif current_bid_id:
                     position.active_bids.pop(token_id, None)
                 
-                if isinstance(new_ask_id, str) and new_ask_id:
+                if new_ask_id:
                     position.active_asks[token_id] = new_ask_id
                 elif current_ask_id:
                     position.active_asks.pop(token_id, None)
             
-            self._last_order_time = time.time()
+            self._last_order_time_by_mkt[market_id] = time.time()
     
     async def _refresh_quotes(self, market_id: str) -> None:
-        """Update quotes (uses smart reconciliation, not blind cancel)"""
-        await self._place_quotes(market_id)
+        """Request a quote update (coalesced by the market's quote loop)"""
+        self._schedule_quote_update(market_id)
     
-    def _calculate_micro_price(self, bids: list, asks: list) -> Optional[float]:
-        """Volume-Weighted Micro-Price (VWMP) - protects against adverse selection"""
+    def _schedule_quote_update(self, market_id: str) -> None:
+        """
+        Mark market dirty, starting its quote loop on first use
+        
+        Any number of triggers between drains collapse into one _place_quotes call.
+        """
+        event = self._quote_dirty.get(market_id)
+        if event is None:
+            if market_id not in self._positions:
+                return  # The loop would exit at once - nothing to quote
+            event = self._quote_dirty[market_id] = asyncio.Event()
+            task = asyncio.create_task(self._quote_loop(market_id))
+            # Under an eager task factory the loop may already have run (and
+            # cleaned up) inside create_task - never record a finished task
+            if not task.done():
+                self._quote_tasks[market_id] = task
+        event.set()
+    
+    async def _stop_quote_loop(self, market_id: str) -> None:
+        """
+        Stop the quote loop for a market (no-op wait when called from inside it)
+        
+        An idle loop (waiting for a trigger or sleeping out the spacing) is
+        cancelled. A loop in the middle of _place_quotes is left to finish that
+        iteration and then exits, so orders it posts are always recorded.
+        """
+        task = self._quote_tasks.pop(market_id, None)
+        event = self._quote_dirty.pop(market_id, None)
+        if task is None or task is asyncio.current_task():
+            return
+        if market_id not in self._quote_placing:
+            task.cancel()
+        elif event is not None:
+            event.set()  # Loop sees its event was detached after placing
+        await asyncio.gather(task, return_exceptions=True)
+    
+    async def _quote_loop(self, market_id: str) -> None:
+        """
+        Drain quote requests for one market at MM_MIN_ORDER_SPACING cadence
+        
+        Spacing is per market (no cross-market head-of-line blocking) and only
+        the remaining part of the interval is slept. Triggers arriving during
+        that wait coalesce into the same update.
+        Exits once the market is no longer an active position or the loop has
+        been stopped via _stop_quote_loop.
+        """
+        event = self._quote_dirty[market_id]
+        try:
+            while self._quote_loop_active(market_id, event):
+                await event.wait()
+                remain = MM_MIN_ORDER_SPACING - (
+                    time.time() - self._last_order_time_by_mkt.get(market_id, 0.0)
+                )
+                if remain > 0:
+                    await asyncio.sleep(remain)
+                event.clear()
+                if not self._quote_loop_active(market_id, event):
+                    break
+                self._quote_placing.add(market_id)
+                try:
+                    await self._place_quotes(market_id)
+                except Exception as e:
+                    logger.error(f"[MM] Quote update failed for {market_id[:8]}...: {e}", exc_info=True)
+                finally:
+                    self._quote_placing.discard(market_id)
+                self._last_quote_update[market_id] = time.time()
+        finally:
+            if self._quote_dirty.get(market_id) is event:
+                self._quote_dirty.pop(market_id, None)
+                self._quote_tasks.pop(market_id, None)
+                self._last_order_time_by_mkt.pop(market_id, None)
+    
+    def _quote_loop_active(self, market_id: str, event: asyncio.Event) -> bool:
+        """True while the market is quoted and the loop still owns its event"""
+        return market_id in self._positions and self._quote_dirty.get(market_id) is event
+    
+    def _calculate_micro_price(self, bids: list, asks: list,
+                               depth: int = MM_MICRO_PRICE_DEPTH_LEVELS) -> Optional[float]:
+        """Volume-Weighted Micro-Price (VWMP) - protects against adverse selection
+        
+        Multi-level VWMP over the top `depth` rungs of each side:
+            micro = Σ(bid_size_i × ask_i + ask_size_i × bid_i) / Σ(bid_size_i + ask_size_i)
+        
+        Levels are paired rung-by-rung (bid level i against ask level i), so a
+        book shallower than `depth` on one side only contributes matched rungs.
+        With depth=1 this reduces to the classic top-of-book micro-price.
+        """
         if not bids or not asks:
             return None
         
         best_bid = float(bids[0]['price'])
         best_ask = float(asks[0]['price'])
-        bid_vol = float(bids[0]['size'])
-        ask_vol = float(asks[0]['size'])
         
-        total_vol = bid_vol + ask_vol
+        # Single pass over matched rungs (no intermediate lists)
+        weighted_sum = 0.0
+        total_vol = 0.0
+        for bid, ask in zip(bids[:depth], asks[:depth]):
+            bid_vol = float(bid['size'])
+            ask_vol = float(ask['size'])
+            # Heavier side pushes price toward opposite side
+            weighted_sum += bid_vol * float(ask['price']) + ask_vol * float(bid['price'])
+            total_vol += bid_vol + ask_vol
+        
         if total_vol == 0:
             return (best_bid + best_ask) / 2.0
         
-        # Heavier side pushes price toward opposite side
-        micro_price = ((bid_vol * best_ask) + (ask_vol * best_bid)) / total_vol
-        return micro_price
+        # Deep rungs can pull the weighted price past the touch - keep it inside
+        return min(max(weighted_sum / total_vol, best_bid), best_ask)
     
     def _round_price_to_tick(self, price: float, side: str, tick_size: float = 0.001) -> Tuple[float, Decimal]:
         """Strict rounding with dust tracking: floor for bids, ceil for asks (never cross spread)
         
         P0 FIX: Now returns (rounded_price, dust_delta) to enable accumulation tracking
         """
-        import math
-        from decimal import Decimal
-        
-        exact_price = Decimal(str(price))
-        tick = Decimal(str(tick_size))
+        exact_price = _PRICE_DEC_CTX.create_decimal_from_float(price)
+        # Default tick reuses the module constant (no per-call str/Decimal parse)
+        tick = _MIN_TICK_SIZE if tick_size == 0.001 else Decimal(str(tick_size))
         
         if side == 'BUY':
             # Floor: Always round DOWN for bids (stay below mid)
@@ -3371,7 +3768,7 @@ class MarketMakingStrategy(BaseStrategy):
         dust = exact_price - rounded
         
         # Clamp to valid range
-        rounded = max(Decimal('0.001'), min(Decimal('0.999'), rounded))
+        rounded = max(_MIN_QUOTE_PRICE, min(_MAX_QUOTE_PRICE, rounded))
         
         return float(rounded), dust
     
@@ -3416,7 +3813,7 @@ class MarketMakingStrategy(BaseStrategy):
     
     def _calculate_skewed_quotes(self, mid_price: float, inventory: int, is_toxic: bool = False, 
                                  position: Optional[MarketPosition] = None, 
-                                 z_score_manager: Optional[ZScoreManager] = None) -> Tuple[Decimal, Decimal]:
+                                 z_score_manager: Optional[ZScoreManager] = None) -> Tuple[float, float]:
         """
         Hybrid Avellaneda-Stoikov + Z-Score Mean Reversion Quote Calculator
         
@@ -3490,43 +3887,21 @@ class MarketMakingStrategy(BaseStrategy):
         Returns:
             Tuple[target_bid, target_ask]: Optimal quote prices
         """
-        RISK_FACTOR = Decimal('0.0005')  # 0.05 cents per 1 share ($0.05 per 100 shares)
-        MIN_TICK_SIZE = Decimal('0.001')  # Polymarket minimum tick (0.1 cent)
-        
-        # INSTITUTIONAL UPGRADE: Bernoulli Variance Guard (2026)
-        # For binary markets [0, 1], variance = p(1-p) collapses near boundaries
-        # If price < 0.10 or > 0.90, cap volatility to prevent gamma overload
-        BOUNDARY_LOW = Decimal('0.10')
-        BOUNDARY_HIGH = Decimal('0.90')
-        MAX_BOUNDARY_VOLATILITY = Decimal('0.05')  # Cap σ at 5% near boundaries
-        
-        mid_price_dec = Decimal(str(mid_price))
-        
-        # P1 FIX: Apply Bernoulli boundary protection WITH FLOOR
-        MIN_EFFECTIVE_RISK = Decimal('0.0001')  # 1 basis point minimum (prevents collapse)
-        
-        if mid_price_dec < BOUNDARY_LOW or mid_price_dec > BOUNDARY_HIGH:
-            # Near boundaries: Bernoulli variance p(1-p) → 0, causing excessive skew
-            # Cap the effective risk factor to prevent "gamma overload"
-            calculated_risk = RISK_FACTOR * MAX_BOUNDARY_VOLATILITY / Decimal('0.15')
-            effective_risk = max(calculated_risk, MIN_EFFECTIVE_RISK)  # Floor protection
+        # Near boundaries: Bernoulli variance p(1-p) → 0, causing excessive skew
+        # Cap the effective risk factor to prevent "gamma overload"
+        if mid_price < _BOUNDARY_LOW_F or mid_price > _BOUNDARY_HIGH_F:
+            effective_risk = _BOUNDARY_RISK_FACTOR_F
             
             logger.warning(
                 f"🛡️ BERNOULLI GUARD: Price ${mid_price:.4f} near boundary - "
-                f"Risk factor {RISK_FACTOR:.6f} → {effective_risk:.6f} "
-                f"(calculated: {calculated_risk:.6f}, floor: {MIN_EFFECTIVE_RISK:.6f})"
+                f"Risk factor {_RISK_FACTOR:.6f} → {_BOUNDARY_RISK_FACTOR:.6f} "
+                f"(floor: {_MIN_EFFECTIVE_RISK:.6f})"
             )
         else:
-            effective_risk = RISK_FACTOR
-        
-        # ═══════════════════════════════════════════════════════════════
-        # STEP 1: INVENTORY RISK - Avellaneda-Stoikov Base Reservation
-        # ═══════════════════════════════════════════════════════════════
-        inventory_skew = Decimal(str(inventory)) * effective_risk
-        base_reservation = mid_price_dec - inventory_skew
+            effective_risk = _RISK_FACTOR_F
         
         # ═══════════════════════════════════════════════════════════════
-        # STEP 2: MEAN REVERSION ALPHA - Z-Score Adjustment (NEW)
+        # MEAN REVERSION ALPHA - Z-Score state pulled into scalars
         # ═══════════════════════════════════════════════════════════════
         alpha_shift = 0.0
         z_score = 0.0
@@ -3540,29 +3915,22 @@ class MarketMakingStrategy(BaseStrategy):
                     f"🚨 Z-SCORE HALT: abs(Z)={abs(z_score):.2f} > {Z_SCORE_HALT_THRESHOLD:.1f}σ - "
                     f"PAUSING QUOTES (potential regime change or news event)"
                 )
-                # Return impossible quotes to prevent placement (Decimal type)
-                return Decimal('0.0'), Decimal('999.99')
+                # Return impossible quotes to prevent placement
+                return 0.0, 999.99
             
             # Get alpha shift if signal is active
             if z_score_manager.is_signal_active():
                 alpha_shift = z_score_manager.get_alpha_shift()
-                logger.info(
-                    f"📊 Z-Score Alpha: Z={z_score:.2f}σ → shift=${alpha_shift:+.4f} "
-                    f"({'SELL bias' if alpha_shift < 0 else 'BUY bias'})"
-                )
-        
-        # Apply alpha shift to reservation price (ADDITIVE)
-        # HIGH-PRECISION: Convert to Decimal for 4-decimal tick alignment
-        alpha_shift_dec = Decimal(str(alpha_shift))
-        final_reservation = base_reservation + alpha_shift_dec
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        f"📊 Z-Score Alpha: Z={z_score:.2f}σ → shift=${alpha_shift:+.4f} "
+                        f"({'SELL bias' if alpha_shift < 0 else 'BUY bias'})"
+                    )
         
         # ═══════════════════════════════════════════════════════════════
-        # STEP 3: DYNAMIC SPREAD CALCULATION
+        # DYNAMIC SPREAD INPUTS
         # ═══════════════════════════════════════════════════════════════
-        base_half_spread = MM_TARGET_SPREAD / 2
-        
-        # Inventory-driven spread widening (reduce risk of accumulating more)
-        extra_spread = abs(inventory) * MIN_TICK_SIZE
+        base_half_spread = _BASE_HALF_SPREAD
         
         # TOXIC FLOW PROTECTION: Widen spread significantly if being run over
         if is_toxic:
@@ -3572,44 +3940,42 @@ class MarketMakingStrategy(BaseStrategy):
         # INSTITUTIONAL UPGRADE: Adverse Selection Auto-Adjustment
         # If markout P&L is consistently negative, we are being picked off
         # Automatically widen spread to compensate
-        if position and position.fill_count > 10:  # Need statistical significance
-            avg_markout = position.total_markout_pnl / position.fill_count
-            
-            # Negative markout = adverse selection = need wider spreads
-            if avg_markout < -0.005:  # -0.5 cents per fill average
-                adverse_multiplier = 1.0 + abs(avg_markout) * 100  # Scale with severity
-                adverse_multiplier = min(adverse_multiplier, 2.5)  # Cap at 2.5x
+        # Negative markout = adverse selection = need wider spreads (memoized on position)
+        if position:
+            adverse_multiplier = position.get_adverse_multiplier()
+            if adverse_multiplier > 1.0:
                 base_half_spread *= adverse_multiplier
-                logger.warning(
-                    f"🚨 ADVERSE SELECTION AUTO-ADJUSTMENT: "
-                    f"Avg markout ${avg_markout:.4f} → spread widened {adverse_multiplier:.1f}x "
-                    f"to {base_half_spread*2*100:.1f}%"
-                )
-        
-        final_half_spread_dec = Decimal(str(base_half_spread + extra_spread))
+                # Warn once per change, not on every quote refresh
+                if adverse_multiplier != position._adverse_logged_multiplier:
+                    position._adverse_logged_multiplier = adverse_multiplier
+                    logger.warning(
+                        f"🚨 ADVERSE SELECTION AUTO-ADJUSTMENT: "
+                        f"Avg markout ${position.total_markout_pnl / position.fill_count:.4f} → "
+                        f"spread widened {adverse_multiplier:.1f}x to {base_half_spread*2*100:.1f}%"
+                    )
         
         # ═══════════════════════════════════════════════════════════════
-        # STEP 4: CALCULATE FINAL BID/ASK FROM RESERVATION PRICE
+        # STEPS 1-4: Pure scalar skew math
         # ═══════════════════════════════════════════════════════════════
-        target_bid = final_reservation - final_half_spread_dec
-        target_ask = final_reservation + final_half_spread_dec
-        
-        # Don't cross the market (safety check)
-        target_bid = min(target_bid, mid_price_dec - MIN_TICK_SIZE)
-        target_ask = max(target_ask, mid_price_dec + MIN_TICK_SIZE)
+        bid, ask = _skew_math(
+            mid_price, inventory, effective_risk, alpha_shift, base_half_spread, _MIN_TICK_SIZE_F
+        )
         
-        # HIGH-PRECISION ROUNDING: Ensure 4-decimal tick alignment
+        # INTEGER TICK ROUNDING: Exact tick alignment without Decimal
         # CRITICAL: Use floor for bids (favor buyer), ceil for asks (favor seller)
-        target_bid = target_bid.quantize(MIN_TICK_SIZE, rounding='ROUND_DOWN')
-        target_ask = target_ask.quantize(MIN_TICK_SIZE, rounding='ROUND_UP')
+        # round(.., 6) strips float noise so exact ticks don't slip a tick
+        target_bid = math.floor(round(bid * _TICKS_PER_UNIT, 6)) / _TICKS_PER_UNIT
+        target_ask = math.ceil(round(ask * _TICKS_PER_UNIT, 6)) / _TICKS_PER_UNIT
         
         # Log the multi-signal quote decision
-        if abs(alpha_shift) > 0.001:  # Only log when alpha is active
+        # Only log when alpha is active (and INFO is on - skips the formatting otherwise)
+        if abs(alpha_shift) > 0.001 and logger.isEnabledFor(logging.INFO):
+            inventory_skew = inventory * effective_risk
             logger.info(
                 f"💡 HYBRID QUOTE: mid=${mid_price:.4f}, "
                 f"inv_skew=${inventory_skew:+.4f} (inv={inventory}), "
                 f"alpha_shift=${alpha_shift:+.4f} (Z={z_score:.2f}σ), "
-                f"final_res=${final_reservation:.4f} → "
+                f"final_res=${mid_price - inventory_skew + alpha_shift:.4f} → "
                 f"bid=${target_bid:.4f}, ask=${target_ask:.4f}"
             )
         
@@ -3617,112 +3983,174 @@ class MarketMakingStrategy(BaseStrategy):
     
     async def _get_market_prices(self, market_id: str, token_ids: List[str]) -> Dict[str, float]:
         """Get current micro-prices from WebSocket cache (zero-latency synchronous reads)"""
-        prices = {}
-        
         # Use WebSocket cache if available, fallback to REST
-        use_cache = self._market_data_manager is not None
+        if self._market_data_manager is None:
+            return await self._get_prices_rest(token_ids)
+        
+        prices, missing = self._get_prices_cached(market_id, token_ids)
+        if missing:
+            prices.update(await self._get_prices_rest(missing))
+        return prices
+    
+    def _get_prices_cached(self, market_id: str,
+                           token_ids: List[str]) -> Tuple[Dict[str, float], List[str]]:
+        """
+        Price tokens from the WebSocket cache
+        
+        Returns (prices, missing): stale, gapped and oracle-deviating tokens are
+        dropped; only tokens with no cached snapshot are returned as missing so
+        the caller can fall back to REST for those alone.
+        """
+        prices: Dict[str, float] = {}
+        missing: List[str] = []
+        
+        # Loop-invariant constants bound as locals (LOAD_FAST in the per-token scan)
+        max_spread = MM_MAX_SPREAD
+        
+        # One batched cache read for all tokens (single lock + clock read)
+        snapshots, stale = self._market_data_manager.get_snapshots_batch(token_ids)
+        
+        # Oracle reference is per market - resolve once into an absolute price band
+        oracle_price = self._oracle_prices.get(market_id) if self._oracle_enabled else None
+        if oracle_price is None:
+            oracle_low, oracle_high = -math.inf, math.inf
+        elif oracle_price <= 0:
+            oracle_low, oracle_high = math.inf, -math.inf  # Rejects every token
+        else:
+            oracle_low = oracle_price * _ORACLE_BAND_LOW_MULT
+            oracle_high = oracle_price * _ORACLE_BAND_HIGH_MULT
         
         for token_id in token_ids:
+            # CRITICAL: Check for stale data first (HFT-grade protection)
+            if token_id in stale:
+                logger.warning(
+                    f"⚠️ STALE DATA: {token_id[:8]}... - "
+                    f"No WebSocket update in 2+ seconds - SKIPPING QUOTES"
+                )
+                continue  # Pause activity for stale markets
+            
+            snapshot = snapshots.get(token_id)
+            if not snapshot:
+                logger.warning(
+                    f"⚠️ CACHE MISS: {token_id[:8]}... - Cache empty (should never happen after subscription) - "
+                    f"Using emergency REST fallback (degrades performance)"
+                )
+                # Fallback to REST (emergency only - cache should always be populated after subscription)
+                missing.append(token_id)
+                continue
+            
+            micro_price = snapshot.micro_price
+            
+            # CRITICAL: Gapped market + oracle price sanity checks
+            rejection = _snapshot_rejection(
+                snapshot.best_bid, snapshot.best_ask, micro_price,
+                max_spread, oracle_low, oracle_high
+            )
+            if rejection == _SNAPSHOT_OK:
+                prices[token_id] = micro_price
+                continue
+            
+            # Rejected - only now pay for building the diagnostics
+            if rejection == _SNAPSHOT_GAPPED:
+                best_bid = snapshot.best_bid
+                best_ask = snapshot.best_ask
+                logger.warning(
+                    f"⚠️ Gapped market detected: {token_id[:8]}... "
+                    f"(bid: {best_bid:.4f}, ask: {best_ask:.4f}, spread: {best_ask - best_bid:.4f}) - "
+                    f"SKIPPING (too risky to provide liquidity)"
+                )
+            elif oracle_price <= 0:
+                logger.debug("Invalid oracle price for %.8s...: %s", market_id, oracle_price)
+            else:
+                price_deviation = abs(micro_price - oracle_price) / oracle_price
+                logger.critical(
+                    f"🚨 ORACLE PRICE DEVIATION EXCEEDED: {token_id[:8]}... - "
+                    f"Polymarket: {micro_price:.4f}, Oracle: {oracle_price:.4f}, "
+                    f"Deviation: {price_deviation*100:.1f}% - SKIPPING (potential flash crash)"
+                )
+        
+        return prices, missing
+    
+    async def _get_prices_rest(self, rest_tokens: List[str]) -> Dict[str, float]:
+        """EMERGENCY REST fallback - concurrent, one RTT for all tokens"""
+        prices: Dict[str, float] = {}
+        max_spread = MM_MAX_SPREAD
+        min_depth = MM_MIN_DEPTH_SHARES  # 5 shares (realistic for small markets)
+        
+        # After institutional-grade upgrade: Cache is populated on subscription
+        # If this code path executes, it indicates a critical issue
+        for token_id in rest_tokens:
+            logger.critical(
+                f"🚨 PERFORMANCE DEGRADATION: Using REST polling for {token_id[:8]}... "
+                f"(cache should be populated - investigate subscription issue)"
+            )
+        
+        order_books = await asyncio.gather(
+            *[self.client.get_order_book(token_id) for token_id in rest_tokens],
+            return_exceptions=True
+        )
+        
+        for token_id, order_book in zip(rest_tokens, order_books):
             try:
-                if use_cache:
-                    # CRITICAL: Check for stale data first (HFT-grade protection)
-                    if self._market_data_manager.is_market_stale(token_id):
-                        logger.warning(
-                            f"⚠️ STALE DATA: {token_id[:8]}... - "
-                            f"No WebSocket update in 2+ seconds - SKIPPING QUOTES"
+                if isinstance(order_book, BaseException):
+                    raise order_book
+                
+                bids = getattr(order_book, 'bids', [])
+                asks = getattr(order_book, 'asks', [])
+                
+                if bids and asks:
+                    best_bid = float(bids[0]['price'])
+                    best_ask = float(asks[0]['price'])
+                    
+                    # INSTITUTION-GRADE: Depth validation
+                    # Per Polymarket Support (Jan 2026): 5 shares min for small capital
+                    bid_depth = float(bids[0].get('size', 0))
+                    ask_depth = float(asks[0].get('size', 0))
+                    
+                    if bid_depth < min_depth or ask_depth < min_depth:
+                        logger.debug(
+                            "Skipping thin book (REST): %.8s... (bid depth: %s, ask depth: %s)",
+                            token_id, bid_depth, ask_depth
                         )
-                        continue  # Pause activity for stale markets
+                        continue
                     
-                    # Synchronous cache read (O(1) lookup, no network latency)
-                    snapshot = self._market_data_manager.cache.get(token_id)
-                    if not snapshot:
+                    spread = best_ask - best_bid
+                    if spread > max_spread:
                         logger.warning(
-                            f"⚠️ CACHE MISS: {token_id[:8]}... - Cache empty (should never happen after subscription) - "
-                            f"Using emergency REST fallback (degrades performance)"
+                            f"⚠️ Gapped market detected (REST): {token_id[:8]}... "
+                            f"(spread: {spread:.4f}) - SKIPPING"
                         )
-                        # Fallback to REST (emergency only - cache should always be populated after subscription)
-                        use_cache = False
-                    else:
-                        best_bid = snapshot.best_bid
-                        best_ask = snapshot.best_ask
-                        micro_price = snapshot.micro_price
-                        
-                        # CRITICAL: Gapped market check
-                        spread = best_ask - best_bid
-                        if spread > MM_MAX_SPREAD:
-                            logger.warning(
-                                f"⚠️ Gapped market detected: {token_id[:8]}... "
-                                f"(bid: {best_bid:.4f}, ask: {best_ask:.4f}, spread: {spread:.4f}) - "
-                                f"SKIPPING (too risky to provide liquidity)"
-                            )
-                            continue
-                        
-                        # CRITICAL: Oracle price sanity check
-                        if self._oracle_enabled and market_id in self._oracle_prices:
-                            oracle_price = self._oracle_prices[market_id]
-                            price_deviation = abs(micro_price - oracle_price) / oracle_price
-                            
-                            if price_deviation > MM_ORACLE_PRICE_DEVIATION_LIMIT:
-                                logger.critical(
-                                    f"🚨 ORACLE PRICE DEVIATION EXCEEDED: {token_id[:8]}... - "
-                                    f"Polymarket: {micro_price:.4f}, Oracle: {oracle_price:.4f}, "
-                                    f"Deviation: {price_deviation*100:.1f}% - SKIPPING (potential flash crash)"
-                                )
-                                continue
-                        
-                        prices[token_id] = micro_price
-                        continue  # Successfully got price from cache
-                
-                # EMERGENCY REST Fallback (only if cache unavailable - should never happen)
-                # After institutional-grade upgrade: Cache is populated on subscription
-                # If this code path executes, it indicates a critical issue
-                if not use_cache:
-                    logger.critical(
-                        f"🚨 PERFORMANCE DEGRADATION: Using REST polling for {token_id[:8]}... "
-                        f"(cache should be populated - investigate subscription issue)"
-                    )
-                    order_book = await self.client.get_order_book(token_id)
-                    bids = getattr(order_book, 'bids', [])
-                    asks = getattr(order_book, 'asks', [])
+                        continue
                     
-                    if bids and asks:
-                        best_bid = float(bids[0]['price'])
-                        best_ask = float(asks[0]['price'])
-                        
-                        # INSTITUTION-GRADE: Depth validation
-                        # Per Polymarket Support (Jan 2026): 5 shares min for small capital
-                        bid_depth = float(bids[0].get('size', 0))
-                        ask_depth = float(asks[0].get('size', 0))
-                        
-                        MIN_DEPTH = MM_MIN_DEPTH_SHARES  # 5 shares (realistic for small markets)
-                        if bid_depth < MIN_DEPTH or ask_depth < MIN_DEPTH:
-                            logger.debug(
-                                f"Skipping thin book (REST): {token_id[:8]}... "
-                                f"(bid depth: {bid_depth}, ask depth: {ask_depth})"
-                            )
-                            continue
-                        
-                        spread = best_ask - best_bid
-                        if spread > MM_MAX_SPREAD:
-                            logger.warning(
-                                f"⚠️ Gapped market detected (REST): {token_id[:8]}... "
-                                f"(spread: {spread:.4f}) - SKIPPING"
-                            )
-                            continue
-                        
-                        micro_price = self._calculate_micro_price(bids, asks)
-                        if micro_price:
-                            prices[token_id] = micro_price
+                    micro_price = self._calculate_micro_price(bids, asks)
+                    if micro_price:
+                        prices[token_id] = micro_price
                     
             except Exception as e:
-                logger.debug(f"Error fetching price for {token_id[:8]}...: {e}")
+                logger.debug("Error fetching price for %.8s...: %s", token_id, e)
         
         return prices
     
     async def _check_risk_limits(self) -> None:
         """Check risk limits - use passive unwinding instead of market orders"""
-        for market_id, position in list(self._positions.items()):
-            prices = await self._get_market_prices(market_id, position.token_ids)
+        positions = list(self._positions.items())
+        if not positions:
+            return
+        
+        # One clock read for the whole cycle, shared by every unwind below
+        now = time.monotonic()
+        
+        # Fetch prices for every position concurrently (one scheduling pass,
+        # REST fallbacks overlap instead of running market by market)
+        all_prices = await asyncio.gather(
+            *[self._get_market_prices(market_id, position.token_ids) for market_id, position in positions],
+            return_exceptions=True
+        )
+        
+        for (market_id, position), prices in zip(positions, all_prices):
+            if isinstance(prices, BaseException):
+                logger.error(f"Risk check price fetch failed for {market_id[:8]}...: {prices}")
+                continue
             if not prices:
                 continue
             
@@ -3736,78 +4164,80 @@ class MarketMakingStrategy(BaseStrategy):
                 await self._close_position(market_id)
                 continue
             
-            # CRITICAL: Check if position is HEDGED (equal Yes/No inventory)
-            # Don't exit both sides of a hedged position - only exit the imbalance
-            is_binary = len(position.token_ids) == 2
+            # Single pass: derive inventory state once, then one if/elif ladder
+            is_binary = position.is_binary
             if is_binary:
-                inv_0 = position.inventory.get(position.token_ids[0], 0)
-                inv_1 = position.inventory.get(position.token_ids[1], 0)
+                inv_0 = position._inv0
+                inv_1 = position._inv1
+                net_inv = inv_0 - inv_1
+                abs_net = abs(net_inv)
                 
+                # CRITICAL: Check if position is HEDGED (equal Yes/No inventory)
+                # Don't exit both sides of a hedged position - only exit the imbalance
                 # If perfectly hedged (or nearly hedged within 5 shares), skip exit logic
-                if abs(inv_0 - inv_1) <= 5:
+                if abs_net <= 5:
                     logger.debug(
-                        f"Position is hedged: {market_id[:8]}... "
-                        f"(Yes: {inv_0}, No: {inv_1}, Net: {abs(inv_0 - inv_1)}) - No action needed"
+                        "Position is hedged: %.8s... (Yes: %s, No: %s, Net: %s) - No action needed",
+                        market_id, inv_0, inv_1, abs_net
                     )
                     continue
-            
-            # Time-based: PASSIVE UNWINDING (not force close)
-            if position.has_inventory():
-                age = position.get_inventory_age()
+                
+                # Past the hedge check the NET imbalance is material (>5 shares)
+                # Determine which token carries it
+                token_idx = 0 if net_inv > 0 else 1
+                token_id = position.token_ids[token_idx]
+                inventory = inv_0 if token_idx == 0 else inv_1
+                
+                # Time-based: PASSIVE UNWINDING of the NET imbalance (not force close)
+                age = position.get_inventory_age(now)
                 if age > MM_MAX_INVENTORY_HOLD_TIME:
                     logger.warning(
                         f"Inventory age {age/60:.0f}min - passive unwinding"
                     )
+                    await self._exit_inventory(market_id, token_id, abs_net, now=now)
+                
+                # Adverse price move: PASSIVE UNWINDING (only for net imbalance)
+                elif inventory > 0:
+                    entry_price = position.cost_basis[token_id]
+                    current_price = prices.get(token_id, entry_price)
+                    price_move = (current_price - entry_price) / entry_price if entry_price > 0 else 0
                     
-                    # For binary markets, only unwind the NET imbalance
-                    if is_binary:
-                        net_inv = position.get_net_inventory()
-                        if abs(net_inv) > 5:  # Only if material imbalance
-                            # Determine which token to exit
-                            token_idx = 0 if net_inv > 0 else 1
-                            token_id = position.token_ids[token_idx]
-                            await self._exit_inventory(market_id, token_id, abs(net_inv))
-                    else:
-                        # Multi-outcome: exit each token independently
-                        for token_id, inventory in position.inventory.items():
-                            if inventory != 0:
-                                await self._exit_inventory(market_id, token_id, inventory)
-                    continue
+                    if price_move < -MM_EMERGENCY_EXIT_THRESHOLD:
+                        logger.critical(
+                            f"Emergency: {token_id[:8]}... price moved {price_move*100:.1f}% "
+                            f"- passive unwinding NET imbalance ({abs_net} shares)"
+                        )
+                        await self._exit_inventory(market_id, token_id, abs_net, now=now)
+                continue
             
-            # Adverse price move: PASSIVE UNWINDING (only for net imbalance)
-            if is_binary:
-                net_inv = position.get_net_inventory()
-                if abs(net_inv) > 5:
-                    # Check price move on the net position
-                    token_idx = 0 if net_inv > 0 else 1
-                    token_id = position.token_ids[token_idx]
-                    inventory = position.inventory.get(token_id, 0)
+            # Multi-outcome: each token independently
+            if not position.has_inventory():
+                continue
+            
+            # Time-based: PASSIVE UNWINDING (not force close)
+            age = position.get_inventory_age(now)
+            if age > MM_MAX_INVENTORY_HOLD_TIME:
+                logger.warning(
+                    f"Inventory age {age/60:.0f}min - passive unwinding"
+                )
+                for token_id, inventory in list(position.inventory.items()):
+                    if inventory != 0:
+                        await self._exit_inventory(market_id, token_id, inventory, now=now)
+                continue
+            
+            # Adverse price move: check each token
+            for token_id, inventory in list(position.inventory.items()):
+                if inventory > 0:
+                    entry_price = position.cost_basis[token_id]
+                    current_price = prices.get(token_id, entry_price)
+                    price_move = (current_price - entry_price) / entry_price if entry_price > 0 else 0
                     
-                    if inventory > 0:
-                        entry_price = position.cost_basis[token_id]
-                        current_price = prices.get(token_id, entry_price)
-                        price_move = (current_price - entry_price) / entry_price if entry_price > 0 else 0
-                        
-                        if price_move < -MM_EMERGENCY_EXIT_THRESHOLD:
-                            logger.critical(
-                                f"Emergency: {token_id[:8]}... price moved {price_move*100:.1f}% "
-                                f"- passive unwinding NET imbalance ({abs(net_inv)} shares)"
-                            )
-                            await self._exit_inventory(market_id, token_id, abs(net_inv))
-            else:
-                # Multi-outcome: check each token
-                for token_id, inventory in position.inventory.items():
-                    if inventory > 0:
-                        entry_price = position.cost_basis[token_id]
-                        current_price = prices.get(token_id, entry_price)
-                        price_move = (current_price - entry_price) / entry_price if entry_price > 0 else 0
-                        
-                        if price_move < -MM_EMERGENCY_EXIT_THRESHOLD:
-                            logger.critical(
-                                f"Emergency: {token_id[:8]}... price moved {price_move*100:.1f}% "
-                                f"- passive unwinding"
-                            )
-                            await self._exit_inventory(market_id, token_id, inventory)
+                    if price_move < -MM_EMERGENCY_EXIT_THRESHOLD:
+                        logger.critical(
+                            f"Emergency: {token_id[:8]}... price moved {price_move*100:.1f}% "
+                            f"- passive unwinding"
+                        )
+                        await self._exit_inventory(market_id, token_id, inventory, now=now)
     
     async def _should_close_position(self, position: MarketPosition) -> bool:
         """Check if position should be closed"""
@@ -3819,13 +4249,15 @@ class MarketMakingStrategy(BaseStrategy):
     
     async def _close_position(self, market_id: str) -> None:
         """Close position in a market"""
-        if market_id not in self._positions:
+        position = self._positions.get(market_id)
+        if position is None:
             return
         
-        position = self._positions[market_id]
         logger.info(f"Closing position in {market_id[:8]}...")
         
-        await self._refresh_quotes(market_id)
+        # Final update runs inline once any in-flight loop update has finished
+        await self._stop_quote_loop(market_id)
+        await self._place_quotes(market_id)
         
         if position.has_inventory():
             for token_id, inventory in position.inventory.items():
@@ -3855,10 +4287,27 @@ class MarketMakingStrategy(BaseStrategy):
                 f"Daily total: ${self.order_manager.get_mm_daily_pnl():.2f}"
             )
         
-        del self._positions[market_id]
+        # Removed last: the final _place_quotes/_exit_inventory above look it up.
+        # pop() also tolerates a concurrent close having already removed it
+        self._positions.pop(market_id, None)
     
-    async def _exit_inventory(self, market_id: str, token_id: str, shares: int) -> None:
-        """Passive unwinding via aggressive quote skewing (no market orders)"""
+    async def _exit_inventory(
+        self, market_id: str, token_id: str, shares: int, now: Optional[float] = None
+    ) -> None:
+        """Passive unwinding via aggressive quote skewing (no market orders)
+        
+        ``now`` is a ``time.monotonic()`` reading; risk checks pass one value
+        for the whole cycle so the clock is read once, not per unwind.
+        """
+        # Idempotency guard: a concurrent call for the same token (risk check
+        # racing a close) would refetch prices and place duplicate quotes
+        unwind_key = (market_id, token_id)
+        if unwind_key in self._unwinding_in_flight:
+            return
+        self._unwinding_in_flight.add(unwind_key)
+        
+        if now is None:
+            now = time.monotonic()
         try:
             position = self._positions.get(market_id)
             if not position:
@@ -3869,11 +4318,12 @@ class MarketMakingStrategy(BaseStrategy):
                 return
             
             # Track unwinding start time
-            if token_id not in position.unwinding_start:
-                position.unwinding_start[token_id] = time.time()
+            unwinding_started = position.unwinding_start.get(token_id)
+            if unwinding_started is None:
+                unwinding_started = position.unwinding_start[token_id] = now
                 logger.warning(f"[MM] Passively unwinding {abs(inventory)} shares")
             
-            unwinding_duration = time.time() - position.unwinding_start[token_id]
+            unwinding_duration = now - unwinding_started
             
             # EMERGENCY: If passive unwinding hasn't worked after 5 minutes, force exit
             if unwinding_duration > position.unwinding_timeout:
@@ -3890,10 +4340,10 @@ class MarketMakingStrategy(BaseStrategy):
                     # Cross the spread to guarantee execution
                     if inventory > 0:
                         # Long: sell at bid (cross spread down)
-                        force_price = max(0.01, mid_price - 0.02)  # 2 cents below mid
+                        force_price = _clamp_unwind_price(mid_price - 0.02)  # 2 cents below mid
                     else:
                         # Short: buy at ask (cross spread up)
-                        force_price = min(0.99, mid_price + 0.02)  # 2 cents above mid
+                        force_price = _clamp_unwind_price(mid_price + 0.02)  # 2 cents above mid
                     
                     side = 'SELL' if inventory > 0 else 'BUY'
                     force_size = abs(inventory)
@@ -3930,30 +4380,39 @@ class MarketMakingStrategy(BaseStrategy):
             if inventory > 0:
                 # Long: aggressive seller (ASK below mid)
                 target_ask = mid_price - (abs(inventory_skew) * 0.5)
-                target_ask = max(0.01, min(0.99, target_ask))
-                target_bid = max(0.01, target_ask - 0.10)
+                target_ask = _clamp_unwind_price(target_ask)
+                target_bid = _clamp_unwind_price(target_ask - 0.10)
             else:
                 # Short: aggressive buyer (BID above mid)
                 target_bid = mid_price + (abs(inventory_skew) * 0.5)
-                target_bid = max(0.01, min(0.99, target_bid))
-                target_ask = min(0.99, target_bid + 0.10)
+                target_bid = _clamp_unwind_price(target_bid)
+                target_ask = _clamp_unwind_price(target_bid + 0.10)
             
             # Place aggressive quotes
             bid_size = MM_BASE_POSITION_SIZE / target_bid
             ask_size = MM_BASE_POSITION_SIZE / target_ask
             
+            # Both sides reconcile concurrently - independent orders, one RTT
             current_bid_id = position.active_bids.get(token_id)
-            new_bid_id = await self._reconcile_order(
-                token_id, 'BUY', target_bid, bid_size, current_bid_id, position, market_id
+            current_ask_id = position.active_asks.get(token_id)
+            new_bid_id, new_ask_id = await asyncio.gather(
+                self._reconcile_order(
+                    token_id, 'BUY', target_bid, bid_size, current_bid_id, position, market_id
+                ),
+                self._reconcile_order(
+                    token_id, 'SELL', target_ask, ask_size, current_ask_id, position, market_id
+                ),
+                return_exceptions=True
             )
-            if new_bid_id:
+            
+            if isinstance(new_bid_id, BaseException):
+                logger.error(f"[MM] Unwind BUY reconcile failed for {token_id[:8]}...: {new_bid_id}")
+            elif new_bid_id:
                 position.active_bids[token_id] = new_bid_id
             
-            current_ask_id = position.active_asks.get(token_id)
-            new_ask_id = await self._reconcile_order(
-                token_id, 'SELL', target_ask, ask_size, current_ask_id, position, market_id
-            )
-            if new_ask_id:
+            if isinstance(new_ask_id, BaseException):
+                logger.error(f"[MM] Unwind SELL reconcile failed for {token_id[:8]}...: {new_ask_id}")
+            elif new_ask_id:
                 position.active_asks[token_id] = new_ask_id
             
             logger.info(
@@ -3963,6 +4422,8 @@ class MarketMakingStrategy(BaseStrategy):
                 
         except Exception as e:
             logger.error(f"Passive unwinding error: {e}")
+        finally:
+            self._unwinding_in_flight.discard(unwind_key)
     
     async def _emergency_exit_token(self, market_id: str, token_id: str) -> None:
         """Emergency exit for specific token"""
@@ -3975,17 +4436,14 @@ class MarketMakingStrategy(BaseStrategy):
             await self._exit_inventory(market_id, token_id, inventory)
     
     def get_status(self) -> Dict[str, Any]:
-        """Get current strategy status"""
-        return {
-            'name': 'MarketMaking',
-            'is_running': self._is_running,
-            'allocated_capital': float(self._allocated_capital),
-            'capital_used': float(self._capital_used),
-            'active_positions': len(self._positions),
-            'total_pnl': self._total_pnl,
-            'total_fills': self._total_fills,
-            'total_maker_volume': self._total_maker_volume,
-        }
+        """Get current strategy status (a copy - callers may mutate it)"""
+        status = self._status_template
+        status['is_running'] = self._is_running
+        status['active_positions'] = len(self._positions)
+        status['total_pnl'] = self._total_pnl
+        status['total_fills'] = self._total_fills
+        status['total_maker_volume'] = self._total_maker_volume
+        return status.copy()
     
     async def validate_configuration(self) -> None:
         """Validate strategy configuration"""
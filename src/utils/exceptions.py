@@ -16,6 +16,7 @@ Exception Hierarchy:
 │   │   ├── InsufficientBalanceError
 │   │   ├── OrderRejectionError
 │   │   ├── InvalidOrderError
+│   │   ├── ValidationError
 │   │   └── FOKOrderNotFilledError
 │   ├── StrategyError
 │   ├── CircuitBreakerError
@@ -205,6 +206,15 @@ class InvalidOrderError(TradingError):
     pass
 
 
+class ValidationError(TradingError):
+    """
+    Raised when OrderManager's local pre-trade validation fails.
+    Examples: Bad side or size, circuit breaker open, position limit hit
+    Action: Do not submit - the order never reached the exchange
+    """
+    pass
+
+
 class FOKOrderNotFilledError(OrderRejectionError):
     """
     Raised when FOK (Fill-Or-Kill) order cannot be fully filled.
@@ -13,9 +13,10 @@ All functions include comprehensive error handling and logging.
 """
 
 import re
-from typing import Tuple, Optional, Dict, Any
+from typing import Tuple, Optional, Dict, Any, Type
 from decimal import Decimal, ROUND_DOWN
 import asyncio
+import random
 from functools import wraps
 
 from utils.logger import get_logger
@@ -34,6 +35,7 @@ from config.constants import (
     MIN_ORDER_SHARES,
     MAX_ORDER_USD,
     CIRCUIT_BREAKER_LOSS_THRESHOLD_USD,
+    POLL_JITTER_FRACTION,
 )
 
 
@@ -449,13 +451,18 @@ def safe_decimal_multiply(
 # 7. ASYNC HELPER DECORATORS
 # ============================================================================
 
-def async_retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0):
+def async_retry_with_backoff(
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    no_retry: Tuple[Type[BaseException], ...] = ()
+):
     """
     Decorator for async functions with exponential backoff retry logic.
 
     Args:
         max_retries: Maximum number of retry attempts
         base_delay: Base delay between retries (seconds)
+        no_retry: Exception types re-raised immediately without retrying
 
     Returns:
         Decorated async function with retry logic
@@ -469,6 +476,8 @@ def async_retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0):
             for attempt in range(max_retries):
                 try:
                     return await func(*args, **kwargs)
+                except no_retry:
+                    raise
                 except Exception as e:
                     last_error = e
                     if attempt < max_retries - 1:
@@ -522,6 +531,20 @@ def rate_limit(calls_per_second: float):
     return decorator
 
 
+def jittered(base_interval: float, fraction: float = POLL_JITTER_FRACTION) -> float:
+    """
+    Spread a polling interval by a random ±fraction.
+
+    Args:
+        base_interval: Nominal interval (seconds)
+        fraction: Maximum relative deviation (default: POLL_JITTER_FRACTION)
+
+    Returns:
+        Interval drawn uniformly from base * [1 - fraction, 1 + fraction]
+    """
+    return base_interval * (1 + random.uniform(-fraction, fraction))
+
+
 def is_dust_amount(amount_usd: float, threshold: float = 0.01) -> bool:
     """
     Check if an amount is too small to be worth trading (dust).
@@ -178,3 +178,11 @@ CLOB_READ_RATE_LIMITER = TokenBucketRateLimiter(
     rate=50.0,      # 50 requests per second sustained
     capacity=100.0  # Allow 100-request burst
 )
+
+# Gamma API Read Rate Limiter (GET /events discovery pagination)
+# Matches the previous fixed 100ms inter-page sleep (10 req/sec sustained) but
+# lets independent tags overlap their requests within the burst
+GAMMA_READ_RATE_LIMITER = TokenBucketRateLimiter(
+    rate=10.0,      # 10 requests per second sustained
+    capacity=10.0   # Allow 10-request burst
+)
@@ -6,16 +6,19 @@ Tracks order_id, fill_amount, fee_rate, and execution details.
 
 Output Format: JSONL (JSON Lines) for easy parsing and analysis
 File Location: logs/maker_rebates.jsonl
+
+Entries are queued and appended by a background writer task, so callers on
+the order path never wait on file I/O.
 """
 
 import json
 import asyncio
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from decimal import Decimal
 
-from config.constants import ENABLE_REBATE_TRACKING, REBATE_LOG_FILE
+from config.constants import ENABLE_REBATE_TRACKING, REBATE_LOG_FILE, REBATE_LOG_QUEUE_SIZE
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -38,7 +41,9 @@ class RebateLogger:
     def __init__(self):
         self.log_file = Path(REBATE_LOG_FILE)
         self.enabled = ENABLE_REBATE_TRACKING
-        self._lock = asyncio.Lock()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=REBATE_LOG_QUEUE_SIZE)
+        self._writer_task: Optional[asyncio.Task] = None
+        self.dropped_entries = 0
         self._ensure_log_directory()
     
     def _ensure_log_directory(self) -> None:
@@ -46,6 +51,71 @@ class RebateLogger:
         if self.enabled:
             self.log_file.parent.mkdir(parents=True, exist_ok=True)
     
+    def _write_lines(self, lines: List[str]) -> None:
+        """Append serialized entries in one open/write (runs in a worker thread)"""
+        with open(self.log_file, 'a') as f:
+            f.writelines(lines)
+    
+    async def _drain_queue(self) -> None:
+        """Background writer: batch everything queued since the last write"""
+        while True:
+            batch = [await self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            try:
+                await asyncio.to_thread(self._write_lines, batch)
+            except Exception as e:
+                logger.error(f"Failed to write {len(batch)} maker rebate entries: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    def _enqueue(self, log_entry: Dict[str, Any]) -> None:
+        """Queue one entry for the writer, starting it on first use"""
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(
+                self._drain_queue(), name="rebate_log_writer"
+            )
+        
+        try:
+            self._queue.put_nowait(json.dumps(log_entry) + '\n')
+        except asyncio.QueueFull:
+            self.dropped_entries += 1
+            logger.warning(
+                f"Rebate log queue full - dropped entry for order {log_entry['order_id'][:8]}... "
+                f"({self.dropped_entries} dropped total)"
+            )
+    
+    async def flush(self) -> None:
+        """Wait until every queued entry has been written"""
+        if self._writer_task is not None and not self._writer_task.done():
+            await self._queue.join()
+    
+    async def close(self, timeout: float = 5.0) -> None:
+        """
+        Drain the queue and stop the writer task (call once on shutdown)
+        
+        Args:
+            timeout: Max seconds to wait for queued entries to be written
+        """
+        if self._writer_task is None:
+            return
+        
+        try:
+            await asyncio.wait_for(self.flush(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Rebate log flush timed out - {self._queue.qsize()} entries not written"
+            )
+        
+        self._writer_task.cancel()
+        try:
+            await self._writer_task
+        except asyncio.CancelledError:
+            pass
+        self._writer_task = None
+    
     async def log_maker_fill(
         self,
         order_id: str,
@@ -115,10 +185,8 @@ class RebateLogger:
             if additional_data:
                 log_entry["metadata"] = additional_data
             
-            # Write to JSONL file (one JSON object per line)
-            async with self._lock:
-                with open(self.log_file, 'a') as f:
-                    f.write(json.dumps(log_entry) + '\n')
+            # Hand off to the background JSONL writer (one JSON object per line)
+            self._enqueue(log_entry)
             
             # Also log to main logger for visibility
             logger.info(
@@ -148,6 +216,9 @@ class RebateLogger:
             - total_fees_paid: Total fees (should be ~0 for makers)
             - average_fill_size: Average fill size
         """
+        # Include entries still waiting on the background writer
+        await self.flush()
+        
         if not self.enabled or not self.log_file.exists():
             return {
                 "total_volume_usd": 0,
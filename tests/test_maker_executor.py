@@ -0,0 +1,53 @@
+"""
+Unit Tests for MakerFirstExecutor
+
+Covers NegRisk auto-detection against the Gamma API.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from core.maker_executor import MakerFirstExecutor
+from config.constants import POLYMARKET_GAMMA_API_URL
+
+
+class _Response:
+    """Minimal async-context response returned by the fake session"""
+    
+    def __init__(self, payload):
+        self.status = 200
+        self._payload = payload
+    
+    async def json(self):
+        return self._payload
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def executor():
+    """Executor without a process pool, over a client exposing the pooled session"""
+    executor = object.__new__(MakerFirstExecutor)
+    executor.client = MagicMock()
+    executor.client._cache = {}
+    return executor
+
+
+class TestNegRiskDetection:
+    """Test suite for _detect_negrisk"""
+    
+    @patch('core.maker_executor.ENABLE_NEGRISK_AUTO_DETECTION', True)
+    async def test_queries_gamma_through_pooled_session(self, executor):
+        """The lookup hits the Gamma /markets endpoint on the client's shared session"""
+        session = executor.client.get_http_session.return_value
+        session.get.return_value = _Response([{'clobTokenIds': '["a", "b", "c"]'}])
+        
+        assert await executor._detect_negrisk('cond123456') is True
+        
+        url = session.get.call_args.args[0]
+        assert url == f"{POLYMARKET_GAMMA_API_URL}/markets"
+        assert session.get.call_args.kwargs['params'] == {'condition_id': 'cond123456'}
+        assert executor.client._cache['negrisk_cond123456'] is True
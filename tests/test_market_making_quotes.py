@@ -0,0 +1,645 @@
+"""
+Unit Tests for MarketMakingStrategy quote-path helpers
+
+Covers the pure pricing helpers used on every quote cycle:
+- Multi-level micro-price (VWMP)
+- Skewed quote calculation
+- Post-only rejection handling in order reconciliation
+- Debounced quote scheduling
+- Tick rounding
+- Toxic-flow fill window
+- Cached market price reads
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.strategies.market_making_strategy import MarketMakingStrategy, MarketPosition, _quote_sizes
+from utils.exceptions import PostOnlyOrderRejectedError, OrderExecutionError
+from core.market_data_manager import MarketStateCache, MarketSnapshot
+
+
+@pytest.fixture
+def strategy():
+    """Bare strategy instance (pricing helpers need no client/order manager)"""
+    return object.__new__(MarketMakingStrategy)
+
+
+class TestMicroPrice:
+    """Test suite for _calculate_micro_price"""
+    
+    def test_top_of_book_matches_classic_formula(self, strategy):
+        """depth=1 must reproduce the single-level micro-price"""
+        bids = [{'price': 0.50, 'size': 300}, {'price': 0.49, 'size': 10}]
+        asks = [{'price': 0.52, 'size': 100}, {'price': 0.53, 'size': 10}]
+        
+        micro = strategy._calculate_micro_price(bids, asks, depth=1)
+        
+        expected = (300 * 0.52 + 100 * 0.50) / 400
+        assert micro == pytest.approx(expected)
+    
+    def test_multi_level_weights_deeper_rungs(self, strategy):
+        """Deeper size changes the micro-price relative to top-of-book"""
+        bids = [{'price': 0.50, 'size': 10}, {'price': 0.49, 'size': 500}]
+        asks = [{'price': 0.52, 'size': 10}, {'price': 0.53, 'size': 10}]
+        
+        top = strategy._calculate_micro_price(bids, asks, depth=1)
+        deep = strategy._calculate_micro_price(bids, asks, depth=2)
+        
+        assert top == pytest.approx(0.51)
+        # Heavy bid depth pushes fair value toward the ask
+        assert deep > top
+    
+    def test_result_clamped_inside_touch(self, strategy):
+        """Weighted price never leaves [best_bid, best_ask]"""
+        bids = [{'price': 0.50, 'size': 100}, {'price': 0.40, 'size': 100}]
+        asks = [{'price': 0.52, 'size': 1}, {'price': 0.70, 'size': 1}]
+        
+        micro = strategy._calculate_micro_price(bids, asks, depth=2)
+        
+        assert 0.50 <= micro <= 0.52
+    
+    def test_empty_book_returns_none(self, strategy):
+        """Missing side yields no micro-price"""
+        assert strategy._calculate_micro_price([], [{'price': 0.5, 'size': 1}]) is None
+    
+    def test_zero_volume_falls_back_to_mid(self, strategy):
+        """Zero size on both sides falls back to simple mid"""
+        bids = [{'price': 0.40, 'size': 0}]
+        asks = [{'price': 0.60, 'size': 0}]
+        
+        assert strategy._calculate_micro_price(bids, asks) == pytest.approx(0.50)
+
+
+class TestSkewedQuotes:
+    """Test suite for _calculate_skewed_quotes"""
+    
+    def test_flat_inventory_is_symmetric(self, strategy):
+        """No inventory and no alpha quotes half the target spread each side"""
+        bid, ask = strategy._calculate_skewed_quotes(0.50, 0)
+        
+        assert float(bid) == pytest.approx(0.492)
+        assert float(ask) == pytest.approx(0.508)
+    
+    def test_long_inventory_lowers_reservation(self, strategy):
+        """Long inventory shifts both quotes down and widens the bid"""
+        flat_bid, flat_ask = strategy._calculate_skewed_quotes(0.50, 0)
+        bid, ask = strategy._calculate_skewed_quotes(0.50, 10)
+        
+        assert bid < flat_bid
+        assert bid < 0.50 < ask
+    
+    def test_quotes_land_on_tick_grid(self, strategy):
+        """Quotes are plain floats aligned to the 0.001 tick"""
+        bid, ask = strategy._calculate_skewed_quotes(0.4337, 7)
+        
+        assert isinstance(bid, float) and isinstance(ask, float)
+        assert round(bid * 1000, 9) == int(round(bid * 1000))
+        assert round(ask * 1000, 9) == int(round(ask * 1000))
+    
+    def test_exact_tick_results_do_not_slip(self, strategy):
+        """Float noise on an exact tick must not round down a full tick"""
+        bid, _ = strategy._calculate_skewed_quotes(0.5075, 0)
+        
+        assert float(bid) == pytest.approx(0.500)
+
+    
+    def test_adverse_selection_widens_spread(self, strategy):
+        """Persistently negative markouts widen the quoted spread"""
+        position = MarketPosition('market123', 'Question?', ['yes', 'no'])
+        flat_bid, flat_ask = strategy._calculate_skewed_quotes(0.50, 0, position=position)
+        
+        position.fill_count = 20
+        position.total_markout_pnl = -0.2  # -1 cent per fill
+        position._adverse_dirty = True
+        bid, ask = strategy._calculate_skewed_quotes(0.50, 0, position=position)
+        
+        assert position.get_adverse_multiplier() == pytest.approx(2.0)
+        assert ask - bid > flat_ask - flat_bid
+    
+    def test_quote_sizes_halve_inventory_side(self):
+        """Capital slice buys capital/price shares; the inventory-adding side is halved"""
+        assert _quote_sizes(10.0, 0.50, 0.25, 0) == (20.0, 40.0)
+        assert _quote_sizes(10.0, 0.50, 0.25, 5) == (10.0, 40.0)
+        assert _quote_sizes(10.0, 0.50, 0.25, -5) == (20.0, 20.0)
+        assert _quote_sizes(10.0, 0.0, 0.25, 0) == (0.0, 40.0)
+
+
+class TestReconcileOrder:
+    """Test suite for _reconcile_order rejection dispatch"""
+    
+    @pytest.fixture
+    def reconciler(self, strategy):
+        strategy.order_manager = MagicMock()
+        strategy.client = MagicMock()
+        strategy._inventory_defense_mode = {}
+        strategy._defense_mode_duration = 60
+        return strategy
+    
+    async def test_post_only_rejection_backs_off_one_tick(self, reconciler):
+        """Typed post-only rejection retries one tick further from the touch"""
+        reconciler.order_manager.execute_limit_order = AsyncMock(side_effect=[
+            PostOnlyOrderRejectedError("would cross"),
+            {'order_id': 'abc'},
+        ])
+        
+        order_id = await reconciler._reconcile_order(
+            'token123456', 'BUY', 0.50, 10.0, None, MagicMock(), 'market123'
+        )
+        
+        assert order_id == 'abc'
+        retry_price = reconciler.order_manager.execute_limit_order.call_args.kwargs['price']
+        assert retry_price == pytest.approx(0.499)
+    
+    async def test_cached_order_at_target_preserves_queue(self, reconciler):
+        """Open order already at target is kept using the local cache only"""
+        reconciler.order_manager.get_open_order_sync.return_value = {'status': 'open', 'price': 0.50}
+        reconciler.order_manager.get_order = AsyncMock()
+        
+        order_id = await reconciler._reconcile_order(
+            'token123456', 'BUY', 0.50, 10.0, 'order1', MagicMock(), 'market123'
+        )
+        
+        assert order_id == 'order1'
+        reconciler.order_manager.get_order.assert_not_awaited()
+    
+    async def test_other_errors_do_not_retry(self, reconciler):
+        """Non post-only failures stop after the first attempt"""
+        reconciler.order_manager.execute_limit_order = AsyncMock(
+            side_effect=OrderExecutionError("post order timed out")
+        )
+        
+        order_id = await reconciler._reconcile_order(
+            'token123456', 'SELL', 0.50, 10.0, None, MagicMock(), 'market123'
+        )
+        
+        assert order_id is None
+        assert reconciler.order_manager.execute_limit_order.await_count == 1
+
+
+class TestOpenOrderCache:
+    """Test that strategy-side cancels keep the order manager cache in sync"""
+    
+    @pytest.fixture
+    def trader(self, strategy):
+        from core.order_manager import OrderManager
+        
+        strategy.client = MagicMock()
+        strategy.client.cancel_order = AsyncMock()
+        strategy.order_manager = OrderManager(strategy.client)
+        return strategy
+    
+    async def test_strategy_cancel_discards_entry(self, trader):
+        """A direct cancel drops the order from the open-order cache"""
+        trader.order_manager._open_orders['order1'] = {'status': 'open', 'price': 0.50}
+        
+        await trader._cancel_order('order1')
+        
+        trader.client.cancel_order.assert_awaited_once_with('order1')
+        assert trader.order_manager.get_open_order_sync('order1') is None
+    
+    async def test_failed_cancel_still_discards_entry(self, trader):
+        """The entry is dropped even when the cancel call raises"""
+        trader.order_manager._open_orders['order1'] = {'status': 'open', 'price': 0.50}
+        trader.client.cancel_order.side_effect = OrderExecutionError("gone")
+        
+        with pytest.raises(OrderExecutionError):
+            await trader._cancel_order('order1')
+        
+        assert trader.order_manager.get_open_order_sync('order1') is None
+    
+    async def test_order_without_id_not_tracked(self, trader):
+        """Responses without an orderID never land in the cache"""
+        trader.order_manager.validate_order = AsyncMock()
+        trader.client.create_limit_order = AsyncMock(return_value={'success': False})
+        
+        result = await trader.order_manager.execute_limit_order('token123456', 'BUY', 10.0, 0.50)
+        
+        assert result['order_id'] == 'unknown'
+        assert trader.order_manager._open_orders == {}
+
+
+class TestQuoteScheduler:
+    """Test suite for the debounced per-market quote loop"""
+    
+    async def test_burst_triggers_coalesce_into_one_update(self, strategy):
+        """Several triggers before the loop drains produce one _place_quotes call"""
+        calls = []
+        
+        async def fake_place_quotes(market_id):
+            calls.append(market_id)
+        
+        strategy._positions = {'market123': object()}
+        strategy._quote_dirty = {}
+        strategy._quote_tasks = {}
+        strategy._quote_placing = set()
+        strategy._last_order_time_by_mkt = {}
+        strategy._last_quote_update = {}
+        strategy._place_quotes = fake_place_quotes
+        
+        for _ in range(5):
+            strategy._schedule_quote_update('market123')
+        await asyncio.sleep(0.01)
+        
+        assert calls == ['market123']
+        assert 'market123' in strategy._last_quote_update
+        await strategy._stop_quote_loop('market123')
+        assert strategy._quote_tasks == {}
+    
+    async def test_stop_waits_for_in_flight_placement(self, strategy):
+        """Stopping mid-_place_quotes lets the placement finish instead of cancelling it"""
+        started = asyncio.Event()
+        release = asyncio.Event()
+        finished = []
+        
+        async def fake_place_quotes(market_id):
+            started.set()
+            await release.wait()
+            finished.append(market_id)
+        
+        strategy._positions = {'market123': object()}
+        strategy._quote_dirty = {}
+        strategy._quote_tasks = {}
+        strategy._quote_placing = set()
+        strategy._last_order_time_by_mkt = {}
+        strategy._last_quote_update = {}
+        strategy._place_quotes = fake_place_quotes
+        
+        strategy._schedule_quote_update('market123')
+        task = strategy._quote_tasks['market123']
+        await started.wait()
+        
+        stop = asyncio.create_task(strategy._stop_quote_loop('market123'))
+        await asyncio.sleep(0.01)
+        assert not stop.done()
+        
+        release.set()
+        await stop
+        
+        assert finished == ['market123']
+        assert task.done() and not task.cancelled()
+        assert strategy._quote_placing == set()
+    
+    async def test_inactive_market_starts_no_loop(self, strategy):
+        """Triggers for a market that is not an active position leave no state behind"""
+        strategy._positions = {}
+        strategy._quote_dirty = {}
+        strategy._quote_tasks = {}
+        
+        strategy._schedule_quote_update('market123')
+        
+        assert strategy._quote_dirty == {}
+        assert strategy._quote_tasks == {}
+
+
+class TestRoundPriceToTick:
+    """Test suite for _round_price_to_tick"""
+    
+    def test_bid_floors_and_ask_ceils(self, strategy):
+        """Bids round down, asks round up, dust is the rounding error"""
+        bid, bid_dust = strategy._round_price_to_tick(0.5127, 'BUY')
+        ask, _ = strategy._round_price_to_tick(0.5127, 'SELL')
+        
+        assert bid == pytest.approx(0.512)
+        assert ask == pytest.approx(0.513)
+        assert float(bid_dust) == pytest.approx(0.0007)
+    
+    def test_clamped_to_valid_range(self, strategy):
+        """Rounded prices stay within [0.001, 0.999]"""
+        assert strategy._round_price_to_tick(0.0004, 'BUY')[0] == pytest.approx(0.001)
+        assert strategy._round_price_to_tick(0.9995, 'SELL')[0] == pytest.approx(0.999)
+
+
+class TestToxicFlow:
+    """Test suite for MarketPosition fill window / check_toxic_flow"""
+    
+    def test_one_sided_volume_is_toxic(self):
+        """Large one-sided flow inside the window trips the detector"""
+        position = MarketPosition('market123', 'Question?', ['yes', 'no'])
+        for _ in range(3):
+            position.update_inventory('yes', 100, 0.50, is_buy=True)
+        
+        assert position.recent_fill_value == pytest.approx(150.0)
+        assert position.check_toxic_flow() is True
+    
+    def test_expired_fills_leave_window(self):
+        """Fills older than the window are dropped along with their totals"""
+        position = MarketPosition('market123', 'Question?', ['yes', 'no'])
+        position.update_inventory('yes', 200, 0.50, is_buy=True)
+        position._fill_times[0] -= position.toxic_flow_window + 1
+        
+        assert position.check_toxic_flow() is False
+        assert position.recent_fill_value == 0.0
+
+
+def _snapshot(asset_id, bid, ask, last_update):
+    return MarketSnapshot(
+        asset_id=asset_id, best_bid=bid, best_ask=ask, bid_size=100, ask_size=100,
+        mid_price=(bid + ask) / 2, micro_price=(bid + ask) / 2, obi=0.0,
+        last_update=last_update
+    )
+
+
+class TestGetMarketPrices:
+    """Test suite for _get_market_prices cache path"""
+    
+    async def test_batch_read_skips_stale_and_gapped(self, strategy):
+        """Fresh tight books are priced; stale and gapped tokens are skipped"""
+        now = time.time()
+        cache = MarketStateCache(stale_threshold_seconds=5.0)
+        cache.update('fresh', _snapshot('fresh', 0.49, 0.51, now))
+        cache.update('old', _snapshot('old', 0.49, 0.51, now - 60))
+        cache.update('gapped', _snapshot('gapped', 0.10, 0.90, now))
+        
+        strategy._market_data_manager = MagicMock()
+        strategy._market_data_manager.get_snapshots_batch = cache.get_many
+        strategy._oracle_enabled = False
+        strategy._oracle_prices = {}
+        
+        prices = await strategy._get_market_prices('market123', ['fresh', 'old', 'gapped', 'missing'])
+        
+        assert prices == {'fresh': pytest.approx(0.50)}
+    
+    async def test_oracle_band_rejects_deviating_tokens(self, strategy):
+        """Tokens whose micro-price leaves the oracle band are skipped"""
+        now = time.time()
+        cache = MarketStateCache(stale_threshold_seconds=5.0)
+        cache.update('near', _snapshot('near', 0.49, 0.51, now))
+        cache.update('far', _snapshot('far', 0.19, 0.21, now))
+        
+        strategy._market_data_manager = MagicMock()
+        strategy._market_data_manager.get_snapshots_batch = cache.get_many
+        strategy._oracle_enabled = True
+        strategy._oracle_prices = {'market123': 0.50}
+        
+        prices = await strategy._get_market_prices('market123', ['near', 'far'])
+        
+        assert set(prices) == {'near'}
+        
+        strategy._oracle_prices = {'market123': 0.0}
+        assert await strategy._get_market_prices('market123', ['near', 'far']) == {}
+    
+    async def test_only_cache_misses_fall_back_to_rest(self, strategy):
+        """Tokens after a cache miss are still served from the cache"""
+        strategy._market_data_manager = MagicMock()
+        strategy._market_data_manager.get_snapshots_batch.return_value = (
+            {'cached': _snapshot('cached', 0.49, 0.51, time.time())}, set()
+        )
+        strategy._oracle_enabled = False
+        strategy._oracle_prices = {}
+        strategy._get_prices_rest = AsyncMock(return_value={'missing': 0.30})
+        
+        prices = await strategy._get_market_prices('market123', ['missing', 'cached'])
+        
+        strategy._get_prices_rest.assert_awaited_once_with(['missing'])
+        assert prices == {'cached': pytest.approx(0.50), 'missing': 0.30}
+    
+    async def test_rest_fallback_fetches_books_concurrently(self, strategy):
+        """Without a cache every token's book is requested in one gather"""
+        in_flight = []
+        peak = []
+        
+        async def get_order_book(token_id):
+            in_flight.append(token_id)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(token_id)
+            return MagicMock(
+                bids=[{'price': '0.49', 'size': '100'}],
+                asks=[{'price': '0.51', 'size': '100'}]
+            )
+        
+        strategy._market_data_manager = None
+        strategy._oracle_enabled = False
+        strategy._oracle_prices = {}
+        strategy.client = MagicMock()
+        strategy.client.get_order_book = get_order_book
+        
+        prices = await strategy._get_market_prices('market123', ['a', 'b', 'c'])
+        
+        assert set(prices) == {'a', 'b', 'c'}
+        assert max(peak) == 3
+    
+    def test_swept_stale_flag_clears_on_update(self):
+        """Sweeper flags old assets; a fresh update clears the flag"""
+        now = time.time()
+        cache = MarketStateCache(stale_threshold_seconds=5.0)
+        cache.update('asset', _snapshot('asset', 0.49, 0.51, now - 60))
+        
+        cache.sweep_stale()
+        assert cache.get_many(['asset'])[1] == {'asset'}
+        
+        cache.update('asset', _snapshot('asset', 0.49, 0.51, time.time()))
+        assert cache.get_many(['asset'])[1] == set()
+
+
+class TestBinaryInventoryCache:
+    """Test suite for MarketPosition binary inventory cache"""
+    
+    def test_cache_tracks_fills_and_sets(self):
+        """Yes/No attributes follow buys, sells and direct sets"""
+        position = MarketPosition('market123', 'Question?', ['yes', 'no'])
+        position.update_inventory('yes', 30, 0.40, is_buy=True)
+        position.update_inventory('yes', 10, 0.45, is_buy=False)
+        position.set_inventory('no', 5)
+        
+        assert (position._inv0, position._inv1) == (20, 5)
+        assert position.inventory == {'yes': 20, 'no': 5}
+        assert position.get_net_inventory() == 15
+    
+    def test_remove_active_order_keeps_other_quotes(self):
+        """Filled order leaves tracking; the same dicts are mutated in place"""
+        position = MarketPosition('market123', 'Question?', ['yes', 'no'])
+        position.active_bids = {'yes': 'bid1', 'no': 'bid2'}
+        position.active_asks = {'yes': 'ask1'}
+        bids = position.active_bids
+        
+        position.remove_active_order('bid1')
+        
+        assert bids is position.active_bids
+        assert position.active_bids == {'no': 'bid2'}
+        assert position.active_asks == {'yes': 'ask1'}
+    
+    def test_dust_folds_whole_ticks_into_price(self):
+        """Rounding dust accumulates per side until it adds up to one tick"""
+        from decimal import Decimal
+        position = MarketPosition('market123', 'Question?', ['yes', 'no'])
+        dust = position._accumulated_dust_bid
+        
+        price = position.compensate_dust(dust, 'yes', 0.500, Decimal('0.0006'), 'BID')
+        assert price == 0.500 and dust['yes'] == Decimal('0.0006')
+        
+        price = position.compensate_dust(dust, 'yes', 0.500, Decimal('0.0006'), 'BID')
+        assert price == pytest.approx(0.501)
+        assert dust['yes'] == Decimal('0.0002')
+        assert position._dust_compensation_count == 1
+
+
+class TestRiskLimits:
+    """Test suite for _check_risk_limits"""
+    
+    @pytest.fixture
+    def risk_strategy(self, strategy):
+        strategy._exit_inventory = AsyncMock()
+        strategy._close_position = AsyncMock()
+        return strategy
+    
+    async def test_hedged_binary_position_is_left_alone(self, risk_strategy):
+        """Balanced Yes/No inventory triggers no unwinding"""
+        position = MarketPosition('market123', 'Question?', ['yes', 'no'])
+        position.set_inventory('yes', 50)
+        position.set_inventory('no', 48)
+        risk_strategy._positions = {'market123': position}
+        risk_strategy._get_market_prices = AsyncMock(return_value={'yes': 0.5, 'no': 0.5})
+        
+        await risk_strategy._check_risk_limits()
+        
+        risk_strategy._exit_inventory.assert_not_awaited()
+    
+    async def test_adverse_move_unwinds_net_imbalance(self, risk_strategy):
+        """A large drop on the net-long token unwinds only the imbalance"""
+        position = MarketPosition('market123', 'Question?', ['yes', 'no'])
+        position.update_inventory('yes', 20, 0.50, is_buy=True)
+        position.set_inventory('no', 5)
+        risk_strategy._positions = {'market123': position}
+        risk_strategy._get_market_prices = AsyncMock(return_value={'yes': 0.40, 'no': 0.5})
+        
+        await risk_strategy._check_risk_limits()
+        
+        risk_strategy._close_position.assert_not_awaited()
+        risk_strategy._exit_inventory.assert_awaited_once()
+        assert risk_strategy._exit_inventory.await_args.args == ('market123', 'yes', 15)
+    
+    async def test_stale_positions_share_one_clock_read(self, risk_strategy):
+        """Every unwind in one risk cycle receives the same monotonic timestamp"""
+        positions = {}
+        for market_id in ('market1', 'market2'):
+            position = MarketPosition(market_id, 'Question?', ['a', 'b', 'c'])
+            position.set_inventory('a', 10)
+            position.entry_time -= 10 ** 6
+            positions[market_id] = position
+        risk_strategy._positions = positions
+        risk_strategy._get_market_prices = AsyncMock(return_value={'a': 0.5, 'b': 0.3, 'c': 0.2})
+        
+        await risk_strategy._check_risk_limits()
+        
+        stamps = {call.kwargs['now'] for call in risk_strategy._exit_inventory.await_args_list}
+        assert risk_strategy._exit_inventory.await_count == 2
+        assert len(stamps) == 1
+    
+    async def test_failing_cycles_still_run_risk_checks(self, strategy, monkeypatch):
+        """A cycle error backs off no longer than the healthy cadence and still checks risk"""
+        from src.strategies import market_making_strategy as mm
+        
+        sleeps = []
+        
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            if len(sleeps) == 4:
+                strategy._is_running = False
+        
+        monkeypatch.setattr(mm.asyncio, 'sleep', fake_sleep)
+        strategy._is_running = False
+        strategy._positions_rehydrated = True
+        strategy._check_global_drawdown = AsyncMock(return_value=True)
+        for step in ('_update_eligible_markets', '_manage_positions', '_sync_fills',
+                     '_check_markout_pnl', '_shutdown'):
+            setattr(strategy, step, AsyncMock())
+        strategy._update_quotes = AsyncMock(side_effect=RuntimeError("api down"))
+        strategy._check_risk_limits = AsyncMock()
+        
+        await strategy.run()
+        
+        assert strategy._check_risk_limits.await_count == 4
+        assert sleeps == [10, 20, mm.MM_POSITION_CHECK_INTERVAL, mm.MM_POSITION_CHECK_INTERVAL]
+
+
+class TestExitInventory:
+    """Test suite for passive unwinding"""
+    
+    @pytest.fixture
+    def position(self, strategy):
+        position = MarketPosition('market123', 'Question?', ['yes', 'no'])
+        position.set_inventory('yes', 20)
+        strategy._positions = {'market123': position}
+        strategy._unwinding_in_flight = set()
+        strategy._get_market_prices = AsyncMock(return_value={'yes': 0.50})
+        return position
+    
+    async def test_unwind_reconciles_both_sides_concurrently(self, strategy, position):
+        """BUY and SELL reconcile overlap; a failing side keeps the other's order"""
+        in_flight = []
+        peak = []
+        
+        async def reconcile(token_id, side, *args):
+            in_flight.append(side)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(side)
+            if side == 'BUY':
+                raise OrderExecutionError("rejected")
+            return 'ask-1'
+        
+        strategy._reconcile_order = reconcile
+        
+        await strategy._exit_inventory('market123', 'yes', 20, now=time.monotonic())
+        
+        assert max(peak) == 2
+        assert position.active_asks == {'yes': 'ask-1'}
+        assert position.active_bids == {}
+    
+    async def test_concurrent_unwind_of_same_token_is_skipped(self, strategy, position):
+        """A second call while one is in flight returns without quoting"""
+        release = asyncio.Event()
+        
+        async def reconcile(*args):
+            await release.wait()
+            return None
+        
+        strategy._reconcile_order = AsyncMock(side_effect=reconcile)
+        
+        first = asyncio.create_task(strategy._exit_inventory('market123', 'yes', 20))
+        await asyncio.sleep(0)
+        await strategy._exit_inventory('market123', 'yes', 20)
+        release.set()
+        await first
+        
+        assert strategy._reconcile_order.await_count == 2  # One BUY + one SELL
+        assert strategy._unwinding_in_flight == set()
+
+
+class TestCancelAllQuotes:
+    """Test suite for the LAG CIRCUIT BREAKER cancel-all"""
+    
+    async def test_cancels_overlap_and_tracking_clears(self, strategy, monkeypatch):
+        """Cancels run concurrently up to the cap; one failure does not stop the rest"""
+        monkeypatch.setattr(
+            'src.strategies.market_making_strategy.MM_MAX_CONCURRENT_CANCELS', 2
+        )
+        positions = {}
+        for market_id in ('m1', 'm2'):
+            position = MarketPosition(market_id, 'Question?', ['yes', 'no'])
+            position.active_bids = {'yes': f'{market_id}-bid'}
+            position.active_asks = {'yes': f'{market_id}-ask'}
+            positions[market_id] = position
+        strategy._positions = positions
+        
+        in_flight = []
+        peak = []
+        
+        async def cancel_order(order_id):
+            in_flight.append(order_id)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(order_id)
+            if order_id == 'm2-ask':
+                raise OrderExecutionError("already filled")
+        
+        strategy.client = MagicMock()
+        strategy.client.cancel_order = cancel_order
+        
+        await strategy._cancel_all_quotes()
+        
+        assert max(peak) == 2
+        assert all(not p.active_bids and not p.active_asks for p in positions.values())
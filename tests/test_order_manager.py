@@ -0,0 +1,127 @@
+"""
+Unit Tests for OrderManager market-order path
+
+Covers the checks and reads that run before a market order is sent:
+- Price-independent preconditions (fail fast, no network call)
+- Best-price source (WebSocket cache first, REST on a miss)
+- Order status lookups (always live, never the placement cache)
+"""
+
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from core.market_data_manager import MarketStateCache, MarketSnapshot
+from core.order_manager import OrderManager
+from utils.exceptions import OrderRejectionError, ValidationError
+
+
+@pytest.fixture
+def order_manager():
+    """OrderManager over an offline client whose price lookup is observable"""
+    client = MagicMock()
+    client.get_best_price = AsyncMock(return_value=0.50)
+    return OrderManager(client)
+
+
+class TestMarketOrderPreconditions:
+    """Test suite for _check_market_order_preconditions"""
+    
+    @pytest.mark.parametrize('side, size', [('HOLD', 10.0), ('BUY', 0), ('SELL', -5.0)])
+    async def test_invalid_order_raises_validation_error(self, order_manager, side, size):
+        """Bad side/size fail with the same type validate_order uses, before any lookup"""
+        with pytest.raises(ValidationError):
+            await order_manager.execute_market_order('token123456', side, size)
+        
+        order_manager.client.get_best_price.assert_not_awaited()
+    
+    async def test_circuit_breaker_raises_validation_error(self, order_manager):
+        """An open circuit breaker blocks the order locally"""
+        order_manager._circuit_breaker_active = True
+        
+        with pytest.raises(ValidationError):
+            await order_manager.execute_market_order('token123456', 'SELL', 10.0)
+        
+        order_manager.client.get_best_price.assert_not_awaited()
+    
+    async def test_small_market_buy_rejected(self, order_manager):
+        """Market BUYs below the exchange minimum are an exchange-style rejection"""
+        with pytest.raises(OrderRejectionError):
+            await order_manager.execute_market_order('token123456', 'BUY', 0.01)
+        
+        order_manager.client.get_best_price.assert_not_awaited()
+
+
+def _snapshot(asset_id, bid, ask, **kwargs):
+    return MarketSnapshot(
+        asset_id=asset_id, best_bid=bid, best_ask=ask, bid_size=100, ask_size=100,
+        mid_price=(bid + ask) / 2, micro_price=(bid + ask) / 2, obi=0.0,
+        last_update=time.time(), **kwargs
+    )
+
+
+class TestMarketOrderPriceSource:
+    """Test suite for the expected-price read in execute_market_order"""
+    
+    @pytest.fixture
+    def priced(self, order_manager):
+        """Order manager backed by a real book cache; validate_order stops the order"""
+        cache = MarketStateCache(stale_threshold_seconds=5.0)
+        order_manager.market_data_manager = MagicMock()
+        order_manager.market_data_manager.get_best_price = cache.get_best_price
+        order_manager.validate_order = AsyncMock(side_effect=ValidationError("stop"))
+        return order_manager, cache
+    
+    async def _expected_price(self, order_manager, side):
+        with pytest.raises(ValidationError):
+            await order_manager.execute_market_order('token123456', side, 10.0)
+        return order_manager.validate_order.await_args.kwargs['price']
+    
+    async def test_cache_hit_skips_rest(self, priced):
+        """A fresh cached book supplies the price without a REST round-trip"""
+        order_manager, cache = priced
+        cache.update('token123456', _snapshot('token123456', 0.48, 0.52))
+        
+        assert await self._expected_price(order_manager, 'BUY') == pytest.approx(0.52)
+        assert await self._expected_price(order_manager, 'SELL') == pytest.approx(0.48)
+        order_manager.client.get_best_price.assert_not_awaited()
+    
+    async def test_cache_miss_falls_back_to_rest(self, priced):
+        """An uncached asset is priced through the client"""
+        order_manager, _ = priced
+        
+        assert await self._expected_price(order_manager, 'BUY') == pytest.approx(0.50)
+        order_manager.client.get_best_price.assert_awaited_once_with('token123456', 'BUY')
+    
+    async def test_placeholder_snapshot_falls_back_to_rest(self, priced):
+        """A book-less snapshot built from one price_change is not trusted"""
+        order_manager, cache = priced
+        cache.update('token123456', _snapshot('token123456', 0.40, 0.45, dirty_cache=True))
+        
+        assert await self._expected_price(order_manager, 'BUY') == pytest.approx(0.50)
+        order_manager.client.get_best_price.assert_awaited_once_with('token123456', 'BUY')
+
+
+class TestGetOrder:
+    """Test suite for get_order"""
+    
+    async def test_cached_order_still_queries_exchange(self, order_manager):
+        """A tracked order's fill is reported from the API, not the placement cache"""
+        order_manager._open_orders['order1'] = {'status': 'open', 'price': 0.50}
+        order_manager.client.get_order = AsyncMock(
+            return_value={'status': 'filled', 'size_matched': '10', 'price': '0.50'}
+        )
+        
+        order = await order_manager.get_order('order1')
+        
+        assert order['status'] == 'filled'
+        order_manager.client.get_order.assert_awaited_once_with('order1')
+        assert order_manager.get_open_order_sync('order1') is None
+    
+    async def test_open_order_stays_tracked(self, order_manager):
+        """Orders still resting keep their cache entry for the sync fast path"""
+        order_manager._open_orders['order1'] = {'status': 'open', 'price': 0.50}
+        order_manager.client.get_order = AsyncMock(return_value={'status': 'open', 'price': '0.50'})
+        
+        await order_manager.get_order('order1')
+        
+        assert order_manager.get_open_order_sync('order1') is not None
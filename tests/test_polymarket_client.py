@@ -10,6 +10,15 @@ from core.polymarket_client import PolymarketClient
 from utils.exceptions import APIError, AuthenticationError
 
 
+@pytest.fixture
+def offline_client():
+    """Initialized client with no network access (no credentials, CLOB client mocked)"""
+    client = PolymarketClient()
+    client._is_initialized = True
+    client._client = Mock()
+    return client
+
+
 @pytest.mark.asyncio
 class TestPolymarketClient:
     """Test Polymarket client functionality"""
@@ -115,6 +124,220 @@ class TestPolymarketClient:
         assert mock_client._client is None
 
 
+@pytest.mark.asyncio
+class TestHttpSession:
+    """Test the shared pooled aiohttp session"""
+    
+    async def test_http_session_is_shared(self, offline_client):
+        """REST calls reuse one pooled session until close"""
+        session = offline_client.get_http_session()
+        
+        assert offline_client.get_http_session() is session
+        
+        await offline_client.close()
+        assert session.closed
+        
+        fresh = offline_client.get_http_session()
+        assert fresh is not session
+        await fresh.close()
+
+
+@pytest.mark.asyncio
+class TestPositionsCache:
+    """Test own-positions TTL cache"""
+    
+    async def test_concurrent_calls_share_one_fetch(self, offline_client):
+        """Concurrent callers coalesce into a single Data API request"""
+        import asyncio
+        
+        async def fetch(address):
+            await asyncio.sleep(0)
+            return [{'token_id': 'token_123', 'size': 10.0}]
+        
+        offline_client._fetch_positions = AsyncMock(side_effect=fetch)
+        
+        results = await asyncio.gather(*[offline_client.get_positions() for _ in range(3)])
+        
+        assert offline_client._fetch_positions.await_count == 1
+        assert all(r == results[0] for r in results)
+    
+    async def test_invalidation_and_errors_force_refetch(self, offline_client):
+        """Trades invalidate the cache; failed fetches are never cached"""
+        offline_client._fetch_positions = AsyncMock(side_effect=[None, [], []])
+        
+        assert await offline_client.get_positions() == []  # Error - not cached
+        await offline_client.get_positions()  # Cached
+        await offline_client.get_positions()
+        offline_client._invalidate_positions_cache()
+        await offline_client.get_positions()
+        
+        assert offline_client._fetch_positions.await_count == 3
+    
+    async def test_simplified_positions_token_filter(self, offline_client):
+        """token_ids narrows the map without a separate fetch"""
+        offline_client._fetch_positions = AsyncMock(return_value=[
+            {'condition_id': 'c1', 'token_id': 'a', 'size': 5.0},
+            {'condition_id': 'c2', 'token_id': 'b', 'size': 3.0},
+        ])
+        
+        filtered = await offline_client.get_simplified_positions(token_ids={'b'})
+        everything = await offline_client.get_simplified_positions()
+        
+        assert list(filtered) == ['c2_b']
+        assert set(everything) == {'c1_a', 'c2_b'}
+        assert offline_client._fetch_positions.await_count == 1
+
+
+@pytest.mark.asyncio
+class TestReadCaches:
+    """Test TTL caches for market metadata and order books"""
+    
+    async def test_market_metadata_is_cached(self, offline_client):
+        """Repeat metadata lookups reuse the first get_market result"""
+        offline_client._client.get_market.return_value = {'question': 'Q?'}
+        
+        first = await offline_client.get_market_metadata("cond1")
+        second = await offline_client.get_market_metadata("cond1")
+        
+        assert first == second == {'question': 'Q?'}
+        assert offline_client._client.get_market.call_count == 1
+    
+    async def test_order_book_micro_cache(self, offline_client):
+        """Back-to-back book reads share one fetch until the token is traded"""
+        offline_client._client.get_order_book.return_value = {'bids': [], 'asks': []}
+        
+        await offline_client.get_order_book("token_123")
+        await offline_client.get_order_book("token_123")
+        assert offline_client._client.get_order_book.call_count == 1
+        
+        offline_client._invalidate_order_book("token_123")
+        await offline_client.get_order_book("token_123")
+        assert offline_client._client.get_order_book.call_count == 2
+
+
+@pytest.mark.asyncio
+class TestSingleFlight:
+    """Test coalescing of concurrent identical reads"""
+    
+    async def test_concurrent_reads_share_one_request(self, offline_client):
+        """Same-key callers share a request; distinct keys do not"""
+        import asyncio
+        
+        calls = []
+        
+        async def fetch(key):
+            calls.append(key)
+            await asyncio.sleep(0)
+            return {'key': key}
+        
+        results = await asyncio.gather(
+            offline_client._single_flight("market_a", lambda: fetch("a")),
+            offline_client._single_flight("market_a", lambda: fetch("a")),
+            offline_client._single_flight("market_b", lambda: fetch("b")),
+        )
+        
+        assert calls == ["a", "b"]
+        assert results[0] is results[1]
+        assert offline_client._inflight == {}
+    
+    async def test_failure_propagates_and_is_not_kept(self, offline_client):
+        """Every waiter sees the error and the next call retries"""
+        import asyncio
+        
+        async def failing():
+            await asyncio.sleep(0)
+            raise APIError("boom")
+        
+        results = await asyncio.gather(
+            offline_client._single_flight("k", failing),
+            offline_client._single_flight("k", failing),
+            return_exceptions=True,
+        )
+        
+        assert all(isinstance(r, APIError) for r in results)
+        assert await offline_client._single_flight("k", AsyncMock(return_value=1)) == 1
+
+
+@pytest.mark.asyncio
+class TestMarketStatus:
+    """Test closed-market status lookups"""
+    
+    async def test_known_closed_market_skips_request(self, offline_client):
+        """Closed markets restored from state never hit the Gamma API"""
+        offline_client.get_http_session = Mock()
+        offline_client.add_known_closed_markets(['cond_closed'])
+        
+        assert await offline_client.is_market_closed('cond_closed') is True
+        assert offline_client.get_known_closed_markets() == ['cond_closed']
+        offline_client.get_http_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestLimitOrders:
+    """Test single limit order posting"""
+    
+    async def test_post_only_rejection_is_not_retried(self, offline_client):
+        """A post-only rejection surfaces after one post, without backoff retries"""
+        from py_clob_client.exceptions import PolyApiException
+        from utils.exceptions import PostOnlyOrderRejectedError
+        
+        offline_client.get_fee_rate_bps = AsyncMock(return_value=0)
+        offline_client._client.post_order = Mock(
+            side_effect=PolyApiException(error_msg="INVALID_POST_ONLY_ORDER: order crosses book")
+        )
+        
+        with pytest.raises(PostOnlyOrderRejectedError):
+            await offline_client.create_limit_order('token_123', 'BUY', 0.5, 10, post_only=True)
+        
+        assert offline_client._client.post_order.call_count == 1
+    
+    async def test_post_only_flag_reaches_post_order(self, offline_client):
+        """post_only is forwarded when the installed client supports it"""
+        import core.polymarket_client as client_module
+        
+        offline_client.get_fee_rate_bps = AsyncMock(return_value=0)
+        offline_client._client.post_order = Mock(return_value={'orderID': 'o1'})
+        
+        with patch.object(client_module, '_POST_ORDER_SUPPORTS_POST_ONLY', True):
+            await offline_client.create_limit_order('token_123', 'BUY', 0.5, 10, post_only=True)
+        
+        assert offline_client._client.post_order.call_args.kwargs == {'post_only': True}
+
+
+@pytest.mark.asyncio
+class TestBatchLimitOrders:
+    """Test single-POST batch order submission"""
+    
+    async def test_one_post_with_aligned_results(self, offline_client):
+        """Orders failing before POST are reported in place; the rest go in one call"""
+        from utils.exceptions import OrderExecutionError
+        
+        async def fee_rate(token_id):
+            if token_id == 'no_fee':
+                raise OrderExecutionError("fee rate unavailable")
+            return 0
+        
+        offline_client.get_fee_rate_bps = AsyncMock(side_effect=fee_rate)
+        offline_client._client.create_order = Mock(side_effect=lambda args: {'tokenID': args.token_id})
+        offline_client._client.post_orders = Mock(return_value=[
+            {'success': True, 'orderID': 'o1'},
+            {'success': True, 'orderID': 'o3'},
+        ])
+        
+        results = await offline_client.create_limit_orders_batch([
+            {'token_id': 't1', 'side': 'buy', 'price': 0.4, 'size': 10},
+            {'token_id': 'no_fee', 'side': 'buy', 'price': 0.4, 'size': 10},
+            {'token_id': 't3', 'side': 'sell', 'price': 0.6, 'size': 10},
+        ])
+        
+        assert offline_client._client.post_orders.call_count == 1
+        posted = offline_client._client.post_orders.call_args[0][0]
+        assert [a.order['tokenID'] for a in posted] == ['t1', 't3']
+        assert results[0]['orderID'] == 'o1'
+        assert results[1]['success'] is False
+        assert results[2]['orderID'] == 'o3'
+
+
 @pytest.mark.unit
 class TestClientRetry:
     """Test retry logic"""
@@ -0,0 +1,44 @@
+"""
+Unit Tests for RebateLogger
+
+Covers the background queue writer's shutdown path.
+"""
+
+import json
+import pytest
+from utils.rebate_logger import RebateLogger
+
+
+@pytest.fixture
+def rebate_logger(tmp_path):
+    """Enabled logger writing to a temporary file"""
+    rebate_logger = RebateLogger()
+    rebate_logger.enabled = True
+    rebate_logger.log_file = tmp_path / 'maker_rebates.jsonl'
+    return rebate_logger
+
+
+class TestRebateLoggerClose:
+    """Test suite for RebateLogger.close"""
+    
+    async def test_close_writes_queued_entries_and_stops_writer(self, rebate_logger):
+        """Entries queued right before shutdown reach the file and the writer task ends"""
+        for i in range(3):
+            await rebate_logger.log_maker_fill(
+                order_id=f'order{i}xxxx', token_id='token123456', side='BUY',
+                fill_amount=10.0, fill_price=0.50, fee_rate_bps=0
+            )
+        writer = rebate_logger._writer_task
+        
+        await rebate_logger.close()
+        
+        lines = rebate_logger.log_file.read_text().splitlines()
+        assert [json.loads(line)['order_id'] for line in lines] == ['order0xxxx', 'order1xxxx', 'order2xxxx']
+        assert writer.done()
+        assert rebate_logger._writer_task is None
+    
+    async def test_close_without_writer_is_noop(self, rebate_logger):
+        """Closing a logger that never logged does nothing"""
+        await rebate_logger.close()
+        
+        assert not rebate_logger.log_file.exists()